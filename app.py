@@ -5,7 +5,9 @@ FastAPI 백엔드 서버 (리팩토링 후)
 모든 비즈니스 로직과 DB 접근은 Service 계층에 위임합니다.
 
 사용법:
-    python app.py
+    python app.py                             # 단일 프로세스 (기본)
+    SEOULLOG_WORKERS=4 python app.py          # 멀티 워커 (비용 집계/검색 인덱스가 워커별로 분리됨)
+    gunicorn app:app -k uvicorn.workers.UvicornWorker -w $(nproc) --preload  # 운영
 
 API 엔드포인트:
     GET  /                              - main.html 제공
@@ -20,16 +22,22 @@ API 엔드포인트:
     GET  /health                        - 헬스 체크
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request, Depends
+from fastapi.responses import HTMLResponse, Response, FileResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import List, Dict, Optional
 import uvicorn
+import os
+import hashlib
+import logging
+import orjson
 from pathlib import Path
+from contextlib import asynccontextmanager
 
 # Repository
 from repositories.agenda_repository import AgendaRepository
 from repositories.chroma_repository import ChromaRepository
+from repositories.chroma_query_batcher import ChromaQueryBatcher
 
 # Service
 from services.agenda_service import AgendaService
@@ -45,6 +53,7 @@ from utils.cost_tracker import CostTracker
 
 # Chatbot
 from chatbot.router import router as chatbot_router
+from chatbot.retriever import get_retriever
 
 # ============================================================
 # Pydantic Models
@@ -52,12 +61,16 @@ from chatbot.router import router as chatbot_router
 
 class SearchRequest(BaseModel):
     """검색 요청 모델"""
+    model_config = ConfigDict(from_attributes=True)
+
     query: str
     n_results: Optional[int] = 5
 
 
 class SearchResult(BaseModel):
     """검색 결과 모델 (안건 단위)"""
+    model_config = ConfigDict(from_attributes=True)
+
     agenda_id: str
     title: str
     ai_summary: str
@@ -75,6 +88,8 @@ class SearchResult(BaseModel):
 
 class SearchResponse(BaseModel):
     """검색 응답 모델"""
+    model_config = ConfigDict(from_attributes=True)
+
     query: str
     total_results: int
     results: List[SearchResult]
@@ -82,6 +97,8 @@ class SearchResponse(BaseModel):
 
 class HotIssue(BaseModel):
     """핫이슈 모델"""
+    model_config = ConfigDict(from_attributes=True)
+
     rank: int
     title: str
     proposer: str
@@ -90,6 +107,8 @@ class HotIssue(BaseModel):
 
 class TopAgenda(BaseModel):
     """Top 안건 모델"""
+    model_config = ConfigDict(from_attributes=True)
+
     agenda_id: str
     title: str
     meeting_title: str
@@ -100,11 +119,118 @@ class TopAgenda(BaseModel):
     status: str
 
 
+# 리스트 응답 검증 + JSON 직렬화를 pydantic-core에서 한 번에 처리
+TOP_AGENDAS_ADAPTER = TypeAdapter(List[TopAgenda])
+
+
+# 에러 로그 (스택 트레이스 포함)
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# 의존성 초기화 (Repository → Service)
+# ============================================================
+
+# 비용 추적기 초기화 (전역)
+cost_tracker = CostTracker()
+
+
+def init_services(app: FastAPI):
+    """
+    Repository / 분석기 / Service 초기화 후 app.state에 저장
+
+    ChromaDB(SQLite) 연결과 OpenAI 클라이언트는 fork 이후에 생성해야 안전하므로
+    import 시점이 아닌 lifespan(워커 시작 시)에서 호출합니다.
+
+    Args:
+        app: FastAPI 앱
+    """
+    print("="*80)
+    print("SeoulLog 백엔드 서버 초기화")
+    print("="*80)
+
+    # Repository 초기화
+    print("\n📦 Repository 계층 초기화...")
+    chroma_repo = ChromaRepository()
+    agenda_repo = AgendaRepository()
+    print("✅ ChromaRepository, AgendaRepository 초기화 완료")
+
+    # 쿼리 분석기 초기화
+    print("\n🔍 쿼리 분석기 초기화...")
+    try:
+        analyzer = QueryAnalyzer()
+        print("✅ QueryAnalyzer (OpenAI) 초기화 성공")
+    except Exception as e:
+        print(f"⚠️ QueryAnalyzer (OpenAI) 초기화 실패: {e}")
+        print("   → SimpleQueryAnalyzer (규칙 기반) 사용")
+        analyzer = SimpleQueryAnalyzer()
+
+    # 메타데이터 검증기 초기화
+    print("\n🔎 메타데이터 검증기 초기화...")
+    try:
+        validator = MetadataValidator(
+            collection_name="seoul_council_meetings",
+            persist_directory="./data/chroma_db"
+        )
+        print("✅ MetadataValidator 초기화 성공")
+    except Exception as e:
+        print(f"⚠️ MetadataValidator 초기화 실패: {e}")
+        validator = None
+
+    # Service 초기화 (의존성 주입)
+    print("\n⚙️ Service 계층 초기화...")
+    app.state.chroma_repo = chroma_repo
+    app.state.agenda_repo = agenda_repo
+    app.state.query_batcher = ChromaQueryBatcher(chroma_repo)
+    app.state.search_service = AgendaSearchService(
+        chroma_repo=chroma_repo,
+        agenda_repo=agenda_repo,
+        analyzer=analyzer,
+        validator=validator,
+        cost_tracker=cost_tracker,
+        query_batcher=app.state.query_batcher
+    )
+    app.state.agenda_service = AgendaService(agenda_repo=agenda_repo)
+    print("✅ AgendaSearchService, AgendaService 초기화 완료")
+
+    # 챗봇 Retriever (retrieve_documents() 헬퍼와 같은 공유 인스턴스)
+    app.state.retriever = get_retriever()
+    print("✅ 챗봇 Retriever 초기화 완료")
+
+    print("\n" + "="*80)
+    print("✅ 서버 초기화 완료!")
+    print("="*80 + "\n")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명 주기 관리 (워커 시작 시 의존성 초기화, 종료 시 정리)
+    """
+    init_services(app)
+    yield
+    await app.state.query_batcher.close()
+
+
+def get_search_service(request: Request) -> AgendaSearchService:
+    """app.state의 AgendaSearchService 반환 (Depends용)"""
+    return request.app.state.search_service
+
+
+def get_agenda_service(request: Request) -> AgendaService:
+    """app.state의 AgendaService 반환 (Depends용)"""
+    return request.app.state.agenda_service
+
+
 # ============================================================
 # FastAPI App 초기화
 # ============================================================
 
-app = FastAPI(title="SeoulLog API")
+# JSON 응답은 orjson으로 인코딩 (라우터 포함 전체 엔드포인트 기본값)
+app = FastAPI(
+    title="SeoulLog API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # Chatbot 라우터 추가
 app.include_router(chatbot_router, prefix="/api", tags=["Chatbot"])
@@ -112,110 +238,158 @@ app.include_router(chatbot_router, prefix="/api", tags=["Chatbot"])
 # HTML 파일 경로
 HTML_DIR = Path("frontend")
 
-# 비용 추적기 초기화 (전역)
-cost_tracker = CostTracker()
+# HTML 페이지 목록 (라우트에서 사용하는 파일명, 확장자 제외)
+HTML_PAGES = ("main", "search", "chatbot", "details")
 
-# ============================================================
-# 의존성 초기화 (Repository → Service)
-# ============================================================
+# 개발 중 HTML 수정 사항을 바로 반영하려면 SEOULLOG_HTML_CACHE=0 으로 실행
+HTML_CACHE_ENABLED = os.getenv("SEOULLOG_HTML_CACHE", "1") != "0"
+
+
+def _load_html_cache() -> Dict[str, bytes]:
+    """
+    frontend 폴더의 HTML 파일을 한 번만 읽어 메모리에 캐싱
 
-print("="*80)
-print("SeoulLog 백엔드 서버 초기화")
-print("="*80)
-
-# Repository 초기화
-print("\n📦 Repository 계층 초기화...")
-chroma_repo = ChromaRepository()
-agenda_repo = AgendaRepository()
-print("✅ ChromaRepository, AgendaRepository 초기화 완료")
-
-# 쿼리 분석기 초기화
-print("\n🔍 쿼리 분석기 초기화...")
-try:
-    analyzer = QueryAnalyzer()
-    print("✅ QueryAnalyzer (OpenAI) 초기화 성공")
-except Exception as e:
-    print(f"⚠️ QueryAnalyzer (OpenAI) 초기화 실패: {e}")
-    print("   → SimpleQueryAnalyzer (규칙 기반) 사용")
-    analyzer = SimpleQueryAnalyzer()
-
-# 메타데이터 검증기 초기화
-print("\n🔎 메타데이터 검증기 초기화...")
-try:
-    validator = MetadataValidator(
-        collection_name="seoul_council_meetings",
-        persist_directory="./data/chroma_db"
+    Returns:
+        {페이지 이름: HTML 바이트} (파일이 없는 페이지는 제외)
+    """
+    cache = {}
+    for name in HTML_PAGES:
+        html_path = HTML_DIR / f"{name}.html"
+        if html_path.exists():
+            cache[name] = html_path.read_bytes()
+    return cache
+
+
+HTML_CACHE: Dict[str, bytes] = _load_html_cache() if HTML_CACHE_ENABLED else {}
+
+# 브라우저 재검증용 Cache-Control (HTML은 매번 ETag로 재검증, 변경 없으면 304)
+# 프론트엔드 배포 직후에도 오래된 페이지를 쓰지 않도록 max-age 대신 no-cache 사용
+HTML_CACHE_CONTROL = "no-cache"
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    본문 바이트로 strong ETag 생성
+
+    Args:
+        body: 응답 본문
+
+    Returns:
+        따옴표로 감싼 ETag 문자열
+    """
+    return '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+
+HTML_ETAGS: Dict[str, str] = {name: compute_etag(body) for name, body in HTML_CACHE.items()}
+
+
+async def html_response(name: str, request: Request) -> Response:
+    """
+    HTML 페이지 응답 생성
+
+    - 캐시된 페이지: 메모리의 바이트를 반환 (If-None-Match 일치 시 304)
+    - 캐시가 꺼진 경우: FileResponse로 파일을 직접 전송
+      (sendfile 사용, ETag/Last-Modified 헤더 자동 생성)
+
+    Args:
+        name: 페이지 이름 (예: "main")
+        request: 요청 객체 (If-None-Match 헤더 확인용)
+
+    Returns:
+        HTMLResponse, FileResponse 또는 304 Response
+
+    Raises:
+        HTTPException: 파일이 없는 경우 404
+    """
+    if name in HTML_CACHE:
+        etag = HTML_ETAGS[name]
+        headers = {"ETag": etag, "Cache-Control": HTML_CACHE_CONTROL}
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
+        return HTMLResponse(content=HTML_CACHE[name], headers=headers)
+
+    html_path = HTML_DIR / f"{name}.html"
+    if not html_path.exists():
+        raise HTTPException(status_code=404, detail=f"{name}.html not found")
+
+    return FileResponse(
+        html_path,
+        media_type="text/html",
+        headers={"Cache-Control": HTML_CACHE_CONTROL}
     )
-    print("✅ MetadataValidator 초기화 성공")
-except Exception as e:
-    print(f"⚠️ MetadataValidator 초기화 실패: {e}")
-    validator = None
-
-# Service 초기화 (의존성 주입)
-print("\n⚙️ Service 계층 초기화...")
-search_service = AgendaSearchService(
-    chroma_repo=chroma_repo,
-    agenda_repo=agenda_repo,
-    analyzer=analyzer,
-    validator=validator,
-    cost_tracker=cost_tracker
-)
-agenda_service = AgendaService(agenda_repo=agenda_repo)
-print("✅ AgendaSearchService, AgendaService 초기화 완료")
 
-print("\n" + "="*80)
-print("✅ 서버 초기화 완료!")
-print("="*80 + "\n")
 
+# 핫이슈 임시 데이터 (고정값이므로 시작 시 한 번만 검증/직렬화)
+HOT_ISSUES = [
+    HotIssue(
+        rank=1,
+        title="청년안심주택 공급 확대 조례안",
+        proposer="김서울 의원",
+        status="심사 중"
+    ),
+    HotIssue(
+        rank=2,
+        title="역세권 청년주택 관련 개정안",
+        proposer="박시민 의원",
+        status="통과"
+    ),
+    HotIssue(
+        rank=3,
+        title="서울시 청년주거 기본 조례 일부개정조례안",
+        proposer="이나라 의원",
+        status="계류"
+    ),
+    HotIssue(
+        rank=4,
+        title="공공자전거 '따릉이' 운영 효율화 방안",
+        proposer="최교통 의원",
+        status="심사 중"
+    ),
+    HotIssue(
+        rank=5,
+        title="반려동물 친화도시 조성을 위한 조례안",
+        proposer="김애견 의원",
+        status="통과"
+    )
+]
+HOT_ISSUES_JSON: bytes = orjson.dumps([issue.model_dump() for issue in HOT_ISSUES])
+HOT_ISSUES_ETAG = compute_etag(HOT_ISSUES_JSON)
 
 # ============================================================
 # 라우트 정의
 # ============================================================
 
 @app.get("/", response_class=HTMLResponse)
-async def get_main_page():
+async def get_main_page(request: Request):
     """
     메인 페이지 (main.html) 반환
     """
-    main_html_path = HTML_DIR / "main.html"
-
-    if not main_html_path.exists():
-        raise HTTPException(status_code=404, detail="main.html not found")
-
-    with open(main_html_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return await html_response("main", request)
 
 
 @app.get("/search", response_class=HTMLResponse)
-async def get_search_page():
+async def get_search_page(request: Request):
     """
     검색 결과 페이지 (search.html) 반환
     """
-    search_html_path = HTML_DIR / "search.html"
-
-    if not search_html_path.exists():
-        raise HTTPException(status_code=404, detail="search.html not found")
-
-    with open(search_html_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return await html_response("search", request)
 
 
 @app.get("/chat", response_class=HTMLResponse)
-async def get_chat_page():
+async def get_chat_page(request: Request):
     """
     챗봇 페이지 (chatbot.html) 반환
     """
-    chat_html_path = HTML_DIR / "chatbot.html"
-
-    if not chat_html_path.exists():
-        raise HTTPException(status_code=404, detail="chatbot.html not found")
+    return await html_response("chatbot", request)
 
-    with open(chat_html_path, 'r', encoding='utf-8') as f:
-        return f.read()
 
-
-@app.post("/api/search", response_model=SearchResponse)
-async def search(request: SearchRequest):
+@app.post("/api/search", response_model=None, responses={200: {"model": SearchResponse}})
+async def search(
+    request: SearchRequest,
+    search_service: AgendaSearchService = Depends(get_search_service)
+):
     """
     안건 단위 검색
 
@@ -234,84 +408,63 @@ async def search(request: SearchRequest):
             n_results=request.n_results or 5
         )
 
-        return SearchResponse(
-            query=request.query,
-            total_results=len(results),
-            results=results
+        # Service가 SearchResult 구조의 dict를 반환하므로 재검증 없이 바로 직렬화
+        return Response(
+            content=orjson.dumps({
+                "query": request.query,
+                "total_results": len(results),
+                "results": results
+            }),
+            media_type="application/json"
         )
 
     except Exception as e:
-        print(f"❌ 검색 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ 검색 중 오류 발생: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/hot-issues", response_model=List[HotIssue])
-async def get_hot_issues():
+@app.get("/api/hot-issues", responses={200: {"model": List[HotIssue]}})
+async def get_hot_issues(request: Request):
     """
     핫이슈 top 5 조회
 
     현재는 임시 데이터를 반환합니다.
+    시작 시 한 번 직렬화한 JSON 바이트를 그대로 반환합니다.
     TODO: 실제로는 ChromaDB에서 인기 안건을 조회해야 함
 
     Returns:
         핫이슈 리스트
     """
-    hot_issues = [
-        HotIssue(
-            rank=1,
-            title="청년안심주택 공급 확대 조례안",
-            proposer="김서울 의원",
-            status="심사 중"
-        ),
-        HotIssue(
-            rank=2,
-            title="역세권 청년주택 관련 개정안",
-            proposer="박시민 의원",
-            status="통과"
-        ),
-        HotIssue(
-            rank=3,
-            title="서울시 청년주거 기본 조례 일부개정조례안",
-            proposer="이나라 의원",
-            status="계류"
-        ),
-        HotIssue(
-            rank=4,
-            title="공공자전거 '따릉이' 운영 효율화 방안",
-            proposer="최교통 의원",
-            status="심사 중"
-        ),
-        HotIssue(
-            rank=5,
-            title="반려동물 친화도시 조성을 위한 조례안",
-            proposer="김애견 의원",
-            status="통과"
-        )
-    ]
+    headers = {"ETag": HOT_ISSUES_ETAG, "Cache-Control": "public, max-age=3600"}
 
-    return hot_issues
+    if request.headers.get("if-none-match") == HOT_ISSUES_ETAG:
+        return Response(status_code=304, headers=headers)
 
+    return Response(content=HOT_ISSUES_JSON, media_type="application/json", headers=headers)
 
-@app.get("/api/top-agendas", response_model=List[TopAgenda])
-async def get_top_agendas():
+
+@app.get("/api/top-agendas", responses={200: {"model": List[TopAgenda]}})
+async def get_top_agendas(
+    agenda_service: AgendaService = Depends(get_agenda_service)
+):
     """
     Top 5 안건 조회 (논의가 활발했던 최신 안건)
 
-    Service 계층에 완전히 위임합니다.
+    Service 계층에 완전히 위임합니다. (Service에서 60초간 캐싱)
 
     Returns:
         Top 5 안건 리스트
     """
     try:
         agendas = await agenda_service.get_top_agendas(limit=5)
-        return agendas
+        return Response(
+            content=TOP_AGENDAS_ADAPTER.dump_json(TOP_AGENDAS_ADAPTER.validate_python(agendas)),
+            media_type="application/json",
+            headers={"Cache-Control": f"public, max-age={AgendaService.TOP_AGENDAS_TTL}"}
+        )
 
     except Exception as e:
-        print(f"❌ Top 안건 조회 중 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Top 안건 조회 중 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -320,6 +473,8 @@ async def get_cost_summary():
     """
     누적 API 비용 요약 조회
 
+    멀티 워커(SEOULLOG_WORKERS > 1)로 실행하면 요청을 받은 워커 프로세스의 집계만 반환합니다.
+
     Returns:
         비용 요약 딕셔너리
     """
@@ -338,21 +493,18 @@ async def get_cost_summary():
 
 
 @app.get("/details", response_class=HTMLResponse)
-async def get_details_page():
+async def get_details_page(request: Request):
     """
     안건 상세 페이지 (details.html) 반환
     """
-    details_html_path = HTML_DIR / "details.html"
-
-    if not details_html_path.exists():
-        raise HTTPException(status_code=404, detail="details.html not found")
-
-    with open(details_html_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return await html_response("details", request)
 
 
 @app.get("/api/agenda/{agenda_id}")
-async def get_agenda_detail(agenda_id: str):
+async def get_agenda_detail(
+    agenda_id: str,
+    agenda_service: AgendaService = Depends(get_agenda_service)
+):
     """
     안건 상세 정보 조회
 
@@ -372,14 +524,15 @@ async def get_agenda_detail(agenda_id: str):
         # 안건을 찾을 수 없는 경우
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        print(f"❌ 안건 상세 조회 중 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ 안건 상세 조회 중 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/agenda/{agenda_id}/formatted-detail")
-async def get_formatted_agenda_detail(agenda_id: str):
+async def get_formatted_agenda_detail(
+    agenda_id: str,
+    agenda_service: AgendaService = Depends(get_agenda_service)
+):
     """
     안건 상세 페이지용 포맷된 텍스트 생성
 
@@ -400,9 +553,7 @@ async def get_formatted_agenda_detail(agenda_id: str):
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        print(f"❌ 포맷된 안건 상세 조회 중 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ 포맷된 안건 상세 조회 중 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -420,17 +571,18 @@ async def health_check():
 
 if __name__ == "__main__":
     import socket
+    import sys
 
-    # 로컬 IP 주소 가져오기
+    # 로컬 IP 주소 가져오기 (로그 출력용이므로 실패해도 서버 시작에 영향 없음)
     def get_local_ip():
         try:
-            # 외부 연결을 시도해서 로컬 IP 확인
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
-            return local_ip
-        except:
+            # UDP 소켓 connect는 패킷을 보내지 않고 라우팅 테이블만 조회
+            # (오프라인 환경에서 대기하지 않도록 타임아웃 0.2초)
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.settimeout(0.2)
+                s.connect(("8.8.8.8", 80))
+                return s.getsockname()[0]
+        except OSError:
             return "IP를 가져올 수 없음"
 
     local_ip = get_local_ip()
@@ -456,8 +608,22 @@ if __name__ == "__main__":
     print("=" * 80)
     print()
 
+    # 워커 수 (기본: 1, SEOULLOG_WORKERS로 늘릴 수 있음)
+    # 워커마다 cost_tracker와 검색 인덱스(DenseIndex)를 따로 가지므로
+    # /api/cost-summary는 요청을 받은 워커의 집계만 보여주고 메모리는 워커 수만큼 늘어남
+    workers = int(os.getenv("SEOULLOG_WORKERS", "1"))
+
+    # uvloop는 Windows를 지원하지 않으므로 asyncio로 대체
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+
     try:
-        uvicorn.run(app, host="0.0.0.0", port=8000)
+        if workers > 1:
+            # 멀티 워커는 import 문자열로 앱을 지정해야 함
+            # (각 워커가 별도 프로세스이므로 Ctrl+C 시 비용 요약은 워커별로 집계되지 않음)
+            uvicorn.run("app:app", host="0.0.0.0", port=8000,
+                        loop=loop, http="httptools", workers=workers)
+        else:
+            uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop, http="httptools")
     except KeyboardInterrupt:
         print("\n\n" + "=" * 80)
         print("🛑 서버 종료 중...")
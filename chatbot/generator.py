@@ -1,28 +1,16 @@
-import os
-from openai import OpenAI
-from dotenv import load_dotenv
-from typing import List, Dict
+import asyncio
+from typing import List, Dict, AsyncIterator
 
-# .env 파일에서 환경 변수 로드
-load_dotenv()
+# 공용 비동기 OpenAI 클라이언트 (커넥션 풀 공유)
+from chatbot.openai_client import client
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+NO_DOCUMENTS_ANSWER = "관련 정보를 찾을 수 없습니다. 다른 질문을 시도해 주세요."
+ERROR_ANSWER = "답변을 생성하는 중에 오류가 발생했습니다."
 
-def generate_answer(query: str, documents: List[Dict]) -> str:
+def _build_messages(query: str, documents: List[Dict]) -> List[Dict]:
     """
-    검색된 문서를 바탕으로 사용자의 질문에 대한 답변을 생성합니다.
-
-    Args:
-        query: 사용자의 질문 (재작성된 쿼리)
-        documents: Retriever가 검색한 문서 리스트
-
-    Returns:
-        LLM이 생성한 최종 답변
+    검색된 문서와 질문으로 LLM 메시지 목록을 구성합니다.
     """
-    if not documents:
-        return "관련 정보를 찾을 수 없습니다. 다른 질문을 시도해 주세요."
-
     # 검색된 문서 내용을 컨텍스트로 조합
     context = "\n\n---\n\n".join([doc['text'] for doc in documents])
 
@@ -38,15 +26,31 @@ def generate_answer(query: str, documents: List[Dict]) -> str:
 # 답변
 """
 
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+async def generate_answer(query: str, documents: List[Dict]) -> str:
+    """
+    검색된 문서를 바탕으로 사용자의 질문에 대한 답변을 생성합니다.
+
+    Args:
+        query: 사용자의 질문 (재작성된 쿼리)
+        documents: Retriever가 검색한 문서 리스트
+
+    Returns:
+        LLM이 생성한 최종 답변
+    """
+    if not documents:
+        return NO_DOCUMENTS_ANSWER
+
     print(f"💬 답변 생성 중... (query: {query})")
 
     try:
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=_build_messages(query, documents),
             temperature=0.3,
             max_tokens=1000
         )
@@ -55,7 +59,40 @@ def generate_answer(query: str, documents: List[Dict]) -> str:
         return answer
     except Exception as e:
         print(f"❌ 답변 생성 중 오류 발생: {e}")
-        return "답변을 생성하는 중에 오류가 발생했습니다."
+        return ERROR_ANSWER
+
+async def generate_answer_stream(query: str, documents: List[Dict]) -> AsyncIterator[str]:
+    """
+    generate_answer()의 스트리밍 버전. 생성되는 답변 조각을 순서대로 반환합니다.
+
+    Args:
+        query: 사용자의 질문 (재작성된 쿼리)
+        documents: Retriever가 검색한 문서 리스트
+
+    Yields:
+        LLM이 생성한 답변 텍스트 조각
+    """
+    if not documents:
+        yield NO_DOCUMENTS_ANSWER
+        return
+
+    print(f"💬 답변 스트리밍 중... (query: {query})")
+
+    try:
+        stream = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=_build_messages(query, documents),
+            temperature=0.3,
+            max_tokens=1000,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+        print(f"   -> 답변 스트리밍 완료")
+    except Exception as e:
+        print(f"❌ 답변 생성 중 오류 발생: {e}")
+        yield ERROR_ANSWER
 
 if __name__ == '__main__':
     # 테스트용 코드
@@ -74,6 +111,6 @@ if __name__ == '__main__':
     ]
 
     print(f"\n--- Generator 테스트 (query: '{test_query}') ---")
-    final_answer = generate_answer(test_query, test_documents)
+    final_answer = asyncio.run(generate_answer(test_query, test_documents))
     print("\n[최종 생성 답변]")
     print(final_answer)
@@ -0,0 +1,16 @@
+import os
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from dotenv import load_dotenv
+
+# .env 파일에서 환경 변수 로드
+load_dotenv()
+
+# 챗봇 공용 OpenAI 클라이언트
+# query_rewriter / generator가 같은 커넥션 풀을 공유하여 TLS 연결을 재사용합니다.
+client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+)
@@ -1,14 +1,14 @@
-import os
-from openai import OpenAI
-from dotenv import load_dotenv
+import asyncio
+from collections import OrderedDict
 
-# .env 파일에서 환경 변수 로드
-load_dotenv()
+# 공용 비동기 OpenAI 클라이언트 (커넥션 풀 공유)
+from chatbot.openai_client import client
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# 재작성 결과 캐시 (같은 질문 + 대화 기록이면 API를 다시 호출하지 않음)
+REWRITE_CACHE_SIZE = 1024
+_rewrite_cache: OrderedDict = OrderedDict()
 
-def rewrite_query(question: str, history: list[tuple[str, str]]) -> str:
+async def rewrite_query(question: str, history: list[tuple[str, str]]) -> str:
     """
     대화 기록을 바탕으로 후속 질문을 독립적인 질문으로 재작성합니다.
 
@@ -22,6 +22,11 @@ def rewrite_query(question: str, history: list[tuple[str, str]]) -> str:
     if not history:
         return question
 
+    cache_key = (question, tuple(tuple(turn) for turn in history))
+    if cache_key in _rewrite_cache:
+        _rewrite_cache.move_to_end(cache_key)
+        return _rewrite_cache[cache_key]
+
     # 대화 기록을 문자열로 변환
     formatted_history = "\n".join([f"사용자: {q}\nAI: {a}" for q, a in history])
 
@@ -37,7 +42,7 @@ def rewrite_query(question: str, history: list[tuple[str, str]]) -> str:
 # 재작성된 질문:"""
 
     try:
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "당신은 사용자의 질문을 명확하게 재구성하는 AI 어시스턴트입니다."},
@@ -48,6 +53,12 @@ def rewrite_query(question: str, history: list[tuple[str, str]]) -> str:
         )
         rewritten_question = response.choices[0].message.content.strip()
         print(f"Rewritten query: {rewritten_question}")
+
+        # 성공한 결과만 캐싱 (가장 오래 사용되지 않은 항목부터 제거)
+        _rewrite_cache[cache_key] = rewritten_question
+        if len(_rewrite_cache) > REWRITE_CACHE_SIZE:
+            _rewrite_cache.popitem(last=False)
+
         return rewritten_question
     except Exception as e:
         print(f"Error rewriting query: {e}")
@@ -61,7 +72,7 @@ if __name__ == '__main__':
     ]
     follow_up_question = "그 조례안은 누가 발의했어?"
 
-    rewritten = rewrite_query(follow_up_question, sample_history)
+    rewritten = asyncio.run(rewrite_query(follow_up_question, sample_history))
     
     print("\n--- 쿼리 재작성 테스트 ---")
     print(f"원본 질문: {follow_up_question}")
@@ -1,14 +1,102 @@
 from utils.search_chromadb import MeetingSearcher
-from typing import List, Dict
+from typing import List, Dict, Optional
+from functools import lru_cache
+import numpy as np
+
+class DenseIndex:
+    """
+    ChromaDB 컬렉션의 임베딩을 메모리에 올려두고 NumPy 행렬곱으로 top-k를 찾는 인덱스
+
+    챗봇 규모(수만 청크)에서는 ChromaDB 쿼리 왕복보다
+    (N, d) @ (d,) 한 번의 BLAS 연산이 더 빠릅니다.
+    """
+    def __init__(self, embeddings: np.ndarray, documents: List[str], metadatas: List[Dict]):
+        """
+        DenseIndex 초기화
+
+        Args:
+            embeddings: (N, d) 임베딩 행렬
+            documents: 청크 텍스트 리스트 (N개)
+            metadatas: 청크 메타데이터 리스트 (N개)
+        """
+        # 코사인 유사도를 내적으로 계산하기 위해 행 단위 정규화
+        # (NumPy는 float16 행렬곱에 BLAS를 쓰지 않으므로 float32 유지)
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.embeddings = embeddings / norms
+        self.documents = documents
+        self.metadatas = metadatas
+
+    @classmethod
+    def from_collection(cls, collection) -> "DenseIndex":
+        """
+        ChromaDB 컬렉션 전체를 읽어 인덱스 생성
+
+        Args:
+            collection: ChromaDB 컬렉션
+
+        Returns:
+            DenseIndex 인스턴스
+        """
+        data = collection.get(include=["embeddings", "documents", "metadatas"])
+        return cls(data["embeddings"], data["documents"], data["metadatas"])
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query_embedding: List[float], n_results: int = 5) -> List[Dict]:
+        """
+        쿼리 임베딩과 가장 가까운 청크 검색
+
+        Args:
+            query_embedding: 쿼리 임베딩 벡터
+            n_results: 반환할 결과 수
+
+        Returns:
+            [{"text", "similarity", "metadata"}] (유사도 내림차순)
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm > 0:
+            query = query / query_norm
+
+        scores = self.embeddings @ query
+
+        k = min(n_results, len(scores))
+        if k == 0:
+            return []
+
+        top_idx = np.argpartition(-scores, k - 1)[:k]
+        top_idx = top_idx[np.argsort(-scores[top_idx])]
+
+        # MeetingSearcher와 같은 기준: cosine distance(0~2) → similarity(0~1)
+        return [
+            {
+                "text": self.documents[i],
+                "similarity": float(max(0.0, min(1.0, (1 + scores[i]) / 2))),
+                "metadata": self.metadatas[i] or {}
+            }
+            for i in top_idx
+        ]
 
 class Retriever:
     """
     ChromaDB에서 관련 문서를 검색하는 클래스
     """
-    def __init__(self, collection_name: str = "seoul_council_meetings", persist_directory: str = "./data/chroma_db"):
+    def __init__(
+        self,
+        collection_name: str = "seoul_council_meetings",
+        persist_directory: str = "./data/chroma_db",
+        use_dense_index: bool = True
+    ):
         """
         Retriever 초기화
+
+        use_dense_index가 True이면 컬렉션 임베딩을 메모리에 올려 NumPy로 검색하고,
+        로드에 실패하면 ChromaDB 쿼리로 대체합니다.
         """
+        self.dense_index: Optional[DenseIndex] = None
         try:
             self.searcher = MeetingSearcher(
                 collection_name=collection_name,
@@ -19,6 +107,14 @@ class Retriever:
             print(f"❌ Retriever 초기화 실패: {e}")
             self.searcher = None
 
+        if self.searcher and use_dense_index:
+            try:
+                self.dense_index = DenseIndex.from_collection(self.searcher.collection)
+                print(f"✅ 메모리 벡터 인덱스 로드 완료 ({len(self.dense_index)}개 청크)")
+            except Exception as e:
+                print(f"⚠️ 메모리 벡터 인덱스 로드 실패, ChromaDB 검색 사용: {e}")
+                self.dense_index = None
+
     def retrieve_documents(self, query: str, n_results: int = 5) -> List[Dict]:
         """
         주어진 쿼리로 문서를 검색하고, 텍스트 내용을 반환합니다.
@@ -34,7 +130,21 @@ class Retriever:
             return []
 
         print(f"🔍 문서 검색 중... (query: {query})")
-        
+
+        # 메모리 인덱스가 있으면 쿼리 임베딩 1회 + 행렬곱으로 검색
+        if self.dense_index is not None and len(self.dense_index) > 0:
+            query_embedding = self.searcher.embedding_function([query])[0]
+            documents = [
+                {
+                    "text": hit["text"] or "",
+                    "similarity": hit["similarity"],
+                    "source": hit["metadata"].get("agenda", "N/A")
+                }
+                for hit in self.dense_index.search(query_embedding, n_results)
+            ]
+            print(f"   -> {len(documents)}개 문서 검색 완료")
+            return documents
+
         # MeetingSearcher를 사용하여 간단한 텍스트 기반 검색 수행
         search_results = self.searcher.search(query=query, n_results=n_results)
 
@@ -53,12 +163,20 @@ class Retriever:
         print(f"   -> {len(documents)}개 문서 검색 완료")
         return documents
 
+@lru_cache(maxsize=1)
+def get_retriever() -> Retriever:
+    """
+    공유 Retriever 인스턴스 반환
+
+    최초 호출 시 한 번만 생성하고 (ChromaDB 클라이언트 로드 포함) 이후 재사용합니다.
+    """
+    return Retriever()
+
 def retrieve_documents(query: str, n_results: int = 5) -> List[Dict]:
     """
-    Retriever 인스턴스를 생성하고 문서를 검색하는 헬퍼 함수
+    공유 Retriever 인스턴스로 문서를 검색하는 헬퍼 함수
     """
-    retriever = Retriever()
-    return retriever.retrieve_documents(query, n_results)
+    return get_retriever().retrieve_documents(query, n_results)
 
 if __name__ == '__main__':
     # 테스트용 코드
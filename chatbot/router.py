@@ -1,13 +1,22 @@
-from fastapi import APIRouter
+import asyncio
+import orjson
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from chatbot.query_rewriter import rewrite_query
-from chatbot.retriever import Retriever  # Retriever 클래스를 직접 임포트
-from chatbot.generator import generate_answer
+from chatbot.retriever import Retriever
+from chatbot.generator import generate_answer, generate_answer_stream
 
-# --- Retriever 인스턴스 전역 생성 ---
-# 서버가 시작될 때 한 번만 실행되어 Retriever 객체를 생성하고 재사용합니다.
-retriever_instance = Retriever()
-# ------------------------------------
+
+def get_chat_retriever(request: Request) -> Retriever:
+    """
+    app.state의 공유 Retriever 반환 (Depends용)
+
+    ChromaDB 클라이언트와 임베딩 행렬을 fork 이후에 로드하도록
+    import 시점이 아닌 app.py의 lifespan(init_services)에서 생성합니다.
+    """
+    return request.app.state.retriever
 
 # 요청 본문을 위한 Pydantic 모델
 class ChatRequest(BaseModel):
@@ -18,23 +27,44 @@ class ChatRequest(BaseModel):
 # 챗봇 API 라우터 생성
 router = APIRouter()
 
-@router.post("/chat")
-async def handle_chat(request: ChatRequest):
+async def _rewrite_and_retrieve(request: ChatRequest, retriever: Retriever) -> tuple[str, list]:
     """
-    RAG 챗봇의 전체 파이프라인을 실행하는 엔드포인트입니다.
-    (쿼리 재구성 -> 문서 검색 -> 답변 생성)
+    쿼리 재구성 + 문서 검색 (채팅 / 스트리밍 채팅 공통)
+
+    Returns:
+        (재구성된 질문, 검색된 문서 리스트)
     """
     # 1. 프론트엔드에서 직접 받은 대화 기록을 사용
     history = request.history
     
-    # 2. 쿼리 재구성
-    rewritten_question = rewrite_query(request.message, history)
+    # 2~3. 쿼리 재구성 + 원본 질문으로 문서 선검색 (동시 실행)
+    # 대화 기록이 없으면 재구성 결과가 원본과 같으므로 선검색 결과를 그대로 사용
+    rewrite_task = asyncio.create_task(rewrite_query(request.message, history))
+    prefetch_task = asyncio.create_task(run_in_threadpool(
+        retriever.retrieve_documents, request.message, n_results=3
+    ))
+    rewritten_question, prefetched_docs = await asyncio.gather(rewrite_task, prefetch_task)
+
+    # 3. 재구성된 질문이 원본과 다르면 다시 검색 (공유 retriever 사용)
+    if rewritten_question == request.message:
+        retrieved_docs = prefetched_docs
+    else:
+        retrieved_docs = await run_in_threadpool(
+            retriever.retrieve_documents, rewritten_question, n_results=3
+        )
 
-    # 3. 문서 검색 (미리 생성된 retriever_instance 사용)
-    retrieved_docs = retriever_instance.retrieve(rewritten_question, n_results=3)
+    return rewritten_question, retrieved_docs
+
+@router.post("/chat")
+async def handle_chat(request: ChatRequest, retriever: Retriever = Depends(get_chat_retriever)):
+    """
+    RAG 챗봇의 전체 파이프라인을 실행하는 엔드포인트입니다.
+    (쿼리 재구성 -> 문서 검색 -> 답변 생성)
+    """
+    rewritten_question, retrieved_docs = await _rewrite_and_retrieve(request, retriever)
 
     # 4. 답변 생성
-    final_answer = generate_answer(rewritten_question, retrieved_docs)
+    final_answer = await generate_answer(rewritten_question, retrieved_docs)
 
     # 최종 답변 및 중간 결과 반환 (디버깅용)
     return {
@@ -45,3 +75,25 @@ async def handle_chat(request: ChatRequest):
             "retrieved_documents": retrieved_docs
         }
     }
+
+@router.post("/chat/stream")
+async def handle_chat_stream(request: ChatRequest, retriever: Retriever = Depends(get_chat_retriever)):
+    """
+    /chat과 같은 파이프라인을 실행하되, 답변을 Server-Sent Events로 스트리밍합니다.
+
+    이벤트 형식:
+        data: {"delta": "답변 조각"}
+        event: done / data: {"rewritten_question": ...}
+    """
+    rewritten_question, retrieved_docs = await _rewrite_and_retrieve(request, retriever)
+
+    async def event_stream():
+        async for delta in generate_answer_stream(rewritten_question, retrieved_docs):
+            yield b"data: " + orjson.dumps({"delta": delta}) + b"\n\n"
+        yield b"event: done\ndata: " + orjson.dumps({"rewritten_question": rewritten_question}) + b"\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
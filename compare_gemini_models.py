@@ -6,7 +6,8 @@ Gemini Pro vs Flash 비교 스크립트 (1회용)
 """
 
 import os
-import json
+import asyncio
+import orjson
 from pathlib import Path
 from dotenv import load_dotenv
 import sys
@@ -14,44 +15,28 @@ import sys
 # 프로젝트 루트를 Python path에 추가
 sys.path.insert(0, str(Path(__file__).parent))
 
-from data_processing.extract_metadata_hybrid import extract_metadata_hybrid, extract_metadata_hybrid_flash
+from data_processing.extract_metadata_hybrid import (
+    _find_line_overlaps,
+    extract_metadata_hybrid,
+    extract_metadata_hybrid_flash,
+)
 
 load_dotenv()
 
 
-def compare_models(md_file_path: str):
+def run_pro(md_file: Path, api_key: str, output_dir: Path):
     """
-    같은 파일을 Pro와 Flash로 각각 파싱하여 비교
+    Gemini Pro로 파싱 후 결과 저장
 
     Args:
-        md_file_path: 테스트할 md 파일 경로
-    """
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        print("❌ GOOGLE_API_KEY가 설정되지 않았습니다.")
-        return
-
-    # 출력 폴더 생성
-    output_base = Path("test_gemini")
-    output_base.mkdir(exist_ok=True)
-
-    pro_dir = output_base / "result_pro"
-    flash_dir = output_base / "result_flash"
+        md_file: 테스트할 md 파일
+        api_key: Google API 키
+        output_dir: 결과 저장 폴더
 
-    pro_dir.mkdir(exist_ok=True)
-    flash_dir.mkdir(exist_ok=True)
-
-    md_file = Path(md_file_path)
-    file_name = md_file.stem
-
-    print("=" * 100)
-    print(f"📄 파일: {md_file.name}")
-    print("=" * 100)
-    print()
-
-    # 1. Gemini Pro로 파싱
+    Returns:
+        파싱 결과 딕셔너리 (실패 시 None)
+    """
     print("🤖 Gemini Pro 파싱 시작...")
-    print("-" * 100)
     try:
         pro_result = extract_metadata_hybrid(
             txt_path=str(md_file),
@@ -61,26 +46,34 @@ def compare_models(md_file_path: str):
         )
 
         # Pro 결과 저장
-        pro_output = pro_dir / f"{file_name}.json"
-        with open(pro_output, 'w', encoding='utf-8') as f:
-            json.dump(pro_result, f, ensure_ascii=False, indent=2)
+        pro_output = output_dir / f"{md_file.stem}.json"
+        with open(pro_output, 'wb') as f:
+            f.write(orjson.dumps(pro_result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         print(f"✅ Pro 완료: {len(pro_result['agenda_mapping'])}개 안건, {len(pro_result['chunks'])}개 청크")
         print(f"   저장: {pro_output}")
+        return pro_result
 
     except Exception as e:
         print(f"❌ Pro 실패: {e}")
         import traceback
         traceback.print_exc()
-        pro_result = None
+        return None
 
-    print()
-    print("=" * 100)
-    print()
 
-    # 2. Gemini Flash로 파싱
+def run_flash(md_file: Path, api_key: str, output_dir: Path):
+    """
+    Gemini Flash로 파싱 후 결과 저장
+
+    Args:
+        md_file: 테스트할 md 파일
+        api_key: Google API 키
+        output_dir: 결과 저장 폴더
+
+    Returns:
+        파싱 결과 딕셔너리 (실패 시 None)
+    """
     print("⚡ Gemini Flash 파싱 시작...")
-    print("-" * 100)
     try:
         flash_result = extract_metadata_hybrid_flash(
             txt_path=str(md_file),
@@ -89,18 +82,61 @@ def compare_models(md_file_path: str):
         )
 
         # Flash 결과 저장
-        flash_output = flash_dir / f"{file_name}.json"
-        with open(flash_output, 'w', encoding='utf-8') as f:
-            json.dump(flash_result, f, ensure_ascii=False, indent=2)
+        flash_output = output_dir / f"{md_file.stem}.json"
+        with open(flash_output, 'wb') as f:
+            f.write(orjson.dumps(flash_result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         print(f"✅ Flash 완료: {len(flash_result['agenda_mapping'])}개 안건, {len(flash_result['chunks'])}개 청크")
         print(f"   저장: {flash_output}")
+        return flash_result
 
     except Exception as e:
         print(f"❌ Flash 실패: {e}")
         import traceback
         traceback.print_exc()
-        flash_result = None
+        return None
+
+
+async def compare_models(md_file_path: str):
+    """
+    같은 파일을 Pro와 Flash로 각각 파싱하여 비교
+
+    두 모델은 서로 독립적인 API 호출이므로 스레드에서 동시에 실행합니다.
+    (진행 로그는 두 모델이 섞여서 출력될 수 있음)
+
+    Args:
+        md_file_path: 테스트할 md 파일 경로
+    """
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        print("❌ GOOGLE_API_KEY가 설정되지 않았습니다.")
+        return
+
+    # 출력 폴더 생성
+    output_base = Path("test_gemini")
+    output_base.mkdir(exist_ok=True)
+
+    pro_dir = output_base / "result_pro"
+    flash_dir = output_base / "result_flash"
+
+    pro_dir.mkdir(exist_ok=True)
+    flash_dir.mkdir(exist_ok=True)
+
+    md_file = Path(md_file_path)
+    file_name = md_file.stem
+
+    print("=" * 100)
+    print(f"📄 파일: {md_file.name}")
+    print("=" * 100)
+    print()
+
+    # 1~2. Gemini Pro / Flash 동시 파싱
+    print("🚀 Gemini Pro + Flash 동시 파싱 시작...")
+    print("-" * 100)
+    pro_result, flash_result = await asyncio.gather(
+        asyncio.to_thread(run_pro, md_file, api_key, pro_dir),
+        asyncio.to_thread(run_flash, md_file, api_key, flash_dir)
+    )
 
     print()
     print("=" * 100)
@@ -162,29 +198,12 @@ def compare_models(md_file_path: str):
         print(f"\n⚠️  중복 line range 체크:")
 
         def check_overlaps(agendas, model_name):
-            overlaps = []
-            for i in range(len(agendas)):
-                for j in range(i + 1, len(agendas)):
-                    start1 = agendas[i].get('line_start', 0)
-                    end1 = agendas[i].get('line_end', 0)
-                    start2 = agendas[j].get('line_start', 0)
-                    end2 = agendas[j].get('line_end', 0)
-
-                    overlap_start = max(start1, start2)
-                    overlap_end = min(end1, end2)
-                    overlap = max(0, overlap_end - overlap_start)
-
-                    if overlap > 5:
-                        overlaps.append({
-                            'agenda1': agendas[i]['agenda_title'][:40],
-                            'agenda2': agendas[j]['agenda_title'][:40],
-                            'overlap': overlap
-                        })
+            overlaps = _find_line_overlaps(agendas)
 
             if overlaps:
                 print(f"   {model_name}: {len(overlaps)}개 중복 발견")
                 for ov in overlaps[:3]:
-                    print(f"      - {ov['agenda1']} ↔ {ov['agenda2']} ({ov['overlap']}줄)")
+                    print(f"      - {ov['agenda1_title']} ↔ {ov['agenda2_title']} ({ov['overlap']}줄)")
             else:
                 print(f"   {model_name}: ✅ 중복 없음")
 
@@ -213,7 +232,7 @@ def main():
             print(f"❌ 파일을 찾을 수 없습니다: {md_file}")
             return
 
-        compare_models(files[0])
+        asyncio.run(compare_models(files[0]))
     else:
         # 기본 비교 파일 목록 (일괄상정, 본회의, 위원회 등 다양한 케이스)
         test_files = [
@@ -233,7 +252,7 @@ def main():
                 print(f"\n{'=' * 100}")
                 print(f"📁 파일 패턴: {pattern}")
                 print(f"{'=' * 100}\n")
-                compare_models(files[0])
+                asyncio.run(compare_models(files[0]))
                 print("\n" * 2)
             else:
                 print(f"⚠️  파일 없음: {pattern}")
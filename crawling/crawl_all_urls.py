@@ -1,141 +1,230 @@
 import requests
-from bs4 import BeautifulSoup, NavigableString
-import json
-import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import threading
+from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+import html as html_lib
+import orjson
+from pathlib import Path
 import re
+import sys
 from datetime import datetime
-import time
+
+# 프로젝트 루트를 path에 추가 (utils 모듈 import용)
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.rate_limiter import IntervalRateLimiter
+
+# aiohttp가 없으면 스레드풀 크롤러(crawl_all_threaded) 사용
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# zstandard가 없으면 JSON을 압축하지 않고 저장
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# JSON 압축 레벨 (3: 기본값, 속도/압축률 균형)
+ZSTD_LEVEL = 3
+
+# 서울시의회 회의록 사이트 (상대경로 링크의 기준 URL)
+BASE_URL = "https://ms.smc.seoul.kr"
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# 동시 요청 수 (서버 부하를 고려해 적게 유지)
+MAX_CONCURRENT_REQUESTS = 8
+MAX_CONNECTIONS_PER_HOST = 4
+
+# 같은 호스트에 요청을 시작하는 최소 간격 (초)
+# (기존: 연결 4개가 요청마다 2초씩 쉬던 것과 같은 최대 요청 빈도)
+MIN_REQUEST_INTERVAL = 2 / MAX_CONNECTIONS_PER_HOST
+
+# 본문(div#canvas) 서브트리만 파싱 (나머지 노드는 트리로 만들지 않음)
+CANVAS_STRAINER = SoupStrainer('div', id='canvas')
+
+# strainer가 <title>을 버리므로 제목은 원본 바이트에서 직접 추출
+_TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+# 결과 저장 루트 (실행 시 한 번만 절대경로로 해석)
+RESULT_ROOT = Path('result').resolve()
+
+# 폴더명에 사용할 수 없는 문자 (Windows 기준) 삭제 테이블
+_SANITIZE_TABLE = str.maketrans('', '', '\\/:*?"<>|')
+
+# 호스트별 요청 간격 제한 (키: 호스트)
+rate_limiter = IntervalRateLimiter(MIN_REQUEST_INTERVAL)
+
+# 동기 크롤링용 공유 세션 (keep-alive로 TCP/TLS 연결 재사용, 일시적 5xx 재시도)
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+))
+
+# 추출 요소 태그 (dict 대신 작은 튜플로 보관하여 메모리/조회 비용 절감)
+#   (TEXT, content) / (LINK, text, url) / (SEPARATOR, content)
+TEXT = 't'
+LINK = 'l'
+SEPARATOR = 's'
+
+def _is_attachment_url(url):
+    """참고자료 다운로드 링크(PDF/HWP 등)인지 확인"""
+    return "appendixDownload" in url or url.endswith(('.pdf', '.hwp', '.docx'))
 
 def extract_text_with_links(element):
     """
-    HTML 요소에서 텍스트와 링크를 순서대로 추출
-    반환: [{"type": "text", "content": "..."} 또는 {"type": "link", "text": "...", "url": "..."}]
+    HTML 요소에서 텍스트와 링크를 순서대로 추출하면서 참고자료 링크도 함께 수집
+    반환: (content, attachments)
+        content: [(TEXT, "...") 또는 (LINK, "링크 텍스트", "URL") 또는 (SEPARATOR, "---")]
+        attachments: [{"title": "문서명", "url": "다운로드 URL"}]
+
+    깊게 중첩된 태그도 재귀 호출 없이 명시적 스택(DFS)으로 순회합니다.
+    참고자료는 "(참고)" ~ "회의록 끝에 실음" 구간의 다운로드 링크로,
+    목록을 다시 훑지 않고 요소를 만드는 시점에 상태 머신으로 판별합니다.
     """
     result = []
+    attachments = []
+    in_reference = False
+    pending_links = []
+    stack = [iter(element.children)]
+
+    while stack:
+        try:
+            child = next(stack[-1])
+        except StopIteration:
+            stack.pop()
+            continue
 
-    for child in element.children:
         if isinstance(child, NavigableString):
             # 일반 텍스트
             text = str(child)
             if text:
-                result.append({
-                    "type": "text",
-                    "content": text
-                })
+                result.append((TEXT, text))
+
+                # (참고) 시작 감지
+                if "(참고)" in text:
+                    in_reference = True
+                    pending_links = []
+                # (회의록 끝에 실음) 감지 시 구간 종료
+                elif in_reference and "회의록 끝에 실음" in text:
+                    in_reference = False
+                    attachments.extend(pending_links)
+                    pending_links = []
         elif child.name == 'a':
             # 링크
             link_text = child.get_text()
             href = child.get('href', '')
 
-            # URL 완성
-            if href.startswith('/'):
-                full_url = f"https://ms.smc.seoul.kr{href}"
-            elif href.startswith('#'):
-                full_url = href  # 앵커는 나중에 base URL 추가
-            elif href.startswith('http'):
-                full_url = href
-            else:
-                full_url = href
-
-            result.append({
-                "type": "link",
-                "text": link_text,
-                "url": full_url
-            })
+            # URL 완성 (상대경로만 BASE_URL 추가, 앵커는 변환 시 페이지 URL 추가)
+            full_url = BASE_URL + href if href[:1] == '/' else href
+
+            result.append((LINK, link_text, full_url))
+
+            # (참고) 구간 내 PDF/HWP 다운로드 링크 수집
+            if in_reference and _is_attachment_url(full_url):
+                pending_links.append({
+                    "title": link_text.strip(),
+                    "url": full_url
+                })
         elif child.name == 'br':
             # 줄바꿈
-            result.append({
-                "type": "text",
-                "content": "\n"
-            })
+            result.append((TEXT, "\n"))
         elif child.name == 'hr':
             # 수평선
-            result.append({
-                "type": "separator",
-                "content": "---"
-            })
+            result.append((SEPARATOR, "---"))
         else:
-            # 다른 태그는 재귀적으로 처리
-            result.extend(extract_text_with_links(child))
+            # 다른 태그는 자식 노드를 스택에 올려 이어서 처리
+            stack.append(iter(child.children))
 
-    return result
+    return result, attachments
 
-def convert_to_markdown(content_list, base_url):
+def content_item_to_dict(item):
     """
-    구조화된 데이터를 마크다운으로 변환
+    추출 요소 튜플을 JSON 저장용 dict로 변환
+    (저장 형식은 {"type": "text" | "link" | "separator", ...} 유지)
     """
-    markdown = ""
-
-    for item in content_list:
-        if item["type"] == "text":
-            markdown += item["content"]
-        elif item["type"] == "link":
-            url = item["url"]
-            # 앵커 링크는 base URL 추가
-            if url.startswith('#'):
-                url = f"{base_url}{url}"
-            markdown += f"[{item['text']}]({url})"
-        elif item["type"] == "separator":
-            markdown += f"\n{item['content']}\n"
-
-    return markdown
-
-
-def extract_reference_materials(content_list):
+    tag = item[0]
+    if tag == TEXT:
+        return {"type": "text", "content": item[1]}
+    if tag == LINK:
+        return {"type": "link", "text": item[1], "url": item[2]}
+    return {"type": "separator", "content": item[1]}
+
+def convert_to_markdown_and_text(content_list, base_url):
     """
-    (참고) 섹션에서 참고자료 링크 추출
+    구조화된 데이터를 마크다운과 순수 텍스트로 한 번에 변환
 
     Returns:
-        [{"title": "문서명", "url": "다운로드 URL"}]
+        (마크다운, 순수 텍스트) - 순수 텍스트는 링크를 제거하고 텍스트만 남김
     """
-    attachments = []
-    in_reference = False
-    pending_links = []
-
-    for i, item in enumerate(content_list):
-        # (참고) 시작 감지
-        if item["type"] == "text" and "(참고)" in item["content"]:
-            in_reference = True
-            pending_links = []
-            continue
+    md_parts = []
+    txt_parts = []
 
-        # (회의록 끝에 실음) 감지 시 종료
-        if in_reference and item["type"] == "text" and "회의록 끝에 실음" in item["content"]:
-            in_reference = False
-            # pending_links를 attachments에 추가
-            attachments.extend(pending_links)
-            pending_links = []
-            continue
+    for item in content_list:
+        tag = item[0]
+        if tag == TEXT:
+            md_parts.append(item[1])
+            txt_parts.append(item[1])
+        elif tag == LINK:
+            _, link_text, url = item
+            # 앵커 링크는 base URL 추가
+            if url.startswith('#'):
+                url = base_url + url
+            md_parts.append(f"[{link_text}]({url})")
+            txt_parts.append(link_text)  # 링크는 텍스트만
+        elif tag == SEPARATOR:
+            separator = f"\n{item[1]}\n"  # 구분선 포함
+            md_parts.append(separator)
+            txt_parts.append(separator)
 
-        # (참고) 구간 내의 링크 수집
-        if in_reference and item["type"] == "link":
-            # PDF/HWP 다운로드 링크만 추출
-            if "appendixDownload" in item["url"] or item["url"].endswith(('.pdf', '.hwp', '.docx')):
-                pending_links.append({
-                    "title": item["text"].strip(),
-                    "url": item["url"]
-                })
+    return ''.join(md_parts), ''.join(txt_parts)
 
-    return attachments
 
 def crawl_meeting_record(url):
     """
-    회의록 크롤링: 텍스트 + 하이퍼링크 보존
+    회의록 크롤링 (단건): 다운로드 후 save_meeting_record()로 파싱/저장
     """
     try:
         print(f"크롤링 시작: {url}\n")
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=30)
-        response.encoding = 'utf-8'
+        response = SESSION.get(url, timeout=30)
 
         if response.status_code != 200:
             print(f"오류: HTTP {response.status_code}")
             return None
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+    except Exception as e:
+        print(f"에러 발생: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+    return save_meeting_record(url, response.content)
+
+def save_meeting_record(url, html):
+    """
+    다운로드한 회의록 HTML 파싱 후 JSON/MD/TXT 저장: 텍스트 + 하이퍼링크 보존
+
+    CPU 작업(파싱)과 파일 쓰기만 수행하므로 비동기 크롤러에서는 스레드풀에서 실행합니다.
+
+    Args:
+        url: 회의록 URL
+        html: 응답 본문 (bytes)
+    """
+    try:
+        soup = BeautifulSoup(html, 'lxml', parse_only=CANVAS_STRAINER, from_encoding='utf-8')
 
         # 메인 컨텐츠
         canvas = soup.find('div', id='canvas')
@@ -144,30 +233,34 @@ def crawl_meeting_record(url):
             return None
 
         # 제목
-        title = soup.title.string if soup.title else "제목 없음"
+        title_match = _TITLE_RE.search(html)
+        if title_match:
+            title = html_lib.unescape(title_match.group(1).decode('utf-8', errors='replace'))
+        else:
+            title = "제목 없음"
         title = ' '.join(title.split())
 
         print(f"제목: {title}")
         print("=" * 80)
 
         # 전체 내용 추출 (텍스트 + 링크)
-        content_with_links = extract_text_with_links(canvas)
+        content_with_links, attachments = extract_text_with_links(canvas)
 
         print(f"✓ 총 {len(content_with_links)}개의 요소 추출 완료")
 
         # 텍스트와 링크 개수 세기
-        text_count = sum(1 for item in content_with_links if item["type"] == "text")
-        link_count = sum(1 for item in content_with_links if item["type"] == "link")
+        type_counts = Counter(item[0] for item in content_with_links)
+        text_count = type_counts[TEXT]
+        link_count = type_counts[LINK]
 
         print(f"  - 텍스트 요소: {text_count}개")
         print(f"  - 링크 요소: {link_count}개")
         print()
 
-        # 마크다운으로 변환
-        markdown_content = convert_to_markdown(content_with_links, url)
+        # 마크다운 + 순수 텍스트 변환 (한 번의 순회)
+        markdown_content, plain_text = convert_to_markdown_and_text(content_with_links, url)
 
-        # 참고자료 링크 추출 ⭐ 추가
-        attachments = extract_reference_materials(content_with_links)
+        # 참고자료 링크 (본문 추출 시 함께 수집) ⭐ 추가
         print(f"  - 참고자료: {len(attachments)}개")
         if attachments:
             for att in attachments:
@@ -177,12 +270,11 @@ def crawl_meeting_record(url):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # 폴더명으로 사용할 제목 정리 (특수문자 제거)
-        folder_name = re.sub(r'[\\/:*?"<>|]', '', title)
-        folder_name = folder_name.strip()
+        folder_name = title.translate(_SANITIZE_TABLE).strip()
 
         # result/제목/ 폴더 생성
-        result_dir = os.path.join('result', folder_name)
-        os.makedirs(result_dir, exist_ok=True)
+        result_dir = RESULT_ROOT / folder_name
+        result_dir.mkdir(parents=True, exist_ok=True)  # 동시 실행에도 안전
 
         print(f"저장 경로: {result_dir}")
         print()
@@ -192,43 +284,44 @@ def crawl_meeting_record(url):
             "url": url,
             "title": title,
             "timestamp": timestamp,
-            "content": content_with_links,
+            "content": [content_item_to_dict(item) for item in content_with_links],
             "attachments": attachments  # ⭐ 추가
         }
 
-        json_filename = os.path.join(result_dir, f"meeting_{timestamp}.json")
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, ensure_ascii=False, indent=2)
+        # JSON은 가장 큰 산출물이고 후속 처리에서 읽지 않으므로 zstd로 압축 보관
+        # (MD/TXT는 data_processing에서 그대로 읽으므로 평문 유지)
+        json_bytes = orjson.dumps(json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        json_filename = result_dir / f"meeting_{timestamp}.json"
+        if zstandard is not None:
+            json_filename = json_filename.with_name(json_filename.name + ".zst")
+            # 압축기는 스레드 간 공유 불가 → 호출마다 생성
+            json_bytes = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(json_bytes)
+        json_filename.write_bytes(json_bytes)
 
         print(f"✓ JSON 저장: {json_filename}")
 
         # 2. 마크다운 저장
-        md_filename = os.path.join(result_dir, f"meeting_{timestamp}.md")
-        with open(md_filename, 'w', encoding='utf-8') as f:
-            f.write(f"# {title}\n\n")
-            f.write(f"**URL**: {url}\n\n")
-            f.write(f"**크롤링 시간**: {timestamp}\n\n")
-            f.write("---\n\n")
-            f.write(markdown_content)
+        md_filename = result_dir / f"meeting_{timestamp}.md"
+        md_payload = (
+            f"# {title}\n\n"
+            f"**URL**: {url}\n\n"
+            f"**크롤링 시간**: {timestamp}\n\n"
+            "---\n\n"
+            f"{markdown_content}"
+        ).encode('utf-8')
+        md_filename.write_bytes(md_payload)
 
         print(f"✓ 마크다운 저장: {md_filename}")
 
         # 3. 순수 텍스트 저장 (링크는 제거, 텍스트만)
-        plain_text = ""
-        for item in content_with_links:
-            if item["type"] == "text":
-                plain_text += item["content"]
-            elif item["type"] == "link":
-                plain_text += item["text"]  # 링크는 텍스트만
-            elif item["type"] == "separator":
-                plain_text += f"\n{item['content']}\n"  # 구분선 포함
-
-        txt_filename = os.path.join(result_dir, f"meeting_{timestamp}.txt")
-        with open(txt_filename, 'w', encoding='utf-8') as f:
-            f.write(f"제목: {title}\n")
-            f.write(f"URL: {url}\n")
-            f.write("=" * 80 + "\n\n")
-            f.write(plain_text)
+        txt_filename = result_dir / f"meeting_{timestamp}.txt"
+        txt_payload = (
+            f"제목: {title}\n"
+            f"URL: {url}\n"
+            f"{'=' * 80}\n\n"
+            f"{plain_text}"
+        ).encode('utf-8')
+        txt_filename.write_bytes(txt_payload)
 
         print(f"✓ 순수 텍스트 저장: {txt_filename}")
 
@@ -238,9 +331,9 @@ def crawl_meeting_record(url):
 
         return {
             "title": title,
-            "json_path": json_filename,
-            "md_path": md_filename,
-            "txt_path": txt_filename
+            "json_path": str(json_filename),
+            "md_path": str(md_filename),
+            "txt_path": str(txt_filename)
         }
 
     except Exception as e:
@@ -249,6 +342,111 @@ def crawl_meeting_record(url):
         traceback.print_exc()
         return None
 
+async def fetch_html(session, url, semaphore):
+    """
+    회의록 HTML 다운로드 (비동기)
+
+    Args:
+        session: aiohttp.ClientSession
+        url: 회의록 URL
+        semaphore: 동시 요청 수 제한용 세마포어
+
+    Returns:
+        응답 본문 (bytes) 또는 None
+    """
+    async with semaphore:
+        await rate_limiter.wait_async(urlparse(url).netloc)
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status != 200:
+                print(f"오류: HTTP {response.status} ({url})")
+                return None
+            html = await response.read()
+
+        return html
+
+async def crawl_all(urls):
+    """
+    여러 회의록을 동시에 크롤링
+
+    네트워크 다운로드는 aiohttp로 동시에 수행하고,
+    파싱/파일 저장(CPU, 블로킹 I/O)은 스레드풀에 넘깁니다.
+
+    Args:
+        urls: 회의록 URL 리스트
+
+    Returns:
+        성공한 크롤링 결과 리스트 (입력 순서 유지)
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONNECTIONS_PER_HOST)
+
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+
+        async def crawl_one(idx, url):
+            print(f"[{idx}/{len(urls)}] 크롤링 시작: {url}")
+            try:
+                html = await fetch_html(session, url, semaphore)
+            except Exception as e:
+                print(f"에러 발생 ({url}): {str(e)}")
+                return None
+
+            if html is None:
+                return None
+
+            return await loop.run_in_executor(None, save_meeting_record, url, html)
+
+        results = await asyncio.gather(
+            *(crawl_one(idx, url) for idx, url in enumerate(urls, 1))
+        )
+
+    return [result for result in results if result]
+
+# 호스트별 동시 요청 제한 (스레드풀 크롤러용)
+_host_semaphores = defaultdict(lambda: threading.Semaphore(MAX_CONNECTIONS_PER_HOST))
+_host_semaphores_lock = threading.Lock()
+
+def _get_host_semaphore(url):
+    """URL 호스트별 세마포어 반환"""
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        return _host_semaphores[host]
+
+def _crawl_with_host_limit(url):
+    """
+    호스트별 동시 요청 수를 제한하며 단건 크롤링 (스레드풀 작업 단위)
+    """
+    with _get_host_semaphore(url):
+        rate_limiter.wait(urlparse(url).netloc)
+        return crawl_meeting_record(url)
+
+def crawl_all_threaded(urls, max_workers=MAX_CONCURRENT_REQUESTS):
+    """
+    여러 회의록을 스레드풀로 동시에 크롤링 (aiohttp가 없을 때 사용)
+
+    Args:
+        urls: 회의록 URL 리스트
+        max_workers: 최대 스레드 수 (차단 방지를 위해 적게 유지)
+
+    Returns:
+        성공한 크롤링 결과 리스트 (입력 순서 유지)
+    """
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_crawl_with_host_limit, url): idx
+            for idx, url in enumerate(urls)
+        }
+
+        for done_count, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            print(f"[{done_count}/{len(urls)}] {'완료' if result else '실패'}")
+            if result:
+                results[futures[future]] = result
+
+    return [results[idx] for idx in sorted(results)]
+
 if __name__ == "__main__":
     # SESSION_332_URLS.txt 파일에서 URL 읽기
     url_file = "SESSION_332_URLS.txt"
@@ -263,22 +461,14 @@ if __name__ == "__main__":
 
     print("=" * 80)
     print("서울시의회 회의록 크롤링 시작")
-    print(f"총 {len(urls)}개 URL 크롤링")
+    print(f"총 {len(urls)}개 URL 크롤링 (동시 {MAX_CONCURRENT_REQUESTS}개)")
     print("=" * 80 + "\n")
 
-    results = []
-    for idx, url in enumerate(urls, 1):
-        print(f"\n[{idx}/{len(urls)}] 크롤링 중...")
-        print("-" * 80)
-
-        result = crawl_meeting_record(url)
-        if result:
-            results.append(result)
-
-        # 서버 부하를 줄이기 위해 2초 대기
-        if idx < len(urls):
-            print(f"다음 URL까지 2초 대기...\n")
-            time.sleep(2)
+    if aiohttp is not None:
+        results = asyncio.run(crawl_all(urls))
+    else:
+        print("aiohttp가 설치되어 있지 않아 스레드풀로 크롤링합니다.\n")
+        results = crawl_all_threaded(urls)
 
     # 최종 결과 요약
     print("\n" + "=" * 80)
@@ -6,7 +6,96 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
+
+# 트리 노드 펼침/lazy 로딩 대기 최대 시간 (초)
+EXPAND_TIMEOUT = 10
+
+# 링크 추출에 불필요한 리소스 (CDP로 요청 자체를 차단)
+BLOCKED_RESOURCE_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+]
+
+# 주어진 li 아래의 모든 폴더를 브라우저 안에서 재귀적으로 펼침.
+# Fancytree JS API가 있으면 lazy 로딩까지 Promise로 기다리고,
+# 없으면 펼쳐지지 않은 expander를 더 이상 없을 때까지 반복 클릭한다.
+# execute_script는 반환된 Promise가 끝날 때까지 대기하므로 왕복은 1회.
+EXPAND_ALL_JS = """
+const root = arguments[0];
+const jq = window.jQuery;
+if (jq && jq.ui && jq.ui.fancytree) {
+    const rootNode = jq.ui.fancytree.getNode(root);
+    let expanded = 0;
+    const expandAll = (node) => {
+        const pending = node.isExpanded() ? null : node.setExpanded(true);
+        if (pending) expanded++;
+        return jq.when(pending).then(() => jq.when.apply(jq,
+            (node.children || [])
+                .filter((c) => c.isFolder() || c.isLazy())
+                .map(expandAll)));
+    };
+    return new Promise((resolve) => {
+        jq.when(expandAll(rootNode)).always(() => resolve({expanded: expanded, mode: 'fancytree'}));
+    });
+}
+return new Promise((resolve) => {
+    let expanded = 0;
+    let idle = 0;
+    const step = () => {
+        const targets = root.querySelectorAll(
+            'span.fancytree-node.fancytree-has-children:not(.fancytree-expanded):not(.fancytree-loading) > span.fancytree-expander');
+        targets.forEach((el) => el.click());
+        expanded += targets.length;
+        // 클릭할 대상도, 로딩 중인 노드도 없는 상태가 연속되면 종료
+        const busy = targets.length || root.querySelector('.fancytree-loading');
+        idle = busy ? 0 : idle + 1;
+        if (idle >= 3) return resolve({expanded: expanded, mode: 'dom'});
+        setTimeout(step, 200);
+    };
+    step();
+});
+"""
+
+# 회의록 링크의 href와 텍스트를 한 번에 수집
+COLLECT_LINKS_JS = """
+const root = arguments[0] || document;
+return Array.from(root.querySelectorAll("a[href*='recordView.do']"),
+                  (a) => [a.href, a.textContent]);
+"""
+
+def is_expanded(li):
+    """
+    트리 노드(li)가 펼쳐져 있는지 확인
+
+    Fancytree는 expanded 상태 클래스를 li가 아닌 span.fancytree-node에 붙인다.
+
+    Args:
+        li: 트리 노드 li 요소
+
+    Returns:
+        펼쳐져 있으면 True
+    """
+    node_span = li.find_element(By.CSS_SELECTOR, ":scope > span.fancytree-node")
+    return "fancytree-expanded" in node_span.get_attribute("class")
+
+
+def expand_and_wait(driver, li, timeout=EXPAND_TIMEOUT):
+    """
+    트리 노드의 expander를 클릭하고 하위 노드가 나타날 때까지 대기
+
+    고정 sleep 대신 DOM 변화를 기다리므로 lazy 로딩이 끝나는 즉시 반환한다.
+
+    Args:
+        driver: WebDriver
+        li: 펼칠 트리 노드 li 요소
+        timeout: 최대 대기 시간 (초)
+    """
+    expander = li.find_element(By.CSS_SELECTOR, ":scope > span.fancytree-node > span.fancytree-expander")
+    # CSS 차단 시 빈 expander span은 크기가 0이라 네이티브 click이 불가 → JS click
+    driver.execute_script("arguments[0].click();", expander)
+    # lazy 노드는 서버 응답 후 ul > li가 채워지므로 자식 존재까지 대기
+    WebDriverWait(driver, timeout).until(lambda d: li.find_elements(By.XPATH, "./ul/li"))
+
 
 def extract_session_332_links():
     """제332회 임시회의 모든 회의록 링크 추출"""
@@ -17,7 +106,9 @@ def extract_session_332_links():
 
     # Chrome 옵션 설정
     chrome_options = Options()
-    # chrome_options.add_argument('--headless')  # 브라우저 창 숨기기 (필요시 주석 해제)
+    chrome_options.add_argument('--headless=new')  # 브라우저 창 숨기기 (DOM 추출만 하므로 렌더링 불필요)
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
@@ -26,15 +117,16 @@ def extract_session_332_links():
     print("Chrome 브라우저 시작 중...")
     driver = webdriver.Chrome(options=chrome_options)
 
+    # 이미지/폰트/CSS 요청 차단 (트리 동작에 필요한 JS와 XHR만 허용)
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_URLS})
+    driver.execute_cdp_cmd("Network.enable", {})
+
     try:
         # 페이지 로드
         url = "https://ms.smc.seoul.kr/kr/assembly/session.do"
         print(f"페이지 로딩: {url}\n")
         driver.get(url)
 
-        # 페이지 로딩 대기
-        time.sleep(3)
-
         print("제11대 트리 펼치기 중...")
         # 제11대 트리 노드 찾아서 클릭
         try:
@@ -45,17 +137,14 @@ def extract_session_332_links():
 
             if th11_node:
                 # 스크롤해서 보이게 하기
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", th11_node)
-                time.sleep(1)
+                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", th11_node)
 
                 # 제11대 앞의 expander 클릭
                 parent_li = th11_node.find_element(By.XPATH, "./ancestor::li[1]")
 
                 # 이미 펼쳐져 있는지 확인
-                if "fancytree-expanded" not in parent_li.get_attribute("class"):
-                    expander = parent_li.find_element(By.CSS_SELECTOR, "span.fancytree-expander")
-                    expander.click()
-                    time.sleep(2)  # 로딩 대기
+                if not is_expanded(parent_li):
+                    expand_and_wait(driver, parent_li)
                     print("✓ 제11대 트리 펼침\n")
                 else:
                     print("✓ 제11대 트리 이미 펼쳐져 있음\n")
@@ -79,141 +168,23 @@ def extract_session_332_links():
                 print(f"✓ 발견: {session_332.text}")
 
                 # 스크롤해서 보이게 하기
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", session_332)
-                time.sleep(1)
+                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", session_332)
 
                 # 제332회 펼치기
                 session_332_li = session_332.find_element(By.XPATH, "./ancestor::li[1]")
 
                 # expander가 이미 펼쳐져 있는지 확인
-                if "fancytree-expanded" not in session_332_li.get_attribute("class"):
-                    expander = session_332_li.find_element(By.CSS_SELECTOR, "span.fancytree-expander")
-                    expander.click()
-                    time.sleep(2)  # 로딩 대기
+                if not is_expanded(session_332_li):
+                    expand_and_wait(driver, session_332_li)
                     print("✓ 제332회 트리 펼침\n")
                 else:
                     print("✓ 제332회 트리 이미 펼쳐져 있음\n")
 
-                # 1단계: 본회의, 운영위원회 등 1차 하위 폴더들 펼치기
-                print("1차 하위 위원회 목록 펼치기 중...")
-                time.sleep(2)
-
-                # 제332회 바로 아래 1차 하위 폴더만 찾기 (여러 방법 시도)
-                level1_folders = []
-
-                # 방법 1: fancytree-folder 클래스로 찾기
-                try:
-                    level1_folders = session_332_li.find_elements(By.XPATH, "./ul/li[contains(@class, 'fancytree-folder')]")
-                except:
-                    pass
-
-                # 방법 2: fancytree-lazy 클래스로 찾기 (동적 로딩)
-                if len(level1_folders) == 0:
-                    try:
-                        level1_folders = session_332_li.find_elements(By.XPATH, "./ul/li[contains(@class, 'fancytree-lazy')]")
-                    except:
-                        pass
-
-                # 방법 3: 모든 li 찾기 (폴더 여부 상관없이)
-                if len(level1_folders) == 0:
-                    try:
-                        level1_folders = session_332_li.find_elements(By.XPATH, "./ul/li")
-                    except:
-                        pass
-
-                print(f"  발견된 1차 하위 폴더: {len(level1_folders)}개")
-
-                if len(level1_folders) == 0:
-                    print("  ⚠ 1차 하위 폴더를 찾을 수 없습니다. DOM 구조 확인 필요\n")
-                    # 디버깅: 제332회 li의 HTML 구조 확인
-                    try:
-                        html_snippet = session_332_li.get_attribute('innerHTML')[:500]
-                        print(f"  제332회 li 내부 구조 (첫 500자):\n{html_snippet}\n")
-                    except:
-                        pass
-
-                for idx, folder in enumerate(level1_folders, 1):
-                    try:
-                        # fancytree-node span 찾기
-                        node_span = folder.find_element(By.CSS_SELECTOR, "span.fancytree-node")
-                        title = node_span.find_element(By.CSS_SELECTOR, "span.fancytree-title")
-                        expander = node_span.find_element(By.CSS_SELECTOR, "span.fancytree-expander")
-
-                        folder_class = node_span.get_attribute("class")
-                        is_lazy = "fancytree-lazy" in folder_class
-                        is_expanded = "fancytree-expanded" in folder_class
-
-                        # 펼쳐져 있지 않으면 클릭
-                        if not is_expanded:
-                            # 스크롤
-                            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", title)
-                            time.sleep(0.5)
-
-                            print(f"  {idx}. {title.text} 펼치기{'(lazy 로딩)' if is_lazy else ''}...")
-                            expander.click()
-
-                            # lazy 로딩이면 더 오래 대기
-                            if is_lazy:
-                                time.sleep(2)
-                            else:
-                                time.sleep(1)
-                        else:
-                            print(f"  {idx}. {title.text} - 이미 펼쳐져 있음")
-                    except Exception as e:
-                        print(f"  ⚠ {idx}번 폴더 펼치기 실패: {str(e)}")
-                        continue
-
-                print("✓ 1차 하위 폴더 펼침 완료\n")
-
-                # 2단계: 모든 2차 하위 폴더들도 펼치기 (각 위원회의 회차별)
-                print("2차 하위 폴더 펼치기 중...")
-                time.sleep(2)
-
-                # 제332회 영역 내의 모든 li (폴더 포함) 찾기
-                all_nodes = session_332_li.find_elements(By.XPATH, ".//span[contains(@class, 'fancytree-node')]")
-                # 폴더만 필터링 (fancytree-folder 클래스 있는 것)
-                all_folders = [node for node in all_nodes if "fancytree-folder" in node.get_attribute("class") or "fancytree-lazy" in node.get_attribute("class")]
-                print(f"  발견된 전체 폴더 노드: {len(all_folders)}개")
-
-                expanded_count = 0
-                failed_count = 0
-                for idx, folder_node in enumerate(all_folders, 1):
-                    try:
-                        folder_class = folder_node.get_attribute("class")
-                        is_lazy = "fancytree-lazy" in folder_class
-                        is_expanded = "fancytree-expanded" in folder_class
-
-                        # 펼쳐져 있지 않으면 클릭
-                        if not is_expanded:
-                            # 스크롤
-                            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", folder_node)
-                            time.sleep(0.3)
-
-                            expander = folder_node.find_element(By.CSS_SELECTOR, "span.fancytree-expander")
-
-                            # expander가 클릭 가능한지 확인
-                            if expander.is_displayed():
-                                expander.click()
-                                expanded_count += 1
-
-                                # lazy 로딩이면 더 오래 대기
-                                if is_lazy:
-                                    time.sleep(1)
-                                else:
-                                    time.sleep(0.5)
-
-                                # 진행상황 표시 (10개마다)
-                                if expanded_count % 10 == 0:
-                                    print(f"    진행: {expanded_count}개 폴더 펼침...")
-                    except Exception as e:
-                        failed_count += 1
-                        # 실패가 너무 많으면 중단
-                        if failed_count > 50:
-                            print(f"    ⚠ 연속 실패가 많아 중단합니다.")
-                            break
-                        continue
-
-                print(f"✓ 추가로 {expanded_count}개 폴더 펼침 완료 (실패: {failed_count}개)\n")
+                # 하위 폴더 전체를 브라우저 안에서 한 번에 펼치기
+                # (폴더마다 Python ↔ WebDriver 왕복하던 방식 대체)
+                print("하위 폴더 전체 펼치기 중...")
+                result = driver.execute_script(EXPAND_ALL_JS, session_332_li)
+                print(f"✓ 하위 폴더 {result['expanded']}개 펼침 완료 ({result['mode']})\n")
 
         except Exception as e:
             print(f"제332회 클릭 중 오류: {e}\n")
@@ -222,40 +193,27 @@ def extract_session_332_links():
 
         # 모든 회의록 링크 추출
         print("회의록 링크 추출 중...\n")
-        time.sleep(2)
-
-        # 제332회 영역에서만 링크 찾기
-        all_links = []
-        if session_332_li:
-            # 그 안에 있는 모든 a 태그 찾기
-            all_links = session_332_li.find_elements(By.XPATH, ".//a[contains(@href, 'recordView.do')]")
-            print(f"제332회 영역에서 발견된 회의록 링크: {len(all_links)}개\n")
-        else:
-            # session_332_li를 찾지 못한 경우 재시도
+
+        # 제332회 영역에서만 링크 찾기 (없으면 전체 문서)
+        if session_332_li is None:
             try:
                 session_332_li = driver.find_element(By.XPATH, "//span[@class='fancytree-title' and contains(text(), '제332회') and contains(text(), '임시회')]//ancestor::li[1]")
-                all_links = session_332_li.find_elements(By.XPATH, ".//a[contains(@href, 'recordView.do')]")
-                print(f"제332회 영역에서 발견된 회의록 링크: {len(all_links)}개\n")
-            except:
-                # 실패하면 전체에서 찾기
+            except Exception:
                 print("제332회 영역 찾기 실패. 전체에서 검색합니다.\n")
-                all_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'recordView.do')]")
+
+        all_links = driver.execute_script(COLLECT_LINKS_JS, session_332_li)
+        print(f"발견된 회의록 링크: {len(all_links)}개\n")
 
         meeting_links = []
 
-        for link in all_links:
-            try:
-                href = link.get_attribute('href')
-                text = link.text.strip()
-
-                if href and 'recordView.do?key=' in href and text:
-                    meeting_links.append({
-                        'url': href,
-                        'title': text
-                    })
-                    print(f"  ✓ {text}")
-            except:
-                continue
+        for href, text in all_links:
+            text = text.strip()
+            if href and 'recordView.do?key=' in href and text:
+                meeting_links.append({
+                    'url': href,
+                    'title': text
+                })
+                print(f"  ✓ {text}")
 
         print(f"\n총 {len(meeting_links)}개의 회의록 링크 발견\n")
         print("=" * 80)
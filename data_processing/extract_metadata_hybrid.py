@@ -13,16 +13,41 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup, NavigableString
+import asyncio
+import contextlib
+import functools
+import hashlib
 import json
+import orjson
+import numpy as np
 import os
 import re
 import logging
+import mmap
+import random
+import sys
+import threading
+import time
+import logging.handlers
 from datetime import datetime
 from pathlib import Path
 from google import genai
 from google.genai import types
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
+
+# 프로젝트 루트를 path에 추가 (utils 모듈 import용)
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.gemini_utils import is_transient_gemini_error, submit_batch_and_wait
+
+# blake3가 없으면 hashlib.sha256으로 캐시 키 계산
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
 # 로그 설정
 def setup_logging():
@@ -33,11 +58,22 @@ def setup_logging():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"parsing_hybrid_{timestamp}.log"
 
+    # 파일 로그는 메모리에 모았다가 200건마다(또는 ERROR 이상 발생 시) 한 번에 기록
+    # (레코드마다 flush하던 write 시스템 콜 제거, 종료 시 logging.shutdown이 남은 로그 기록)
+    log_format = '%(asctime)s [%(levelname)s] %(message)s'
+    target_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
+    target_handler.setFormatter(logging.Formatter(log_format))  # 포맷은 실제 기록하는 핸들러에 적용
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=200,
+        flushLevel=logging.ERROR,
+        target=target_handler
+    )
+
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s [%(levelname)s] %(message)s',
+        format=log_format,
         handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
+            file_handler,
             logging.StreamHandler()
         ]
     )
@@ -50,92 +86,157 @@ def setup_logging():
 
 logger = setup_logging()
 
+# verbose=False로 실행 중인 스레드의 콘솔 출력 억제 여부
+# (sys.stdout 교체는 프로세스 전체에 적용되어 병렬 처리 시 다른 스레드 출력까지 삼킴)
+_output_state = threading.local()
 
-def extract_text_with_links(element):
-    """HTML 요소에서 텍스트와 링크를 순서대로 추출"""
-    result = []
-
-    for child in element.children:
-        if isinstance(child, NavigableString):
-            text = str(child)
-            if text:
-                result.append({"type": "text", "content": text})
-        elif child.name == 'a':
-            link_text = child.get_text()
-            href = child.get('href', '')
-
-            if href.startswith('/'):
-                full_url = f"https://ms.smc.seoul.kr{href}"
-            elif href.startswith('http'):
-                full_url = href
-            else:
-                full_url = href
-
-            result.append({"type": "link", "text": link_text, "url": full_url})
-        elif child.name == 'br':
-            result.append({"type": "text", "content": "\n"})
-        elif child.name == 'hr':
-            result.append({"type": "separator", "content": "---"})
-        else:
-            result.extend(extract_text_with_links(child))
 
-    return result
+def _print(*args, **kwargs) -> None:
+    """
+    print() 대신 사용: 현재 스레드가 _quiet_output() 안이면 출력하지 않음
+    """
+    if not getattr(_output_state, 'quiet', False):
+        print(*args, **kwargs)
 
 
-def extract_reference_materials(content_list):
+@contextlib.contextmanager
+def _quiet_output(quiet: bool = True):
     """
-    (참고) 섹션에서 참고자료 링크 추출
+    with 블록 동안 현재 스레드의 _print() 출력 억제 (예외가 나도 원래 상태로 복구)
+    """
+    previous = getattr(_output_state, 'quiet', False)
+    _output_state.quiet = previous or quiet
+    try:
+        yield
+    finally:
+        _output_state.quiet = previous
+
+# 1단계(안건 매핑) Gemini 응답 캐시 위치
+# 프롬프트를 수정하면 STAGE1_PROMPT_VERSION(Flash는 STAGE1_FLASH_PROMPT_VERSION)을 올려 이전 캐시를 무효화
+STAGE1_CACHE_DIR = Path("data/result_txt_gemini/cache")
+STAGE1_PROMPT_VERSION = "agenda_mapping/v1"
+STAGE1_FLASH_PROMPT_VERSION = "agenda_mapping_flash/v1"
+
+# 1단계 결과 디버깅용 파일 저장 여부 (SEOULLOG_STAGE1_DEBUG=1일 때만 저장)
+STAGE1_DEBUG_ENABLED = os.getenv("SEOULLOG_STAGE1_DEBUG", "0") != "0"
+
+# 1단계 배치 요청 한도 (회의록 수: 출력 토큰 한도, 문자 수: 입력 컨텍스트 한도 고려)
+STAGE1_MAX_BATCH_SIZE = 5
+STAGE1_MAX_BATCH_CHARS = 600_000
+
+# 1단계 재시도 최대 대기 시간 (초)
+STAGE1_RETRY_MAX_DELAY = 30
+
+# Gemini Batch API job 상태 확인 간격 (초)
+BATCH_POLL_INTERVAL = 60
+
+# 회의록 크롤링용 공유 세션 (keep-alive로 TCP/TLS 연결 재사용, 일시적 5xx 재시도)
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip, deflate',
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+))
+
+# 2단계 라인 파싱 정규식 (라인마다 호출되므로 모듈 로드 시 한 번만 컴파일)
+_MD_LINK = re.compile(r'\[([^\]]+)\]\([^\)]+\)')  # [텍스트](url) → 텍스트
+_SPEAKER = re.compile(r'^○(?:\s*(.+?)\s{2,}(.+)|\s*(.+))$')  # (발언자, 발언 내용) 또는 발언자만
+# 건너뛸 라인: 안건 번호 라인 "1. 안건명 [](url)" | 시간 표기 "(16신 22분)" (한 번의 match로 판별)
+_SKIP_LINE = re.compile(
+    r'^(?:\d+\.\s+.+\[\]\(https?://'
+    r'|\([0-9]{1,2}[시신]\s*[0-9]{0,2}\s*분?\)$)'
+)
+_SENTENCE_END = re.compile(r'[.?!]\s+')
+
+# 참고자료로 수집할 첨부 문서 확장자
+_DOC_EXTS = ('.pdf', '.hwp', '.docx')
+
+
+def extract_text_with_links(element) -> tuple:
+    """
+    HTML 요소에서 본문 텍스트와 참고자료 링크를 한 번의 순회로 추출
+
+    요소마다 dict를 만들지 않고 txt 라인(공백 제거된 텍스트 노드, 구분선 "---")을 바로 쌓으며,
+    "(참고)" ~ "회의록 끝에 실음" 구간의 다운로드 링크는 순회 중 상태 머신으로 수집합니다.
+    재귀 호출 없이 명시적 스택(DFS)으로 순회합니다.
 
     Returns:
-        [{"title": "문서명", "url": "다운로드 URL"}]
+        (txt 본문, [{"title": "문서명", "url": "다운로드 URL"}])
     """
+    lines = []
+    append = lines.append
     attachments = []
     in_reference = False
     pending_links = []
+    stack = [iter(element.children)]
 
-    for i, item in enumerate(content_list):
-        # (참고) 시작 감지
-        if item.get("type") == "text" and "(참고)" in item.get("content", ""):
-            in_reference = True
-            pending_links = []
+    while stack:
+        try:
+            child = next(stack[-1])
+        except StopIteration:
+            stack.pop()
             continue
 
-        # (회의록 끝에 실음) 감지 시 종료
-        if in_reference and item.get("type") == "text" and "회의록 끝에 실음" in item.get("content", ""):
-            in_reference = False
-            # pending_links를 attachments에 추가
-            attachments.extend(pending_links)
-            pending_links = []
-            continue
+        if isinstance(child, NavigableString):
+            text = str(child).strip()
+            if text:
+                append(text)
+
+                # (참고) 시작 감지
+                if "(참고)" in text:
+                    in_reference = True
+                    pending_links = []
+                # (회의록 끝에 실음) 감지 시 종료
+                elif in_reference and "회의록 끝에 실음" in text:
+                    in_reference = False
+                    attachments.extend(pending_links)
+                    pending_links = []
+        elif child.name == 'a':
+            # 링크 텍스트는 txt 본문에 넣지 않고, (참고) 구간의 PDF/HWP 다운로드 링크만 수집
+            if in_reference:
+                href = child.get('href', '')
+                full_url = f"https://ms.smc.seoul.kr{href}" if href[:1] == '/' else href
+
+                if "appendixDownload" in full_url or full_url.endswith(_DOC_EXTS):
+                    pending_links.append({
+                        "title": child.get_text().strip(),
+                        "url": full_url
+                    })
+        elif child.name == 'hr':
+            append('---')
+        elif child.name != 'br':
+            # <br>은 공백 라인이라 txt에서 제외, 다른 태그는 자식 노드를 이어서 처리
+            stack.append(iter(child.children))
 
-        # (참고) 구간 내의 링크 수집
-        if in_reference and item.get("type") == "link":
-            # PDF/HWP 다운로드 링크만 추출
-            url = item.get("url", "")
-            if "appendixDownload" in url or url.endswith(('.pdf', '.hwp', '.docx')):
-                pending_links.append({
-                    "title": item.get("text", "").strip(),
-                    "url": url
-                })
+    return '\n'.join(lines), attachments
 
-    return attachments
+
+def _truncate_at(text: str, markers) -> str:
+    """
+    markers 중 가장 먼저 나오는 위치에서 text를 자름 (없으면 그대로 반환)
+
+    split(marker)[0]을 마커마다 반복하는 것과 결과는 같지만 중간 리스트 없이 한 번만 슬라이스합니다.
+    """
+    positions = [i for i in (text.find(m) for m in markers) if i >= 0]
+    return text[:min(positions)] if positions else text
 
 
 def crawl_url(url: str) -> Dict:
     """URL 크롤링하여 txt 형식으로 반환"""
     logger.info(f"크롤링 시작: {url}")
-    print(f"🌐 크롤링 시작: {url}\n")
+    _print(f"🌐 크롤링 시작: {url}\n")
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    response = requests.get(url, headers=headers, timeout=30)
-    response.encoding = 'utf-8'
+    response = _SESSION.get(url, timeout=30)
 
     if response.status_code != 200:
         raise Exception(f"HTTP {response.status_code}")
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    # 본문을 str로 디코딩하지 않고 bytes 그대로 파서에 전달 (디코딩은 파서에서 한 번만)
+    soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8')
     canvas = soup.find('div', id='canvas')
 
     if not canvas:
@@ -144,33 +245,15 @@ def crawl_url(url: str) -> Dict:
     title = soup.title.string if soup.title else "제목 없음"
     title = title.strip()
 
-    # 텍스트 + 링크 추출
-    extracted = extract_text_with_links(canvas)
-
-    # 첨부 문서 추출 (참고 섹션에서)
-    attachments = extract_reference_materials(extracted)
-
-    # txt 변환
-    lines = []
-    for item in extracted:
-        if item['type'] == 'text':
-            text = item['content'].strip()
-            if text:
-                lines.append(text)
-        elif item['type'] == 'separator':
-            lines.append('---')
-
-    txt_content = '\n'.join(lines)
+    # 텍스트 + 첨부 문서(참고 섹션) 추출
+    txt_content, attachments = extract_text_with_links(canvas)
 
     # 참고자료 제거
-    if '(회의록 끝에 실음)' in txt_content:
-        txt_content = txt_content.split('(회의록 끝에 실음)')[0]
-    if '(참고)' in txt_content:
-        txt_content = txt_content.split('(참고)')[0]
+    txt_content = _truncate_at(txt_content, ('(회의록 끝에 실음)', '(참고)'))
 
     logger.info(f"크롤링 완료: {len(txt_content)} bytes, 첨부 {len(attachments)}개")
-    print(f"✅ 크롤링 완료: {len(txt_content):,} bytes\n")
-    print(f"📎 첨부 문서: {len(attachments)}개\n")
+    _print(f"✅ 크롤링 완료: {len(txt_content):,} bytes\n")
+    _print(f"📎 첨부 문서: {len(attachments)}개\n")
 
     return {
         "title": title,
@@ -180,6 +263,70 @@ def crawl_url(url: str) -> Dict:
     }
 
 
+def _stage1_cache_path(
+    txt_content: str,
+    title: str,
+    url: str,
+    attachments: Optional[List[Dict]],
+    model: str,
+    prompt_version: str = STAGE1_PROMPT_VERSION
+) -> Path:
+    """
+    1단계 캐시 파일 경로 (프롬프트 입력 전체 + 모델 + 프롬프트 버전의 해시)
+    """
+    hasher = blake3.blake3() if blake3 is not None else hashlib.sha256()
+    hasher.update(orjson.dumps([model, prompt_version, title, url, attachments or []]))
+    hasher.update(b'\0')
+    hasher.update(txt_content.encode('utf-8'))
+    return STAGE1_CACHE_DIR / f"{hasher.hexdigest()}.json"
+
+
+def _write_stage1_cache(cache_path: Path, result: Dict) -> None:
+    """
+    1단계 결과를 캐시에 저장 (임시 파일에 쓴 뒤 교체해 동시 실행 중 반쯤 쓰인 캐시를 읽지 않도록)
+    """
+    STAGE1_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.{id(result)}.tmp")
+    tmp_path.write_bytes(orjson.dumps(result))
+    tmp_path.replace(cache_path)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> genai.Client:
+    """
+    API Key별 genai.Client 재사용
+
+    Client마다 내부 HTTP 커넥션 풀을 가지므로, 호출마다 새로 만들면
+    재시도/다중 파일 처리 때마다 TCP+TLS 연결을 다시 맺게 됩니다.
+    """
+    return genai.Client(api_key=api_key)
+
+
+def _wait_before_retry(error: Exception, attempt: int, max_retries: int) -> None:
+    """
+    1단계 재시도 전 대기 (지수 백오프 + 지터). 재시도 불가능하면 error를 다시 raise
+
+    Args:
+        error: 발생한 예외
+        attempt: 현재 시도 횟수 (1부터)
+        max_retries: 최대 재시도 횟수
+    """
+    if not is_transient_gemini_error(error):
+        # 일시적 오류가 아니면 재시도 없이 바로 raise
+        raise error
+
+    if attempt >= max_retries:
+        _print(f"❌ 최대 재시도 횟수 ({max_retries}회) 도달, 실패")
+        logger.error(f"최대 재시도 횟수 도달: {error}")
+        raise error
+
+    delay = min(STAGE1_RETRY_MAX_DELAY, 2 ** attempt + random.random())
+    _print(f"⚠️  일시적 오류 (시도 {attempt}/{max_retries}): {error}")
+    _print(f"   {delay:.1f}초 후 재시도합니다...")
+    logger.warning(f"일시적 오류 (시도 {attempt}/{max_retries}), {delay:.1f}초 후 재시도: {error}")
+    time.sleep(delay)
+
+
 def extract_agenda_mapping(
     txt_content: str,
     title: str,
@@ -187,11 +334,16 @@ def extract_agenda_mapping(
     api_key: str,
     attachments: List[Dict] = None,
     model: str = "gemini-2.5-pro",
-    max_retries: int = 3
+    max_retries: int = 3,
+    use_cache: bool = True,
+    before_request: Optional[Callable[[], None]] = None
 ) -> Dict:
     """
     1단계: Gemini로 안건 라인 매핑 추출
 
+    같은 입력(회의록/제목/URL/첨부/모델)으로 이미 추출한 결과가 있으면
+    STAGE1_CACHE_DIR의 캐시를 사용하고 API를 호출하지 않습니다 (토큰 0으로 반환).
+
     Args:
         txt_content: 회의록 텍스트
         title: 회의록 제목
@@ -200,6 +352,8 @@ def extract_agenda_mapping(
         attachments: 첨부 문서 목록 [{"title": "...", "url": "..."}]
         model: 사용할 모델
         max_retries: 최대 재시도 횟수 (기본: 3)
+        use_cache: 응답 캐시 사용 여부 (기본: True)
+        before_request: API 호출(재시도 포함) 직전마다 호출할 함수 (예: 요청 속도 제한, 캐시 사용 시 호출 안 됨)
 
     Returns:
         {
@@ -221,68 +375,48 @@ def extract_agenda_mapping(
         }
     """
     logger.info("1단계: 안건 라인 매핑 추출 시작")
-    print("=" * 80)
-    print("1단계: 안건 라인 매핑 추출 (Gemini 2.5 Pro)")
-    print("=" * 80)
-    print()
-
-    # 재시도 로직
+    _print("=" * 80)
+    _print("1단계: 안건 라인 매핑 추출 (Gemini 2.5 Pro)")
+    _print("=" * 80)
+    _print()
+
+    cache_path = _stage1_cache_path(txt_content, title, url, attachments, model) if use_cache else None
+    if cache_path is not None and cache_path.exists():
+        result = orjson.loads(cache_path.read_bytes())
+        logger.info(f"1단계 캐시 사용: {cache_path}")
+        _print(f"💾 캐시된 안건 매핑 사용: {len(result['agenda_mapping'])}개 ({cache_path.name})")
+        _print()
+        return result, {"input": 0, "output": 0}
+
+    # 프롬프트는 재시도마다 다시 만들지 않고 한 번만 생성
+    prompt = _render_stage1_prompt(txt_content, title, url, attachments)
+
+    # 재시도 로직 (일시적 오류만 지수 백오프로 재시도)
     for attempt in range(1, max_retries + 1):
         try:
             if attempt > 1:
-                print(f"🔄 재시도 {attempt}/{max_retries}...")
+                _print(f"🔄 재시도 {attempt}/{max_retries}...")
                 logger.info(f"재시도 {attempt}/{max_retries}")
 
+            if before_request is not None:
+                before_request()
+
             result, tokens = _extract_agenda_mapping_once(
-                txt_content, title, url, api_key, attachments, model
+                txt_content, title, url, api_key, attachments, model, prompt=prompt
             )
-            return result, tokens
-
-        except json.JSONDecodeError as e:
-            if attempt < max_retries:
-                print(f"⚠️  JSON 파싱 실패 (시도 {attempt}/{max_retries}): {e}")
-                print(f"   재시도합니다...")
-                logger.warning(f"JSON 파싱 실패 (시도 {attempt}/{max_retries}): {e}")
-                continue
-            else:
-                print(f"❌ 최대 재시도 횟수 ({max_retries}회) 도달, 실패")
-                logger.error(f"최대 재시도 횟수 도달: {e}")
-                raise
-        except Exception as e:
-            # JSON 파싱 외 다른 에러는 재시도 없이 바로 raise
-            raise
-
-
-def _extract_agenda_mapping_once(
-    txt_content: str,
-    title: str,
-    url: str,
-    api_key: str,
-    attachments: List[Dict] = None,
-    model: str = "gemini-2.5-pro"
-) -> Dict:
-    """
-    1단계: Gemini로 안건 라인 매핑 추출 (단일 시도)
 
-    재시도 로직 없이 한 번만 실행하는 내부 함수
-    """
+            if cache_path is not None:
+                _write_stage1_cache(cache_path, result)
 
-    client = genai.Client(api_key=api_key)
+            return result, tokens
 
-    # 라인 번호 추가
-    lines = txt_content.split('\n')
-    numbered_text = ""
-    for i, line in enumerate(lines, 1):
-        numbered_text += f"{i:4d} | {line}\n"
+        except Exception as e:
+            _wait_before_retry(e, attempt, max_retries)
 
-    # 첨부 문서 정보를 텍스트로 변환 (Gemini에게 전달)
-    attachments_text = ""
-    if attachments:
-        attachments_text = "\n\n첨부 문서 목록:\n"
-        for idx, att in enumerate(attachments, 1):
-            attachments_text += f"{idx}. {att['title']} (URL: {att['url']})\n"
 
-    prompt = f"""다음은 서울시의회 회의록입니다. 이 회의록을 분석하여 안건별 라인 번호 매핑을 추출해주세요.
+# 1단계 프롬프트 템플릿 (고정 텍스트는 모듈 로드 시 한 번만 생성, 호출마다 변수만 채움)
+# 수정 시 STAGE1_PROMPT_VERSION을 올려 캐시 무효화
+_STAGE1_PROMPT_TEMPLATE = """다음은 서울시의회 회의록입니다. 이 회의록을 분석하여 안건별 라인 번호 매핑을 추출해주세요.
 
 회의록 제목: {title}
 회의록 URL: {url}
@@ -423,6 +557,79 @@ JSON 출력 형식:
 - status는 회의록에서 추출한 실제 처리 상태 (없으면 "접수")
 """
 
+
+# 1단계 배치 요청 머리말 (각 회의록 블록에는 단일 요청용 프롬프트가 그대로 들어감)
+_STAGE1_BATCH_HEADER = """다음은 서울시의회 회의록 {count}건에 대한 개별 분석 요청입니다.
+각 <<<MEETING id="N">>> ... <<<END>>> 블록은 서로 독립된 요청이며, 블록 안의 지침과 출력 형식을 해당 회의록에만 적용하세요.
+
+JSON 출력 형식:
+{{
+  "results": [
+    {{"id": N, "meeting_info": {{...}}, "agenda_mapping": [...]}}
+  ]
+}}
+
+규칙:
+- 순수 JSON만 출력
+- 모든 블록의 id마다 결과를 정확히 하나씩 출력
+- meeting_info, agenda_mapping은 각 블록의 출력 형식을 그대로 따름
+"""
+
+
+def _render_stage1_prompt(
+    txt_content: str,
+    title: str,
+    url: str,
+    attachments: Optional[List[Dict]] = None,
+    template: str = None
+) -> str:
+    """
+    1단계 프롬프트 생성 (회의록 라인 번호 + 첨부 문서 목록 삽입)
+
+    template을 지정하지 않으면 Pro용 _STAGE1_PROMPT_TEMPLATE 사용
+    """
+    # 라인 번호 추가 (한 번의 join으로 생성)
+    # 2단계의 split('\n')과 라인 번호가 일치해야 하므로 splitlines()는 쓰지 않음
+    numbered_text = ''.join([
+        f"{i:4d} | {line}\n" for i, line in enumerate(txt_content.split('\n'), 1)
+    ])
+
+    # 첨부 문서 정보를 텍스트로 변환 (Gemini에게 전달)
+    attachments_text = ""
+    if attachments:
+        attachments_text = "\n\n첨부 문서 목록:\n" + ''.join([
+            f"{idx}. {att['title']} (URL: {att['url']})\n" for idx, att in enumerate(attachments, 1)
+        ])
+
+    return (template or _STAGE1_PROMPT_TEMPLATE).format_map({
+        "title": title,
+        "url": url,
+        "attachments_text": attachments_text,
+        "numbered_text": numbered_text,
+    })
+
+
+def _extract_agenda_mapping_once(
+    txt_content: str,
+    title: str,
+    url: str,
+    api_key: str,
+    attachments: List[Dict] = None,
+    model: str = "gemini-2.5-pro",
+    prompt: Optional[str] = None
+) -> Dict:
+    """
+    1단계: Gemini로 안건 라인 매핑 추출 (단일 시도)
+
+    재시도 로직 없이 한 번만 실행하는 내부 함수
+    (prompt를 넘기면 그대로 사용, 없으면 입력으로부터 생성)
+    """
+
+    client = _get_client(api_key)
+
+    if prompt is None:
+        prompt = _render_stage1_prompt(txt_content, title, url, attachments)
+
     try:
         response = client.models.generate_content(
             model=model,
@@ -434,7 +641,7 @@ JSON 출력 형식:
         )
     except Exception as e:
         error_msg = f"Gemini API 호출 실패: {e}"
-        print(f"❌ {error_msg}")
+        _print(f"❌ {error_msg}")
         logger.error(error_msg)
         import traceback
         traceback.print_exc()
@@ -444,19 +651,19 @@ JSON 출력 형식:
     if response.candidates and len(response.candidates) > 0:
         finish_reason = getattr(response.candidates[0], 'finish_reason', None)
         if finish_reason:
-            print(f"🔍 Finish Reason: {finish_reason}")
+            _print(f"🔍 Finish Reason: {finish_reason}")
             if finish_reason not in ['STOP', 1]:  # STOP = 정상 완료
-                print(f"⚠️  응답이 비정상적으로 종료됨: {finish_reason}")
+                _print(f"⚠️  응답이 비정상적으로 종료됨: {finish_reason}")
 
     response_text = None
     try:
         response_text = response.text
     except Exception as e:
-        print(f"❌ response.text 추출 실패: {e}")
+        _print(f"❌ response.text 추출 실패: {e}")
         logger.error(f"response.text 추출 실패: {e}")
 
     if not response_text:
-        print("⚠️  response.text가 비어있음, candidates에서 추출 시도...")
+        _print("⚠️  response.text가 비어있음, candidates에서 추출 시도...")
         if response.candidates and len(response.candidates) > 0:
             candidate = response.candidates[0]
             if hasattr(candidate, 'content') and candidate.content:
@@ -465,22 +672,23 @@ JSON 출력 형식:
                         part = candidate.content.parts[0]
                         if hasattr(part, 'text'):
                             response_text = part.text
-                            print(f"✅ candidates에서 추출 성공 (길이: {len(response_text)})")
+                            _print(f"✅ candidates에서 추출 성공 (길이: {len(response_text)})")
 
     if not response_text:
         error_msg = "Gemini 응답이 비어있습니다"
-        print(f"❌ {error_msg}")
-        print(f"   Response: {response}")
+        _print(f"❌ {error_msg}")
+        _print(f"   Response: {response}")
         if hasattr(response, 'prompt_feedback'):
-            print(f"   Prompt Feedback: {response.prompt_feedback}")
+            _print(f"   Prompt Feedback: {response.prompt_feedback}")
         logger.error(error_msg)
         raise Exception(error_msg)
 
     try:
-        result = json.loads(response_text)
+        # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스라 재시도 로직 그대로 동작
+        result = orjson.loads(response_text)
     except json.JSONDecodeError as e:
-        print(f"❌ JSON 파싱 에러: {e}")
-        print(f"   Response text (처음 500자): {response_text[:500]}")
+        _print(f"❌ JSON 파싱 에러: {e}")
+        _print(f"   Response text (처음 500자): {response_text[:500]}")
 
         # 전체 응답을 파일로 저장
         error_log_dir = Path("logs/gemini_errors")
@@ -496,7 +704,7 @@ JSON 출력 형식:
             f.write(f"모델: {model}\n")
             f.write(f"\n=== Gemini 응답 전문 ===\n")
             f.write(response_text)
-        print(f"   전체 응답 저장: {error_file}")
+        _print(f"   전체 응답 저장: {error_file}")
 
         logger.error(f"JSON 파싱 에러: {e}")
         raise
@@ -508,13 +716,154 @@ JSON 출력 형식:
         tokens["output"] = getattr(response.usage_metadata, 'candidates_token_count', 0)
 
     logger.info(f"1단계 완료: {len(result['agenda_mapping'])}개 안건, 토큰={tokens['input']}+{tokens['output']}")
-    print(f"✅ 안건 매핑 추출 완료: {len(result['agenda_mapping'])}개")
-    print(f"📊 토큰: input={tokens['input']:,}, output={tokens['output']:,}")
-    print()
+    _print(f"✅ 안건 매핑 추출 완료: {len(result['agenda_mapping'])}개")
+    _print(f"📊 토큰: input={tokens['input']:,}, output={tokens['output']:,}")
+    _print()
 
     return result, tokens
 
 
+def _plan_stage1_batches(prompts: List[str], max_batch_size: int, max_batch_chars: int) -> List[List[int]]:
+    """
+    프롬프트 길이 기준으로 회의록 인덱스를 배치로 묶음 (입력 순서 유지, 한도 초과 시 새 배치)
+    """
+    batches = []
+    current = []
+    current_chars = 0
+
+    for idx, prompt in enumerate(prompts):
+        if current and (len(current) >= max_batch_size or current_chars + len(prompt) > max_batch_chars):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append(idx)
+        current_chars += len(prompt)
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def extract_agenda_mapping_batch(
+    meetings: List[Dict],
+    api_key: str,
+    model: str = "gemini-2.5-pro",
+    max_batch_size: int = STAGE1_MAX_BATCH_SIZE,
+    max_batch_chars: int = STAGE1_MAX_BATCH_CHARS,
+    use_cache: bool = True
+) -> tuple:
+    """
+    1단계: 여러 회의록의 안건 매핑을 Gemini 요청 하나로 묶어서 추출 (대량 재처리용)
+
+    각 회의록의 단일 프롬프트를 <<<MEETING id="N">>> ... <<<END>>> 구분자로 감싸 한 번에 요청하고,
+    {"results": [{"id": N, "meeting_info": ..., "agenda_mapping": ...}]} 형식으로 받습니다.
+    배치 응답 JSON 파싱에 실패하거나 결과가 누락된 회의록만 extract_agenda_mapping()으로 개별 재요청합니다.
+
+    Args:
+        meetings: [{"txt_content": "...", "title": "...", "url": "...", "attachments": [...]}]
+        api_key: Google API Key
+        model: 사용할 모델
+        max_batch_size: 요청 하나에 묶을 최대 회의록 수 (출력 토큰 한도 고려)
+        max_batch_chars: 요청 하나의 최대 프롬프트 길이 (문자 수, 입력 컨텍스트 한도 고려)
+        use_cache: 응답 캐시 사용 여부 (기본: True)
+
+    Returns:
+        (meetings와 같은 순서의 1단계 결과 리스트, 전체 토큰 {"input": N, "output": N})
+    """
+    results = [None] * len(meetings)
+    total_tokens = {"input": 0, "output": 0}
+
+    # 캐시 적중한 회의록은 배치에서 제외
+    cache_paths = [None] * len(meetings)
+    pending = []
+    for idx, meeting in enumerate(meetings):
+        if use_cache:
+            cache_paths[idx] = _stage1_cache_path(
+                meeting['txt_content'], meeting['title'], meeting['url'], meeting.get('attachments'), model
+            )
+            if cache_paths[idx].exists():
+                results[idx] = orjson.loads(cache_paths[idx].read_bytes())
+                continue
+        pending.append(idx)
+
+    logger.info(f"1단계 배치: {len(meetings)}건 중 캐시 {len(meetings) - len(pending)}건, 요청 {len(pending)}건")
+    _print(f"📦 1단계 배치: 총 {len(meetings)}건 (캐시 {len(meetings) - len(pending)}건, 요청 {len(pending)}건)")
+
+    prompts = [
+        _render_stage1_prompt(
+            meetings[idx]['txt_content'], meetings[idx]['title'], meetings[idx]['url'], meetings[idx].get('attachments')
+        )
+        for idx in pending
+    ]
+
+    client = _get_client(api_key)
+    failed = []
+
+    for batch in _plan_stage1_batches(prompts, max_batch_size, max_batch_chars):
+        batch_ids = [pending[i] for i in batch]
+        batch_prompt = _STAGE1_BATCH_HEADER.format(count=len(batch)) + ''.join([
+            f'\n<<<MEETING id="{meeting_id}">>>\n{prompts[i]}\n<<<END>>>\n'
+            for i, meeting_id in zip(batch, batch_ids)
+        ])
+
+        _print(f"🚀 배치 요청: {len(batch)}건 ({len(batch_prompt):,}자)")
+        try:
+            response = client.models.generate_content(
+                model=model,
+                contents=batch_prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.1,
+                    response_mime_type="application/json",
+                )
+            )
+            batch_results = orjson.loads(response.text)['results']
+        except Exception as e:
+            # 배치 단위 실패(API/JSON) → 해당 배치 회의록은 개별 요청으로 처리
+            logger.warning(f"배치 요청 실패, 개별 요청으로 전환: {e}")
+            _print(f"⚠️  배치 요청 실패, 개별 요청으로 전환: {e}")
+            failed.extend(batch_ids)
+            continue
+
+        if hasattr(response, 'usage_metadata') and response.usage_metadata:
+            total_tokens["input"] += getattr(response.usage_metadata, 'prompt_token_count', 0) or 0
+            total_tokens["output"] += getattr(response.usage_metadata, 'candidates_token_count', 0) or 0
+
+        received = {}
+        for item in batch_results:
+            if isinstance(item, dict) and item.get('id') in batch_ids and 'agenda_mapping' in item:
+                received[item['id']] = {
+                    "meeting_info": item.get('meeting_info', {}),
+                    "agenda_mapping": item['agenda_mapping'],
+                }
+
+        for meeting_id in batch_ids:
+            if meeting_id in received:
+                results[meeting_id] = received[meeting_id]
+                if cache_paths[meeting_id] is not None:
+                    _write_stage1_cache(cache_paths[meeting_id], received[meeting_id])
+            else:
+                failed.append(meeting_id)
+
+    # 배치에서 누락/실패한 회의록은 기존 단일 요청(재시도 포함)으로 처리
+    for meeting_id in failed:
+        meeting = meetings[meeting_id]
+        result, tokens = extract_agenda_mapping(
+            meeting['txt_content'], meeting['title'], meeting['url'], api_key,
+            meeting.get('attachments'), model, use_cache=use_cache
+        )
+        results[meeting_id] = result
+        total_tokens["input"] += tokens["input"]
+        total_tokens["output"] += tokens["output"]
+
+    logger.info(f"1단계 배치 완료: 개별 재요청 {len(failed)}건, 토큰={total_tokens['input']}+{total_tokens['output']}")
+    _print(f"✅ 1단계 배치 완료 (개별 재요청 {len(failed)}건)")
+    _print(f"📊 토큰: input={total_tokens['input']:,}, output={total_tokens['output']:,}")
+    _print()
+
+    return results, total_tokens
+
+
 def parse_speaker_line(line: str) -> tuple:
     """
     발언자 라인 파싱
@@ -522,25 +871,30 @@ def parse_speaker_line(line: str) -> tuple:
     예: "○의장 최호정  안녕하세요." → ("의장 최호정", "안녕하세요.")
     예: "○위원장 [서상열](url)  안녕하세요." → ("위원장 서상열", "안녕하세요.")
     """
-    # 마크다운 링크 제거 함수
-    def remove_markdown_links(text: str) -> str:
-        # [텍스트](url) → 텍스트
-        return re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    # ○ 다음 공백 제거하고 파싱 (정규식 한 번으로 두 형태 모두 처리)
+    match = _SPEAKER.match(line)
+    if not match:
+        return None, None
 
-    # ○ 다음 공백 제거하고 파싱
-    match = re.match(r'^○\s*(.+?)\s{2,}(.+)$', line)
-    if match:
-        speaker = remove_markdown_links(match.group(1).strip())
-        text = match.group(2).strip()
-        return speaker, text
+    speaker, text, speaker_only = match.groups()
 
     # 발언자만 있는 경우 (다음 줄부터 내용)
-    match = re.match(r'^○\s*(.+)$', line)
-    if match:
-        speaker = remove_markdown_links(match.group(1).strip())
-        return speaker, ""
+    # 발언자명의 마크다운 링크는 텍스트만 남김
+    if speaker is None:
+        return _MD_LINK.sub(r'\1', speaker_only.strip()), ""
+
+    return _MD_LINK.sub(r'\1', speaker.strip()), text.strip()
 
-    return None, None
+
+def _iter_sentences(text: str):
+    """
+    문장 종결 부호(. ? !) + 공백 기준으로 문장을 앞에서부터 하나씩 생성 (종결 부호 포함, 뒤 공백 제외)
+    """
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        yield text[start:match.start() + 1]
+        start = match.end()
+    yield text[start:]
 
 
 def split_long_text(text: str, max_length: int = 500) -> List[str]:
@@ -557,17 +911,11 @@ def split_long_text(text: str, max_length: int = 500) -> List[str]:
     if len(text) <= max_length:
         return [text]
 
-    # 문장 단위로 분할
-    sentences = re.split(r'([.?!])\s+', text)
-
     chunks = []
     current_chunk = ""
 
-    for i in range(0, len(sentences), 2):
-        sentence = sentences[i]
-        if i + 1 < len(sentences):
-            sentence += sentences[i + 1]  # 마침표 추가
-
+    # 문장 단위로 순회 (문장 리스트를 만들지 않고 앞에서부터 한 번만 스캔)
+    for sentence in _iter_sentences(text):
         if len(current_chunk) + len(sentence) > max_length:
             if current_chunk:
                 chunks.append(current_chunk.strip())
@@ -581,10 +929,26 @@ def split_long_text(text: str, max_length: int = 500) -> List[str]:
     return chunks if chunks else [text]
 
 
+def _flush_speech(chunks: List[Dict], speaker: str, agenda_title: str, text_lines: List[str]) -> None:
+    """한 발언자의 누적 발언을 500자 단위 청크로 나눠 chunks에 추가"""
+    full_text = ' '.join(text_lines).strip()
+
+    # 500자 넘으면 분할
+    for text_chunk in split_long_text(full_text, max_length=500):
+        chunks.append({
+            "speaker": speaker,
+            "agenda": agenda_title,
+            "text": text_chunk
+        })
+
+
 def parse_section_pure(section_text: str, agenda_title: str, speakers: List[str], previous_speaker: str = None) -> List[Dict]:
     """
     순수 코드로 섹션 파싱
 
+    라인마다 실행되는 루프이므로 첫 글자로 먼저 분기하고,
+    정규식은 해당 패턴이 시작될 수 있는 라인('(' 또는 숫자로 시작)에만 적용합니다.
+
     Args:
         section_text: 회의록 텍스트
         agenda_title: 안건명
@@ -595,45 +959,32 @@ def parse_section_pure(section_text: str, agenda_title: str, speakers: List[str]
         chunks 리스트
     """
     chunks = []
-    lines = section_text.split('\n')
+    skip_match = _SKIP_LINE.match
 
     current_speaker = previous_speaker  # 이전 발언자로 초기화
     current_text_lines = []
 
-    for line in lines:
+    for line in section_text.split('\n'):
         line = line.strip()
         if not line:
             continue
 
+        first = line[0]
+
         # 구조적 요소 필터링
-        if line.startswith('---'):
+        if first == '-' and line.startswith('---'):
             continue
-        if '(참고)' in line:
+        if '(참고)' in line or '(회의록 끝에 실음)' in line:
             continue
-        if '(회의록 끝에 실음)' in line:
-            continue
-        # 안건 번호 라인 필터링 (예: "1. 안건명 [](url)" 형태)
-        if re.match(r'^\d+\.\s+.+\[\]\(https?://', line):
-            continue
-        # 시간 표기 필터링 (예: (16신 22분), (11시 23분), (14시 16분))
-        if re.match(r'^\([0-9]{1,2}[시신]\s*[0-9]{0,2}\s*분?\)$', line.strip()):
+        # 안건 번호 라인 / 시간 표기 필터링 (예: "1. 안건명 [](url)", (16신 22분), (11시 23분))
+        if (first == '(' or first.isdecimal()) and skip_match(line):
             continue
 
         # ○로 시작하는 발언자 라인인지 확인
-        if line.startswith('○'):
+        if first == '○':
             # 이전 발언 저장
             if current_speaker and current_text_lines:
-                full_text = ' '.join(current_text_lines).strip()
-
-                # 500자 넘으면 분할
-                text_chunks = split_long_text(full_text, max_length=500)
-
-                for text_chunk in text_chunks:
-                    chunks.append({
-                        "speaker": current_speaker,
-                        "agenda": agenda_title,
-                        "text": text_chunk
-                    })
+                _flush_speech(chunks, current_speaker, agenda_title, current_text_lines)
 
             # 새 발언자 시작
             speaker, first_text = parse_speaker_line(line)
@@ -641,26 +992,27 @@ def parse_section_pure(section_text: str, agenda_title: str, speakers: List[str]
             if speaker:
                 current_speaker = speaker
                 current_text_lines = [first_text] if first_text else []
-        else:
+        elif current_speaker:
             # 발언 내용 계속
-            if current_speaker:
-                current_text_lines.append(line)
+            current_text_lines.append(line)
 
     # 마지막 발언 저장
     if current_speaker and current_text_lines:
-        full_text = ' '.join(current_text_lines).strip()
-        text_chunks = split_long_text(full_text, max_length=500)
-
-        for text_chunk in text_chunks:
-            chunks.append({
-                "speaker": current_speaker,
-                "agenda": agenda_title,
-                "text": text_chunk
-            })
+        _flush_speech(chunks, current_speaker, agenda_title, current_text_lines)
 
     return chunks
 
 
+def _line_start_offsets(txt_bytes: bytes) -> np.ndarray:
+    """
+    각 라인의 시작 바이트 오프셋 계산 (split('\n')의 라인 번호와 1:1 대응)
+
+    UTF-8에서 0x0A는 멀티바이트 문자 내부에 나오지 않으므로 바이트 단위로 찾아도 안전합니다.
+    """
+    newlines = np.flatnonzero(np.frombuffer(txt_bytes, dtype=np.uint8) == 0x0A)
+    return np.concatenate(([0], newlines + 1))
+
+
 def parse_with_pure_code(txt_content: str, agenda_mapping: List[Dict]) -> List[Dict]:
     """
     2단계: 순수 코드로 발언 추출
@@ -673,26 +1025,32 @@ def parse_with_pure_code(txt_content: str, agenda_mapping: List[Dict]) -> List[D
         모든 chunks
     """
     logger.info("2단계: 순수 코드로 발언 추출 시작")
-    print("=" * 80)
-    print("2단계: 순수 코드로 발언 추출")
-    print("=" * 80)
-    print()
+    _print("=" * 80)
+    _print("2단계: 순수 코드로 발언 추출")
+    _print("=" * 80)
+    _print()
 
     # txt_content는 이미 헤더가 제거된 상태로 전달됨
-    lines = txt_content.split('\n')
+    # 라인 리스트를 만들고 다시 join하는 대신, 라인 시작 오프셋만 구해 안건 구간을 바로 슬라이스
+    txt_bytes = txt_content.encode('utf-8')
+    line_starts = _line_start_offsets(txt_bytes)
+    n_lines = len(line_starts)
 
     all_chunks = []
     last_speaker = None  # 이전 발언자 추적
 
     for idx, agenda in enumerate(agenda_mapping, 1):
         agenda_title = agenda['agenda_title']
-        line_start = agenda['line_start'] - 1  # 0-indexed
-        line_end = agenda['line_end']
+        # 0-indexed, 범위를 벗어난 값은 리스트 슬라이스와 같은 규칙으로 보정
+        line_start, line_end, _ = slice(agenda['line_start'] - 1, agenda['line_end']).indices(n_lines)
         speakers = agenda.get('speakers', [])
 
-        # 라인 범위 추출
-        section_lines = lines[line_start:line_end]
-        section_text = '\n'.join(section_lines)
+        # 라인 범위 추출 (마지막 라인 뒤의 줄바꿈은 제외)
+        if line_start < line_end:
+            section_end = line_starts[line_end] - 1 if line_end < n_lines else len(txt_bytes)
+            section_text = txt_bytes[line_starts[line_start]:section_end].decode('utf-8')
+        else:
+            section_text = ""
 
         # 파싱 (이전 발언자 전달)
         chunks = parse_section_pure(section_text, agenda_title, speakers, last_speaker)
@@ -703,14 +1061,14 @@ def parse_with_pure_code(txt_content: str, agenda_mapping: List[Dict]) -> List[D
 
         msg = f"[{idx}/{len(agenda_mapping)}] {len(chunks)}개 발언 추출: {agenda_title[:50]}..."
         logger.info(msg)
-        print(f"  ✓ {msg}")
+        _print(f"  ✓ {msg}")
 
         all_chunks.extend(chunks)
 
     logger.info(f"2단계 완료: 총 {len(all_chunks)}개 발언 추출")
-    print()
-    print(f"✅ 총 {len(all_chunks)}개 발언 추출 완료!")
-    print()
+    _print()
+    _print(f"✅ 총 {len(all_chunks)}개 발언 추출 완료!")
+    _print()
 
     return all_chunks
 
@@ -740,10 +1098,10 @@ def extract_metadata_from_url(
     logger.info(f"URL 기반 파싱 시작: {url}")
 
     if verbose:
-        print("=" * 100)
-        print("하이브리드 파싱: URL 크롤링 + 1단계 Gemini + 2단계 순수 코드")
-        print("=" * 100)
-        print()
+        _print("=" * 100)
+        _print("하이브리드 파싱: URL 크롤링 + 1단계 Gemini + 2단계 순수 코드")
+        _print("=" * 100)
+        _print()
 
     # URL 크롤링
     crawled_data = crawl_url(url)
@@ -752,33 +1110,19 @@ def extract_metadata_from_url(
     attachments = crawled_data.get('attachments', [])
 
     if verbose:
-        print(f"📄 제목: {title}")
-        print(f"📏 크기: {len(txt_content):,} bytes")
-        print(f"📎 첨부: {len(attachments)}개")
-        print()
+        _print(f"📄 제목: {title}")
+        _print(f"📏 크기: {len(txt_content):,} bytes")
+        _print(f"📎 첨부: {len(attachments)}개")
+        _print()
 
     # 1단계: 안건 매핑 추출 (Gemini)
-    import sys
-    from io import StringIO
-    old_stdout = sys.stdout
-    if not verbose:
-        sys.stdout = StringIO()
-
-    stage1_result, tokens = extract_agenda_mapping(txt_content, title, url, api_key, attachments, stage1_model)
-
-    if not verbose:
-        sys.stdout = old_stdout
+    with _quiet_output(not verbose):
+        stage1_result, tokens = extract_agenda_mapping(txt_content, title, url, api_key, attachments, stage1_model)
 
     # 2단계: 발언 추출 (순수 코드)
-    if not verbose:
-        sys.stdout = StringIO()
-
-    # txt_content를 full format으로 재구성 (헤더 포함)
-    full_content = f"제목: {title}\nURL: {url}\n{'=' * 80}\n\n{txt_content}"
-    chunks = parse_with_pure_code(full_content, stage1_result['agenda_mapping'])
-
-    if not verbose:
-        sys.stdout = old_stdout
+    # 1단계 라인 번호는 txt_content 기준이므로 헤더 없이 그대로 전달
+    with _quiet_output(not verbose):
+        chunks = parse_with_pure_code(txt_content, stage1_result['agenda_mapping'])
 
     # 최종 결과 (agenda_mapping 포함)
     final_result = {
@@ -796,135 +1140,246 @@ def extract_metadata_from_url(
     logger.info(f"URL 기반 파싱 완료: {len(chunks)}개 발언, {len(attachments)}개 첨부")
 
     if verbose:
-        print("=" * 100)
-        print("✅ URL 기반 파싱 완료!")
-        print("=" * 100)
-        print(f"총 발언 수: {len(chunks)}개")
-        print(f"총 첨부 수: {len(attachments)}개")
-        print(f"Stage 1 토큰: {tokens['input']:,} + {tokens['output']:,}")
-        print(f"Stage 2 방식: 순수 Python 코드 (비용 0원)")
-        print()
+        _print("=" * 100)
+        _print("✅ URL 기반 파싱 완료!")
+        _print("=" * 100)
+        _print(f"총 발언 수: {len(chunks)}개")
+        _print(f"총 첨부 수: {len(attachments)}개")
+        _print(f"Stage 1 토큰: {tokens['input']:,} + {tokens['output']:,}")
+        _print(f"Stage 2 방식: 순수 Python 코드 (비용 0원)")
+        _print()
 
     return final_result
 
 
-def extract_metadata_hybrid(
-    txt_path: str,
+async def extract_metadata_from_url_async(
+    url: str,
     api_key: str,
+    semaphore: asyncio.Semaphore,
     stage1_model: str = "gemini-2.5-pro",
     verbose: bool = True
-) -> Dict:
+) -> Optional[Dict]:
     """
-    하이브리드 파싱: 1단계 Gemini + 2단계 순수 코드 (txt 파일 기반)
+    extract_metadata_from_url()를 워커 스레드에서 실행 (동시 실행 수는 semaphore로 제한)
 
-    Note: txt 파일에는 첨부 문서 정보가 없으므로 attachments는 빈 배열입니다.
-          첨부 문서가 필요한 경우 extract_metadata_from_url()을 사용하세요.
+    크롤링과 Gemini 호출은 I/O 대기가 대부분이므로 여러 URL을 겹쳐 실행합니다.
+    verbose=False의 출력 억제는 스레드별로 적용되므로 다른 작업의 출력에는 영향이 없습니다.
 
     Args:
-        txt_path: txt 파일 경로
+        url: 회의록 URL
         api_key: Google API Key
+        semaphore: 동시 실행 수 제한용 세마포어
         stage1_model: 1단계 모델 (기본: gemini-2.5-pro)
         verbose: 상세 출력 여부 (기본: True)
 
     Returns:
-        {
-            "meeting_info": {...},
-            "chunks": [...],
-            "usage": {...}
-        }
+        extract_metadata_from_url() 결과 (실패 시 None)
     """
-    logger.info(f"하이브리드 파싱 시작: {txt_path}")
+    async with semaphore:
+        try:
+            return await asyncio.to_thread(extract_metadata_from_url, url, api_key, stage1_model, verbose)
+        except Exception as e:
+            logger.error(f"URL 파싱 실패: {url} - {e}")
+            _print(f"❌ 실패: {url} - {e}")
+            return None
 
-    if verbose:
-        print("=" * 100)
-        print("하이브리드 파싱: 1단계 Gemini + 2단계 순수 코드")
-        print("=" * 100)
-        print()
 
-    # txt/md 파일 읽기
-    with open(txt_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+def extract_metadata_from_urls(
+    urls: List[str],
+    api_key: str,
+    stage1_model: str = "gemini-2.5-pro",
+    max_concurrency: int = 4,
+    verbose: bool = True
+) -> List[Optional[Dict]]:
+    """
+    여러 회의록 URL을 동시에 크롤링 + 하이브리드 파싱
 
-    # 헤더에서 메타데이터 추출 (TXT와 MD 둘 다 지원)
-    lines_raw = content.split('\n')
+    Args:
+        urls: 회의록 URL 목록
+        api_key: Google API Key
+        stage1_model: 1단계 모델 (기본: gemini-2.5-pro)
+        max_concurrency: 동시 처리 URL 수 (Gemini API 호출 한도 고려, 기본: 4)
+        verbose: 상세 출력 여부 (기본: True)
 
-    # 제목 추출
-    if lines_raw and lines_raw[0].startswith('# '):
-        # MD 형식: # 제목
-        title = lines_raw[0].replace('# ', '').strip()
-    elif lines_raw and lines_raw[0].startswith('제목: '):
-        # TXT 형식: 제목: xxx
-        title = lines_raw[0].replace('제목: ', '').strip()
-    else:
-        title = ""
+    Returns:
+        urls와 같은 순서의 결과 리스트 (실패한 URL은 None)
+    """
+    async def run_all():
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return await asyncio.gather(*[
+            extract_metadata_from_url_async(url, api_key, semaphore, stage1_model, verbose)
+            for url in urls
+        ])
 
-    # URL 추출
-    url = ""
-    for line in lines_raw[:10]:  # 첫 10줄에서 URL 찾기
-        if line.startswith('**URL**:'):
-            # MD 형식: **URL**: https://...
-            url = line.replace('**URL**:', '').strip()
-            break
-        elif line.startswith('URL: '):
-            # TXT 형식: URL: https://...
+    return asyncio.run(run_all())
+
+
+def _write_json_if_changed(path: Path, data: Dict) -> bool:
+    """
+    JSON을 orjson으로 직렬화해 저장 (기존 파일과 내용이 같으면 쓰지 않음)
+
+    재실행 시 같은 결과를 다시 쓰는 디스크 I/O를 피하기 위해 크기 → 내용 순으로 비교합니다.
+
+    Returns:
+        실제로 파일을 썼으면 True
+    """
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    try:
+        if path.stat().st_size == len(payload) and path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(payload)
+    return True
+
+
+def _save_stage1_debug(stage1_path: Path, stage1_result: Dict) -> None:
+    """
+    1단계 결과를 디버깅용 JSON으로 저장 (STAGE1_DEBUG_ENABLED일 때만)
+
+    대량 처리 시 회의록마다 파일을 쓰는 I/O를 피하기 위해 기본은 저장하지 않습니다.
+    """
+    if not STAGE1_DEBUG_ENABLED:
+        return
+
+    stage1_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_if_changed(stage1_path, stage1_result)
+    logger.info(f"1단계 결과 저장: {stage1_path}")
+
+
+def _normalize_newlines(text: str) -> str:
+    """\r\n, \r 줄바꿈을 \n으로 통일 (텍스트 모드 open()의 universal newlines와 동일)"""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _read_meeting_file(txt_path: str) -> tuple:
+    """
+    크롤링 결과 txt/md 파일에서 제목, URL, 본문 추출 (TXT와 MD 둘 다 지원)
+
+    파일을 mmap으로 열어 헤더(첫 10줄)와 본문 구간만 디코딩합니다.
+    (전체를 str로 읽은 뒤 헤더를 잘라내던 방식 대비 디코딩/복사량 절감)
+    텍스트 모드 open()과 같도록 디코딩한 부분의 줄바꿈(\r\n, \r)은 \n으로 통일합니다.
+
+    Args:
+        txt_path: 회의록 txt/md 파일 경로
+
+    Returns:
+        (제목, URL, 본문)
+    """
+    with open(txt_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return "", "", ""
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # 헤더: 첫 10줄만 디코딩
+            header_end = 0
+            for _ in range(10):
+                newline = mm.find(b'\n', header_end)
+                if newline == -1:
+                    header_end = len(mm)
+                    break
+                header_end = newline + 1
+            lines_raw = _normalize_newlines(mm[:header_end].decode('utf-8')).split('\n')
+
+            # 본문만 추출 (구분선 이후 또는 크롤링 시간 이후)
+            separator_index = mm.find(b'=' * 80)
+            if separator_index != -1:
+                txt_content = _normalize_newlines(mm[separator_index + 80:].decode('utf-8')).strip()
+            else:
+                # MD 파일의 경우 크롤링 시간 이후부터
+                crawl_time_index = mm.find('**크롤링 시간**:'.encode('utf-8'))
+                next_line = -1
+                if crawl_time_index != -1:
+                    line_ends = [i for i in (mm.find(b'\n', crawl_time_index), mm.find(b'\r', crawl_time_index)) if i != -1]
+                    next_line = min(line_ends) if line_ends else -1
+                if next_line != -1:
+                    # 다음 줄부터 시작
+                    txt_content = _normalize_newlines(mm[next_line + 1:].decode('utf-8')).strip()
+                else:
+                    txt_content = _normalize_newlines(mm[:].decode('utf-8'))
+
+    # 제목 추출
+    if lines_raw and lines_raw[0].startswith('# '):
+        # MD 형식: # 제목
+        title = lines_raw[0].replace('# ', '').strip()
+    elif lines_raw and lines_raw[0].startswith('제목: '):
+        # TXT 형식: 제목: xxx
+        title = lines_raw[0].replace('제목: ', '').strip()
+    else:
+        title = ""
+
+    # URL 추출
+    url = ""
+    for line in lines_raw[:10]:  # 첫 10줄에서 URL 찾기
+        if line.startswith('**URL**:'):
+            # MD 형식: **URL**: https://...
+            url = line.replace('**URL**:', '').strip()
+            break
+        elif line.startswith('URL: '):
+            # TXT 형식: URL: https://...
             url = line.replace('URL: ', '').strip()
             break
 
-    # 본문만 추출 (구분선 이후 또는 크롤링 시간 이후)
-    separator_index = content.find('=' * 80)
-    if separator_index != -1:
-        txt_content = content[separator_index + 80:].strip()
-    else:
-        # MD 파일의 경우 크롤링 시간 이후부터
-        crawl_time_index = content.find('**크롤링 시간**:')
-        if crawl_time_index != -1:
-            # 다음 줄부터 시작
-            remaining = content[crawl_time_index:]
-            next_line = remaining.find('\n')
-            if next_line != -1:
-                txt_content = remaining[next_line + 1:].strip()
-            else:
-                txt_content = content
-        else:
-            txt_content = content
+    return title, url, txt_content
+
+
+def extract_metadata_hybrid(
+    txt_path: str,
+    api_key: str,
+    stage1_model: str = "gemini-2.5-pro",
+    verbose: bool = True,
+    before_request: Optional[Callable[[], None]] = None
+) -> Dict:
+    """
+    하이브리드 파싱: 1단계 Gemini + 2단계 순수 코드 (txt 파일 기반)
+
+    Note: txt 파일에는 첨부 문서 정보가 없으므로 attachments는 빈 배열입니다.
+          첨부 문서가 필요한 경우 extract_metadata_from_url()을 사용하세요.
+
+    Args:
+        txt_path: txt 파일 경로
+        api_key: Google API Key
+        stage1_model: 1단계 모델 (기본: gemini-2.5-pro)
+        verbose: 상세 출력 여부 (기본: True)
+        before_request: 1단계 API 호출 직전마다 호출할 함수 (예: 요청 속도 제한)
+
+    Returns:
+        {
+            "meeting_info": {...},
+            "chunks": [...],
+            "usage": {...}
+        }
+    """
+    logger.info(f"하이브리드 파싱 시작: {txt_path}")
 
     if verbose:
-        print(f"📄 파일: {txt_path}")
-        print(f"📝 제목: {title}")
-        print(f"📏 크기: {len(txt_content):,} bytes")
-        print()
+        _print("=" * 100)
+        _print("하이브리드 파싱: 1단계 Gemini + 2단계 순수 코드")
+        _print("=" * 100)
+        _print()
 
-    # 1단계: 안건 매핑 추출 (Gemini)
-    # 임시로 print 억제
-    import sys
-    from io import StringIO
-    old_stdout = sys.stdout
-    if not verbose:
-        sys.stdout = StringIO()
+    # txt/md 파일에서 제목/URL/본문 추출
+    title, url, txt_content = _read_meeting_file(txt_path)
 
-    # txt에서 attachments는 추출할 수 없으므로 빈 리스트 전달
-    stage1_result, tokens = extract_agenda_mapping(txt_content, title, url, api_key, [], stage1_model)
+    if verbose:
+        _print(f"📄 파일: {txt_path}")
+        _print(f"📝 제목: {title}")
+        _print(f"📏 크기: {len(txt_content):,} bytes")
+        _print()
 
-    if not verbose:
-        sys.stdout = old_stdout
+    # 1단계: 안건 매핑 추출 (Gemini)
+    # txt에서 attachments는 추출할 수 없으므로 빈 리스트 전달
+    with _quiet_output(not verbose):
+        stage1_result, tokens = extract_agenda_mapping(
+            txt_content, title, url, api_key, [], stage1_model, before_request=before_request
+        )
 
     # 1단계 결과 저장 (디버깅용)
-    stage1_dir = Path("data/result_txt_gemini")
-    stage1_dir.mkdir(parents=True, exist_ok=True)
-    stage1_filename = Path(txt_path).stem + "_stage1.json"
-    stage1_path = stage1_dir / stage1_filename
-    with open(stage1_path, 'w', encoding='utf-8') as f:
-        json.dump(stage1_result, f, ensure_ascii=False, indent=2)
-    logger.info(f"1단계 결과 저장: {stage1_path}")
+    _save_stage1_debug(Path("data/result_txt_gemini") / (Path(txt_path).stem + "_stage1.json"), stage1_result)
 
     # 2단계: 발언 추출 (순수 코드)
-    if not verbose:
-        sys.stdout = StringIO()
-
-    chunks = parse_with_pure_code(txt_content, stage1_result['agenda_mapping'])
-
-    if not verbose:
-        sys.stdout = old_stdout
+    with _quiet_output(not verbose):
+        chunks = parse_with_pure_code(txt_content, stage1_result['agenda_mapping'])
 
     # 최종 결과 (agenda_mapping 포함 - attachments는 빈 배열)
     final_result = {
@@ -942,21 +1397,84 @@ def extract_metadata_hybrid(
     logger.info(f"하이브리드 파싱 완료: {len(chunks)}개 발언")
 
     if verbose:
-        print("=" * 100)
-        print("✅ 하이브리드 파싱 완료!")
-        print("=" * 100)
-        print(f"총 발언 수: {len(chunks)}개")
-        print(f"Stage 1 토큰: {tokens['input']:,} + {tokens['output']:,}")
-        print(f"Stage 2 방식: 순수 Python 코드 (비용 0원)")
-        print()
+        _print("=" * 100)
+        _print("✅ 하이브리드 파싱 완료!")
+        _print("=" * 100)
+        _print(f"총 발언 수: {len(chunks)}개")
+        _print(f"Stage 1 토큰: {tokens['input']:,} + {tokens['output']:,}")
+        _print(f"Stage 2 방식: 순수 Python 코드 (비용 0원)")
+        _print()
 
     return final_result
 
 
+async def extract_metadata_hybrid_async(
+    txt_path: str,
+    api_key: str,
+    semaphore: asyncio.Semaphore,
+    stage1_model: str = "gemini-2.5-pro",
+    verbose: bool = True
+) -> Optional[Dict]:
+    """
+    extract_metadata_hybrid()를 워커 스레드에서 실행 (동시 실행 수는 semaphore로 제한)
+
+    Args:
+        txt_path: txt/md 파일 경로
+        api_key: Google API Key
+        semaphore: 동시 실행 수 제한용 세마포어
+        stage1_model: 1단계 모델 (기본: gemini-2.5-pro)
+        verbose: 상세 출력 여부 (기본: True)
+
+    Returns:
+        extract_metadata_hybrid() 결과 (실패 시 None)
+    """
+    async with semaphore:
+        try:
+            return await asyncio.to_thread(extract_metadata_hybrid, txt_path, api_key, stage1_model, verbose)
+        except Exception as e:
+            logger.error(f"파싱 실패: {txt_path} - {e}")
+            _print(f"❌ 실패: {txt_path} - {e}")
+            return None
+
+
+def extract_metadata_hybrid_files(
+    txt_paths: List[str],
+    api_key: str,
+    stage1_model: str = "gemini-2.5-pro",
+    max_concurrency: int = 4,
+    verbose: bool = True
+) -> List[Optional[Dict]]:
+    """
+    여러 txt/md 파일을 동시에 하이브리드 파싱
+
+    파일마다 수십 초 걸리는 1단계 Gemini 호출을 겹쳐 실행해
+    전체 소요 시간을 (파일별 시간 합) 대신 (가장 느린 파일 시간)에 가깝게 줄입니다.
+
+    Args:
+        txt_paths: txt/md 파일 경로 목록
+        api_key: Google API Key
+        stage1_model: 1단계 모델 (기본: gemini-2.5-pro)
+        max_concurrency: 동시 처리 파일 수 (Gemini API 호출 한도 고려, 기본: 4)
+        verbose: 상세 출력 여부 (기본: True)
+
+    Returns:
+        txt_paths와 같은 순서의 결과 리스트 (실패한 파일은 None)
+    """
+    async def run_all():
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return await asyncio.gather(*[
+            extract_metadata_hybrid_async(txt_path, api_key, semaphore, stage1_model, verbose)
+            for txt_path in txt_paths
+        ])
+
+    return asyncio.run(run_all())
+
+
 # ============================================================================
 # Gemini 2.5 Flash 전용 함수 (개선된 프롬프트 적용)
 # ============================================================================
 
+
 def extract_agenda_mapping_flash(
     txt_content: str,
     title: str,
@@ -964,11 +1482,18 @@ def extract_agenda_mapping_flash(
     api_key: str,
     attachments: List[Dict] = None,
     model: str = "gemini-2.5-flash",
-    max_retries: int = 3
+    max_retries: int = 3,
+    use_cache: bool = True,
+    prompt: Optional[str] = None,
+    before_request: Optional[Callable[[], None]] = None
 ) -> Dict:
     """
     1단계: Gemini Flash로 안건 라인 매핑 추출 (개선된 프롬프트)
 
+    같은 입력으로 이미 추출한 결과가 있으면 STAGE1_CACHE_DIR의 캐시를 사용하고
+    API를 호출하지 않습니다 (토큰 0으로 반환). line range가 겹치는 결과는
+    extract_metadata_hybrid_flash()가 재요청해야 하므로 캐시하지 않습니다.
+
     Args:
         txt_content: 회의록 텍스트
         title: 회의록 제목
@@ -977,6 +1502,9 @@ def extract_agenda_mapping_flash(
         attachments: 첨부 문서 목록 [{"title": "...", "url": "..."}]
         model: 사용할 모델 (기본: gemini-2.5-flash)
         max_retries: 최대 재시도 횟수 (기본: 3)
+        use_cache: 응답 캐시 사용 여부 (기본: True)
+        prompt: 미리 생성한 프롬프트 (없으면 캐시 확인 후 생성)
+        before_request: API 호출(재시도 포함) 직전마다 호출할 함수 (예: 요청 속도 제한, 캐시 사용 시 호출 안 됨)
 
     Returns:
         {
@@ -998,68 +1526,51 @@ def extract_agenda_mapping_flash(
         }
     """
     logger.info("1단계: 안건 라인 매핑 추출 시작 (Flash)")
-    print("=" * 80)
-    print("1단계: 안건 라인 매핑 추출 (Gemini 2.5 Flash - 개선된 프롬프트)")
-    print("=" * 80)
-    print()
-
-    # 재시도 로직
+    _print("=" * 80)
+    _print("1단계: 안건 라인 매핑 추출 (Gemini 2.5 Flash - 개선된 프롬프트)")
+    _print("=" * 80)
+    _print()
+
+    cache_path = _stage1_cache_path(
+        txt_content, title, url, attachments, model, STAGE1_FLASH_PROMPT_VERSION
+    ) if use_cache else None
+    if cache_path is not None and cache_path.exists():
+        result = orjson.loads(cache_path.read_bytes())
+        logger.info(f"1단계 캐시 사용 (Flash): {cache_path}")
+        _print(f"💾 캐시된 안건 매핑 사용: {len(result['agenda_mapping'])}개 ({cache_path.name})")
+        _print()
+        return result, {"input": 0, "output": 0}
+
+    # 프롬프트는 재시도마다 다시 만들지 않고 한 번만 생성
+    if prompt is None:
+        prompt = _render_stage1_prompt(txt_content, title, url, attachments, _STAGE1_FLASH_PROMPT_TEMPLATE)
+
+    # 재시도 로직 (일시적 오류만 지수 백오프로 재시도)
     for attempt in range(1, max_retries + 1):
         try:
             if attempt > 1:
-                print(f"🔄 재시도 {attempt}/{max_retries}...")
+                _print(f"🔄 재시도 {attempt}/{max_retries}...")
                 logger.info(f"재시도 {attempt}/{max_retries}")
 
+            if before_request is not None:
+                before_request()
+
             result, tokens = _extract_agenda_mapping_flash_once(
-                txt_content, title, url, api_key, attachments, model
+                txt_content, title, url, api_key, attachments, model, prompt=prompt
             )
-            return result, tokens
 
-        except json.JSONDecodeError as e:
-            if attempt < max_retries:
-                print(f"⚠️  JSON 파싱 실패 (시도 {attempt}/{max_retries}): {e}")
-                print(f"   재시도합니다...")
-                logger.warning(f"JSON 파싱 실패 (시도 {attempt}/{max_retries}): {e}")
-                continue
-            else:
-                print(f"❌ 최대 재시도 횟수 ({max_retries}회) 도달, 실패")
-                logger.error(f"최대 재시도 횟수 도달: {e}")
-                raise
-        except Exception as e:
-            # JSON 파싱 외 다른 에러는 재시도 없이 바로 raise
-            raise
-
-
-def _extract_agenda_mapping_flash_once(
-    txt_content: str,
-    title: str,
-    url: str,
-    api_key: str,
-    attachments: List[Dict] = None,
-    model: str = "gemini-2.5-flash"
-) -> Dict:
-    """
-    1단계: Gemini Flash로 안건 라인 매핑 추출 (단일 시도)
+            if cache_path is not None and not _find_line_overlaps(result.get('agenda_mapping', [])):
+                _write_stage1_cache(cache_path, result)
 
-    재시도 로직 없이 한 번만 실행하는 내부 함수
-    """
+            return result, tokens
 
-    client = genai.Client(api_key=api_key)
+        except Exception as e:
+            _wait_before_retry(e, attempt, max_retries)
 
-    # 라인 번호 추가
-    lines = txt_content.split('\n')
-    numbered_text = ""
-    for i, line in enumerate(lines, 1):
-        numbered_text += f"{i:4d} | {line}\n"
 
-    # 첨부 문서 정보를 텍스트로 변환 (Gemini에게 전달)
-    attachments_text = ""
-    if attachments:
-        attachments_text = "\n\n첨부 문서 목록:\n"
-        for idx, att in enumerate(attachments, 1):
-            attachments_text += f"{idx}. {att['title']} (URL: {att['url']})\n"
-
-    prompt = f"""다음은 서울시의회 회의록입니다. 이 회의록을 분석하여 안건별 라인 번호 매핑을 추출해주세요.
+# 1단계 Flash용 프롬프트 템플릿 (개선된 프롬프트)
+# 수정 시 STAGE1_FLASH_PROMPT_VERSION을 올려 캐시 무효화
+_STAGE1_FLASH_PROMPT_TEMPLATE = """다음은 서울시의회 회의록입니다. 이 회의록을 분석하여 안건별 라인 번호 매핑을 추출해주세요.
 
 회의록 제목: {title}
 회의록 URL: {url}
@@ -1200,64 +1711,86 @@ JSON 출력 형식:
 - status는 회의록에서 추출한 실제 처리 상태 (없으면 "접수")
 """
 
+
+def _extract_agenda_mapping_flash_once(
+    txt_content: str,
+    title: str,
+    url: str,
+    api_key: str,
+    attachments: List[Dict] = None,
+    model: str = "gemini-2.5-flash",
+    prompt: Optional[str] = None
+) -> Dict:
+    """
+    1단계: Gemini Flash로 안건 라인 매핑 추출 (단일 시도)
+
+    재시도 로직 없이 한 번만 실행하는 내부 함수
+    (prompt를 넘기면 그대로 사용, 없으면 입력으로부터 생성)
+    """
+
+    client = _get_client(api_key)
+
+    if prompt is None:
+        prompt = _render_stage1_prompt(txt_content, title, url, attachments, _STAGE1_FLASH_PROMPT_TEMPLATE)
+
+    # 스트리밍으로 호출해 응답 조각을 도착하는 대로 모음
+    # (전체 응답을 한 번에 기다리지 않아 긴 응답에서도 연결이 유휴 상태로 끊기지 않음)
+    text_parts = []
+    finish_reason = None
+    usage_metadata = None
+    prompt_feedback = None
+
     try:
-        response = client.models.generate_content(
+        for chunk in client.models.generate_content_stream(
             model=model,
             contents=prompt,
             config=types.GenerateContentConfig(
                 temperature=0.1,
                 response_mime_type="application/json",
             )
-        )
+        ):
+            if chunk.candidates:
+                candidate = chunk.candidates[0]
+                if candidate.content and candidate.content.parts:
+                    text_parts.extend(
+                        part.text for part in candidate.content.parts
+                        if part.text and not getattr(part, 'thought', False)
+                    )
+                finish_reason = getattr(candidate, 'finish_reason', None) or finish_reason
+            if chunk.usage_metadata:
+                usage_metadata = chunk.usage_metadata
+            if getattr(chunk, 'prompt_feedback', None):
+                prompt_feedback = chunk.prompt_feedback
     except Exception as e:
         error_msg = f"Gemini API 호출 실패: {e}"
-        print(f"❌ {error_msg}")
+        _print(f"❌ {error_msg}")
         logger.error(error_msg)
         import traceback
         traceback.print_exc()
         raise
 
     # finish_reason 확인 (디버깅)
-    if response.candidates and len(response.candidates) > 0:
-        finish_reason = getattr(response.candidates[0], 'finish_reason', None)
-        if finish_reason:
-            print(f"🔍 Finish Reason: {finish_reason}")
-            if finish_reason not in ['STOP', 1]:  # STOP = 정상 완료
-                print(f"⚠️  응답이 비정상적으로 종료됨: {finish_reason}")
+    if finish_reason:
+        _print(f"🔍 Finish Reason: {finish_reason}")
+        if finish_reason not in ['STOP', 1]:  # STOP = 정상 완료
+            _print(f"⚠️  응답이 비정상적으로 종료됨: {finish_reason}")
 
-    response_text = None
-    try:
-        response_text = response.text
-    except Exception as e:
-        print(f"❌ response.text 추출 실패: {e}")
-        logger.error(f"response.text 추출 실패: {e}")
-
-    if not response_text:
-        print("⚠️  response.text가 비어있음, candidates에서 추출 시도...")
-        if response.candidates and len(response.candidates) > 0:
-            candidate = response.candidates[0]
-            if hasattr(candidate, 'content') and candidate.content:
-                if hasattr(candidate.content, 'parts') and candidate.content.parts:
-                    if len(candidate.content.parts) > 0:
-                        part = candidate.content.parts[0]
-                        if hasattr(part, 'text'):
-                            response_text = part.text
-                            print(f"✅ candidates에서 추출 성공 (길이: {len(response_text)})")
+    response_text = ''.join(text_parts)
 
     if not response_text:
         error_msg = "Gemini 응답이 비어있습니다"
-        print(f"❌ {error_msg}")
-        print(f"   Response: {response}")
-        if hasattr(response, 'prompt_feedback'):
-            print(f"   Prompt Feedback: {response.prompt_feedback}")
+        _print(f"❌ {error_msg}")
+        if prompt_feedback:
+            _print(f"   Prompt Feedback: {prompt_feedback}")
         logger.error(error_msg)
         raise Exception(error_msg)
 
     try:
-        result = json.loads(response_text)
+        # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스라 재시도 로직 그대로 동작
+        result = orjson.loads(response_text)
     except json.JSONDecodeError as e:
-        print(f"❌ JSON 파싱 에러: {e}")
-        print(f"   Response text (처음 500자): {response_text[:500]}")
+        _print(f"❌ JSON 파싱 에러: {e}")
+        _print(f"   Response text (처음 500자): {response_text[:500]}")
 
         # 전체 응답을 파일로 저장
         error_log_dir = Path("logs/gemini_errors")
@@ -1273,29 +1806,119 @@ JSON 출력 형식:
             f.write(f"모델: {model}\n")
             f.write(f"\n=== Gemini 응답 전문 ===\n")
             f.write(response_text)
-        print(f"   전체 응답 저장: {error_file}")
+        _print(f"   전체 응답 저장: {error_file}")
 
         logger.error(f"JSON 파싱 에러: {e}")
         raise
 
-    # 토큰 정보
+    # 토큰 정보 (스트리밍에서는 마지막 조각에 누적 사용량이 담김)
     tokens = {"input": 0, "output": 0}
-    if hasattr(response, 'usage_metadata'):
-        tokens["input"] = getattr(response.usage_metadata, 'prompt_token_count', 0)
-        tokens["output"] = getattr(response.usage_metadata, 'candidates_token_count', 0)
+    if usage_metadata:
+        tokens["input"] = getattr(usage_metadata, 'prompt_token_count', 0)
+        tokens["output"] = getattr(usage_metadata, 'candidates_token_count', 0)
 
     logger.info(f"1단계 완료 (Flash): {len(result['agenda_mapping'])}개 안건, 토큰={tokens['input']}+{tokens['output']}")
-    print(f"✅ 안건 매핑 추출 완료 (Flash): {len(result['agenda_mapping'])}개")
-    print(f"📊 토큰: input={tokens['input']:,}, output={tokens['output']:,}")
-    print()
+    _print(f"✅ 안건 매핑 추출 완료 (Flash): {len(result['agenda_mapping'])}개")
+    _print(f"📊 토큰: input={tokens['input']:,}, output={tokens['output']:,}")
+    _print()
 
     return result, tokens
 
 
+def _find_line_overlaps(agendas: List[Dict]) -> List[Dict]:
+    """
+    1단계 결과에서 line range가 5줄 넘게 겹치는 안건 쌍 찾기
+
+    line_start 순으로 정렬한 뒤, 각 안건은 시작 라인이 (자신의 끝 - 5)보다 앞선
+    뒤쪽 안건들과만 비교합니다 (그 이후 안건은 5줄 넘게 겹칠 수 없음).
+    중첩된 안건도 빠짐없이 찾고, 결과 순서는 원래 안건 순서를 따릅니다.
+
+    Returns:
+        [{"agenda1_title", "range1", "agenda2_title", "range2", "overlap"}] (겹침 없으면 빈 리스트)
+    """
+    ranges = [(agenda.get('line_start', 0), agenda.get('line_end', 0)) for agenda in agendas]
+    order = sorted(range(len(agendas)), key=lambda idx: ranges[idx][0])
+
+    overlap_pairs = []
+    for pos, i in enumerate(order):
+        end1 = ranges[i][1]
+        for j in order[pos + 1:]:
+            start2, end2 = ranges[j]
+            # 시작 라인 순이므로 이후 안건은 겹침이 5줄을 넘을 수 없음
+            if end1 - start2 <= 5:
+                break
+
+            # 겹침 계산 (5줄 이상 겹치면 문제)
+            overlap = min(end1, end2) - start2
+            if overlap > 5:
+                overlap_pairs.append((min(i, j), max(i, j), overlap))
+
+    overlap_details = []
+    for i, j, overlap in sorted(overlap_pairs):
+        start1, end1 = ranges[i]
+        start2, end2 = ranges[j]
+        overlap_details.append({
+            'agenda1_title': agendas[i].get('agenda_title', '(제목없음)')[:40],
+            'range1': f"{start1}-{end1}",
+            'agenda2_title': agendas[j].get('agenda_title', '(제목없음)')[:40],
+            'range2': f"{start2}-{end2}",
+            'overlap': overlap
+        })
+
+    return overlap_details
+
+
+def _finish_hybrid_flash(
+    txt_path: str,
+    txt_content: str,
+    stage1_result: Dict,
+    tokens: Dict,
+    verbose: bool = True
+) -> Dict:
+    """
+    Flash 1단계 결과 저장 + 2단계(순수 코드) 발언 추출 후 최종 결과 생성
+
+    단건(extract_metadata_hybrid_flash)과 Batch API 경로가 함께 사용합니다.
+    """
+    # 1단계 결과 저장 (디버깅용)
+    _save_stage1_debug(Path("data/result_txt_gemini_flash") / (Path(txt_path).stem + "_stage1_flash.json"), stage1_result)
+
+    # 2단계: 발언 추출 (순수 코드)
+    with _quiet_output(not verbose):
+        chunks = parse_with_pure_code(txt_content, stage1_result['agenda_mapping'])
+
+    # 최종 결과 (agenda_mapping 포함 - attachments는 빈 배열)
+    final_result = {
+        "meeting_info": stage1_result['meeting_info'],
+        "agenda_mapping": stage1_result['agenda_mapping'],  # ⭐ 추가: 안건 매핑 (Flash)
+        "chunks": chunks,
+        "usage": {
+            "stage1_model": "gemini-2.5-flash",
+            "stage2_method": "pure_python_code",
+            "stage1_tokens": tokens,
+            "total_chunks": len(chunks)
+        }
+    }
+
+    logger.info(f"하이브리드 파싱 완료 (Flash): {len(chunks)}개 발언")
+
+    if verbose:
+        _print("=" * 100)
+        _print("✅ 하이브리드 파싱 완료 (Flash)!")
+        _print("=" * 100)
+        _print(f"총 발언 수: {len(chunks)}개")
+        _print(f"Stage 1 토큰: {tokens['input']:,} + {tokens['output']:,}")
+        _print(f"Stage 2 방식: 순수 Python 코드 (비용 0원)")
+        _print()
+
+    return final_result
+
+
 def extract_metadata_hybrid_flash(
     txt_path: str,
     api_key: str,
-    verbose: bool = True
+    verbose: bool = True,
+    before_request: Optional[Callable[[], None]] = None
 ) -> Dict:
     """
     하이브리드 파싱 (Flash 전용): 1단계 Gemini Flash + 2단계 순수 코드 (txt/md 파일 기반)
@@ -1309,6 +1932,7 @@ def extract_metadata_hybrid_flash(
         txt_path: txt/md 파일 경로
         api_key: Google API Key
         verbose: 상세 출력 여부 (기본: True)
+        before_request: 1단계 API 호출 직전마다 호출할 함수 (예: 요청 속도 제한)
 
     Returns:
         {
@@ -1321,177 +1945,247 @@ def extract_metadata_hybrid_flash(
     logger.info(f"하이브리드 파싱 시작 (Flash): {txt_path}")
 
     if verbose:
-        print("=" * 100)
-        print("하이브리드 파싱 (Flash): 1단계 Gemini Flash + 2단계 순수 코드")
-        print("=" * 100)
-        print()
-
-    # txt/md 파일 읽기
-    with open(txt_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+        _print("=" * 100)
+        _print("하이브리드 파싱 (Flash): 1단계 Gemini Flash + 2단계 순수 코드")
+        _print("=" * 100)
+        _print()
 
-    # 헤더에서 메타데이터 추출 (TXT와 MD 둘 다 지원)
-    lines_raw = content.split('\n')
-
-    # 제목 추출
-    if lines_raw and lines_raw[0].startswith('# '):
-        # MD 형식: # 제목
-        title = lines_raw[0].replace('# ', '').strip()
-    elif lines_raw and lines_raw[0].startswith('제목: '):
-        # TXT 형식: 제목: xxx
-        title = lines_raw[0].replace('제목: ', '').strip()
-    else:
-        title = ""
-
-    # URL 추출
-    url = ""
-    for line in lines_raw[:10]:  # 첫 10줄에서 URL 찾기
-        if line.startswith('**URL**:'):
-            # MD 형식: **URL**: https://...
-            url = line.replace('**URL**:', '').strip()
-            break
-        elif line.startswith('URL: '):
-            # TXT 형식: URL: https://...
-            url = line.replace('URL: ', '').strip()
-            break
-
-    # 본문만 추출 (구분선 이후 또는 크롤링 시간 이후)
-    separator_index = content.find('=' * 80)
-    if separator_index != -1:
-        txt_content = content[separator_index + 80:].strip()
-    else:
-        # MD 파일의 경우 크롤링 시간 이후부터
-        crawl_time_index = content.find('**크롤링 시간**:')
-        if crawl_time_index != -1:
-            # 다음 줄부터 시작
-            remaining = content[crawl_time_index:]
-            next_line = remaining.find('\n')
-            if next_line != -1:
-                txt_content = remaining[next_line + 1:].strip()
-            else:
-                txt_content = content
-        else:
-            txt_content = content
+    # txt/md 파일에서 제목/URL/본문 추출
+    title, url, txt_content = _read_meeting_file(txt_path)
 
     if verbose:
-        print(f"📄 파일: {txt_path}")
-        print(f"📝 제목: {title}")
-        print(f"📏 크기: {len(txt_content):,} bytes")
-        print()
+        _print(f"📄 파일: {txt_path}")
+        _print(f"📝 제목: {title}")
+        _print(f"📏 크기: {len(txt_content):,} bytes")
+        _print()
 
     # 1단계: 안건 매핑 추출 (Gemini Flash - 개선된 프롬프트) with 재시도
-    import sys
-    from io import StringIO
-    old_stdout = sys.stdout
-
     max_retries = 3
     stage1_result = None
     tokens = {"input": 0, "output": 0}
+    prompt = None  # 중복 line range 재시도에서 같은 프롬프트 재사용
 
     for attempt in range(max_retries + 1):
-        if not verbose:
-            sys.stdout = StringIO()
+        if attempt > 0 and prompt is None:
+            prompt = _render_stage1_prompt(txt_content, title, url, [], _STAGE1_FLASH_PROMPT_TEMPLATE)
 
         # txt에서 attachments는 추출할 수 없으므로 빈 리스트 전달
-        stage1_result, tokens = extract_agenda_mapping_flash(txt_content, title, url, api_key, [])
-
-        if not verbose:
-            sys.stdout = old_stdout
+        with _quiet_output(not verbose):
+            stage1_result, tokens = extract_agenda_mapping_flash(
+                txt_content, title, url, api_key, [], prompt=prompt, before_request=before_request
+            )
 
         # 중복 line range 검증
-        has_overlap = False
-        overlap_details = []
-        agendas = stage1_result.get('agenda_mapping', [])
-
-        for i in range(len(agendas)):
-            for j in range(i + 1, len(agendas)):
-                agenda1 = agendas[i]
-                agenda2 = agendas[j]
-
-                start1 = agenda1.get('line_start', 0)
-                end1 = agenda1.get('line_end', 0)
-                start2 = agenda2.get('line_start', 0)
-                end2 = agenda2.get('line_end', 0)
-
-                # 겹침 계산 (5줄 이상 겹치면 문제)
-                overlap_start = max(start1, start2)
-                overlap_end = min(end1, end2)
-                overlap = max(0, overlap_end - overlap_start)
-
-                if overlap > 5:
-                    has_overlap = True
-                    overlap_details.append({
-                        'agenda1_title': agenda1.get('agenda_title', '(제목없음)')[:40],
-                        'range1': f"{start1}-{end1}",
-                        'agenda2_title': agenda2.get('agenda_title', '(제목없음)')[:40],
-                        'range2': f"{start2}-{end2}",
-                        'overlap': overlap
-                    })
+        overlap_details = _find_line_overlaps(stage1_result.get('agenda_mapping', []))
+        has_overlap = bool(overlap_details)
 
         if not has_overlap:
             if verbose and attempt > 0:
-                print(f"✅ 재시도 성공 (시도 {attempt + 1}): 중복 line range 해결됨")
+                _print(f"✅ 재시도 성공 (시도 {attempt + 1}): 중복 line range 해결됨")
             break
         else:
             if attempt < max_retries:
                 if verbose:
-                    print(f"⚠️  시도 {attempt + 1}: 중복 line range 발견 ({len(overlap_details)}개)")
+                    _print(f"⚠️  시도 {attempt + 1}: 중복 line range 발견 ({len(overlap_details)}개)")
                     for detail in overlap_details[:3]:
-                        print(f"   - {detail['agenda1_title']} ({detail['range1']}) ↔ {detail['agenda2_title']} ({detail['range2']}) | 겹침: {detail['overlap']}줄")
-                    print(f"🔄 Stage 1 재시도 중...")
+                        _print(f"   - {detail['agenda1_title']} ({detail['range1']}) ↔ {detail['agenda2_title']} ({detail['range2']}) | 겹침: {detail['overlap']}줄")
+                    _print(f"🔄 Stage 1 재시도 중...")
                 logger.warning(f"중복 line range 발견, 재시도 {attempt + 1}/{max_retries}")
             else:
                 if verbose:
-                    print(f"❌ 최대 재시도 횟수 초과: 중복 line range가 여전히 존재함 ({len(overlap_details)}개)")
-                    print(f"   계속 진행하지만 결과에 문제가 있을 수 있습니다.")
+                    _print(f"❌ 최대 재시도 횟수 초과: 중복 line range가 여전히 존재함 ({len(overlap_details)}개)")
+                    _print(f"   계속 진행하지만 결과에 문제가 있을 수 있습니다.")
                 logger.error(f"중복 line range 해결 실패 (최대 재시도 초과)")
 
-    if not verbose:
-        sys.stdout = old_stdout
+    return _finish_hybrid_flash(txt_path, txt_content, stage1_result, tokens, verbose)
 
-    # 1단계 결과 저장 (디버깅용)
-    stage1_dir = Path("data/result_txt_gemini_flash")
-    stage1_dir.mkdir(parents=True, exist_ok=True)
-    stage1_filename = Path(txt_path).stem + "_stage1_flash.json"
-    stage1_path = stage1_dir / stage1_filename
-    with open(stage1_path, 'w', encoding='utf-8') as f:
-        json.dump(stage1_result, f, ensure_ascii=False, indent=2)
-    logger.info(f"1단계 결과 저장 (Flash): {stage1_path}")
 
-    # 2단계: 발언 추출 (순수 코드)
-    if not verbose:
-        sys.stdout = StringIO()
+def _batch_response_to_stage1(line: Dict) -> tuple:
+    """
+    Batch API 결과 파일의 한 줄을 (1단계 결과, 토큰)으로 변환
 
-    chunks = parse_with_pure_code(txt_content, stage1_result['agenda_mapping'])
+    Raises:
+        오류 응답이거나 응답 JSON 파싱에 실패하면 예외
+    """
+    if line.get('error'):
+        raise Exception(f"Batch 요청 실패: {line['error']}")
+
+    response = line['response']
+    response_text = response['candidates'][0]['content']['parts'][0]['text']
+    result = orjson.loads(response_text)
+    if 'agenda_mapping' not in result:
+        raise Exception("응답에 agenda_mapping이 없습니다")
+
+    usage = response.get('usageMetadata', {})
+    tokens = {
+        "input": usage.get('promptTokenCount', 0),
+        "output": usage.get('candidatesTokenCount', 0)
+    }
+    return result, tokens
 
-    if not verbose:
-        sys.stdout = old_stdout
 
-    # 최종 결과 (agenda_mapping 포함 - attachments는 빈 배열)
-    final_result = {
-        "meeting_info": stage1_result['meeting_info'],
-        "agenda_mapping": stage1_result['agenda_mapping'],  # ⭐ 추가: 안건 매핑 (Flash)
-        "chunks": chunks,
-        "usage": {
-            "stage1_model": "gemini-2.5-flash",
-            "stage2_method": "pure_python_code",
-            "stage1_tokens": tokens,
-            "total_chunks": len(chunks)
-        }
-    }
+def extract_metadata_hybrid_flash_batch(
+    txt_paths: List[str],
+    api_key: str,
+    model: str = "gemini-2.5-flash",
+    poll_interval: int = BATCH_POLL_INTERVAL,
+    verbose: bool = True
+) -> List[Optional[Dict]]:
+    """
+    하이브리드 파싱 (Flash, 대량 처리): 1단계를 Gemini Batch API로 한 번에 제출
 
-    logger.info(f"하이브리드 파싱 완료 (Flash): {len(chunks)}개 발언")
+    모든 회의록의 1단계 프롬프트를 로컬에서 만들어 JSONL({"key", "request"})로 업로드하고
+    batch job 하나로 처리합니다 (동기 호출 대비 비용 50%, 요청별 대기 없음).
+    job이 끝나면 결과 파일을 줄 단위로 읽어 2단계(순수 코드)로 넘깁니다.
+    1단계 캐시(STAGE1_CACHE_DIR)에 있는 회의록은 batch 요청에서 제외합니다.
 
-    if verbose:
-        print("=" * 100)
-        print("✅ 하이브리드 파싱 완료 (Flash)!")
-        print("=" * 100)
-        print(f"총 발언 수: {len(chunks)}개")
-        print(f"Stage 1 토큰: {tokens['input']:,} + {tokens['output']:,}")
-        print(f"Stage 2 방식: 순수 Python 코드 (비용 0원)")
-        print()
+    Batch 응답이 실패했거나, JSON이 깨졌거나, line range 중복이 있는 회의록은
+    기존 단건 경로(extract_metadata_hybrid_flash, 재시도 포함)로 다시 처리합니다.
+    대화형 단건 처리에는 extract_metadata_hybrid_flash()를 그대로 사용하세요.
 
-    return final_result
+    Args:
+        txt_paths: txt/md 파일 경로 목록
+        api_key: Google API Key
+        model: 1단계 모델 (기본: gemini-2.5-flash)
+        poll_interval: job 상태 확인 간격 (초)
+        verbose: 상세 출력 여부 (기본: True)
+
+    Returns:
+        txt_paths와 같은 순서의 결과 리스트 (실패한 파일은 None)
+    """
+    logger.info(f"Batch 하이브리드 파싱 시작 (Flash): {len(txt_paths)}건")
+    _print("=" * 100)
+    _print(f"하이브리드 파싱 (Flash Batch API): {len(txt_paths)}건")
+    _print("=" * 100)
+    _print()
+
+    # 1) 1단계: 캐시에 있는 회의록은 제외하고 나머지만 batch job으로 처리
+    meetings = [_read_meeting_file(txt_path) for txt_path in txt_paths]
+
+    stage1_results = {}
+    cache_paths = {}
+    for idx, (title, url, txt_content) in enumerate(meetings):
+        cache_path = _stage1_cache_path(
+            txt_content, title, url, [], model, STAGE1_FLASH_PROMPT_VERSION
+        )
+        if cache_path.exists():
+            stage1_results[idx] = (orjson.loads(cache_path.read_bytes()), {"input": 0, "output": 0})
+        else:
+            cache_paths[idx] = cache_path
+
+    if stage1_results:
+        _print(f"💾 캐시된 안건 매핑 사용: {len(stage1_results)}건")
+
+    if cache_paths:
+        _run_stage1_flash_batch(
+            meetings, cache_paths, stage1_results, txt_paths, api_key, model, poll_interval
+        )
+
+    # 2) 2단계 (실패/중복 회의록은 단건 경로로 재처리)
+    results = []
+    for idx, txt_path in enumerate(txt_paths):
+        title, url, txt_content = meetings[idx]
+        stage1 = stage1_results.get(idx)
+
+        if stage1 is not None and _find_line_overlaps(stage1[0].get('agenda_mapping', [])):
+            logger.warning(f"Batch 결과에 중복 line range, 단건 재처리: {txt_path}")
+            stage1 = None
+
+        try:
+            if stage1 is not None:
+                stage1_result, tokens = stage1
+                results.append(_finish_hybrid_flash(txt_path, txt_content, stage1_result, tokens, verbose))
+            else:
+                results.append(extract_metadata_hybrid_flash(txt_path, api_key, verbose))
+        except Exception as e:
+            logger.error(f"파싱 실패: {txt_path} - {e}")
+            _print(f"❌ 실패: {txt_path} - {e}")
+            results.append(None)
+
+    success_count = sum(1 for result in results if result is not None)
+    logger.info(f"Batch 하이브리드 파싱 완료 (Flash): 성공 {success_count}/{len(txt_paths)}")
+    _print(f"✅ Batch 파싱 완료: 성공 {success_count}/{len(txt_paths)}건")
+    _print()
+
+    return results
+
+
+def _run_stage1_flash_batch(
+    meetings: List[tuple],
+    cache_paths: Dict[int, Path],
+    stage1_results: Dict[int, tuple],
+    txt_paths: List[str],
+    api_key: str,
+    model: str,
+    poll_interval: int
+) -> None:
+    """
+    캐시에 없는 회의록(cache_paths의 인덱스)만 Batch API로 1단계 처리
+
+    성공한 결과는 stage1_results[idx] = (result, tokens)로 채우고,
+    line range 중복이 없으면 캐시에 저장합니다.
+    """
+    batch_dir = Path("data/result_txt_gemini_flash/batch")
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    requests_path = batch_dir / f"stage1_requests_{timestamp}.jsonl"
+
+    with open(requests_path, 'wb') as f:
+        for idx in cache_paths:
+            title, url, txt_content = meetings[idx]
+            # txt에서 attachments는 추출할 수 없으므로 빈 리스트 전달
+            prompt = _render_stage1_prompt(txt_content, title, url, [], _STAGE1_FLASH_PROMPT_TEMPLATE)
+            f.write(orjson.dumps({
+                "key": str(idx),
+                "request": {
+                    "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                    "generationConfig": {
+                        "temperature": 0.1,
+                        "responseMimeType": "application/json"
+                    }
+                }
+            }))
+            f.write(b'\n')
+
+    _print(f"📝 요청 파일 생성: {requests_path} ({len(cache_paths)}건)")
+
+    # 업로드 + batch job 생성 후 완료까지 대기
+    try:
+        result_bytes = submit_batch_and_wait(
+            _get_client(api_key),
+            requests_path,
+            model=model,
+            display_name=f"seoul-log-stage1-{timestamp}",
+            poll_interval=poll_interval,
+            log=_print
+        )
+    except RuntimeError as e:
+        # 실패한 회의록은 호출 측에서 단건으로 재처리
+        logger.warning(str(e))
+        _print(f"⚠️  {e}")
+        _print()
+        return
+
+    logger.info("Batch job 종료: JOB_STATE_SUCCEEDED")
+    _print("🏁 Batch 종료: JOB_STATE_SUCCEEDED")
+    _print()
+
+    # 결과 파일을 줄 단위로 읽어 회의록별 1단계 결과로 변환
+    for raw_line in result_bytes.splitlines():
+        if not raw_line.strip():
+            continue
+        line = orjson.loads(raw_line)
+        idx = int(line['key'])
+        try:
+            stage1_results[idx] = _batch_response_to_stage1(line)
+        except Exception as e:
+            logger.warning(f"Batch 결과 처리 실패: {txt_paths[idx]} - {e}")
+            _print(f"⚠️  Batch 결과 처리 실패, 단건 재처리 예정: {txt_paths[idx]} - {e}")
+            continue
+
+        result = stage1_results[idx][0]
+        if not _find_line_overlaps(result.get('agenda_mapping', [])):
+            _write_stage1_cache(cache_paths[idx], result)
 
 
 def main():
@@ -1524,54 +2218,50 @@ def main():
         print(f"{i}. {file.parent.name}")
     print()
 
+    # 3개 파일의 1단계 Gemini 호출을 동시에 실행
+    results = extract_metadata_hybrid_files(
+        [str(txt_path) for txt_path in selected_files],
+        api_key=api_key,
+        stage1_model="gemini-2.5-pro"
+    )
+
     success_count = 0
     fail_count = 0
 
-    for idx, txt_path in enumerate(selected_files, 1):
+    for idx, (txt_path, result) in enumerate(zip(selected_files, results), 1):
         print("=" * 100)
         print(f"[{idx}/3] {txt_path.parent.name}")
         print("=" * 100)
         print()
 
-        try:
-            result = extract_metadata_hybrid(
-                txt_path=str(txt_path),
-                api_key=api_key,
-                stage1_model="gemini-2.5-pro",
-                verbose=True
-            )
-
-            # 제목에서 안전한 파일명 생성
-            title = result['meeting_info']['title']
-            safe_title = title.replace('/', '_').replace('\\', '_').replace(':', '_').replace('*', '_').replace('?', '_').replace('"', '_').replace('<', '_').replace('>', '_').replace('|', '_')
+        if result is None:
+            fail_count += 1
+            continue
 
-            # 결과 저장 (test_{title}.json)
-            output_path = Path("test_results") / f"test_{safe_title}.json"
-            output_path.parent.mkdir(exist_ok=True)
+        # 제목에서 안전한 파일명 생성
+        title = result['meeting_info']['title']
+        safe_title = title.replace('/', '_').replace('\\', '_').replace(':', '_').replace('*', '_').replace('?', '_').replace('"', '_').replace('<', '_').replace('>', '_').replace('|', '_')
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+        # 결과 저장 (test_{title}.json)
+        output_path = Path("test_results") / f"test_{safe_title}.json"
+        output_path.parent.mkdir(exist_ok=True)
 
-            print(f"💾 결과 저장: {output_path}")
-            print()
+        _write_json_if_changed(output_path, result)
 
-            # 통계
-            speakers = set(chunk['speaker'] for chunk in result['chunks'])
-            agendas = set(chunk['agenda'] for chunk in result['chunks'])
+        print(f"💾 결과 저장: {output_path}")
+        print()
 
-            print("📊 통계")
-            print(f"  - 총 발언 수: {len(result['chunks'])}개")
-            print(f"  - 발언자: {len(speakers)}명")
-            print(f"  - 안건: {len(agendas)}개")
-            print()
+        # 통계
+        speakers = set(chunk['speaker'] for chunk in result['chunks'])
+        agendas = set(chunk['agenda'] for chunk in result['chunks'])
 
-            success_count += 1
+        print("📊 통계")
+        print(f"  - 총 발언 수: {len(result['chunks'])}개")
+        print(f"  - 발언자: {len(speakers)}명")
+        print(f"  - 안건: {len(agendas)}개")
+        print()
 
-        except Exception as e:
-            logger.error(f"파싱 실패: {txt_path} - {e}")
-            print(f"❌ 실패: {e}")
-            print()
-            fail_count += 1
+        success_count += 1
 
     # 최종 결과
     print("=" * 100)
@@ -7,11 +7,16 @@ gemini-2.5-flash 대신 순수 파이썬 코드로 발언 추출
     python parse_with_pure_code.py
 """
 
-import json
+import orjson
 import re
 from pathlib import Path
 from typing import List, Dict
 
+# 발언 라인마다 호출되므로 정규식은 모듈 로드 시 한 번만 컴파일
+# 발언자 라인: (발언자, 발언 내용) 또는 발언자만 (다음 줄부터 내용)
+_SPEAKER = re.compile(r'^○(?:\s*(.+?)\s{2,}(.+)|\s*(.+))$')
+_SENTENCE_END = re.compile(r'[.?!]\s+')  # 문장 끝 (구두점 + 공백)
+
 
 def parse_speaker_line(line: str) -> tuple:
     """
@@ -19,20 +24,29 @@ def parse_speaker_line(line: str) -> tuple:
 
     예: "○의장 최호정  안녕하세요." → ("의장 최호정", "안녕하세요.")
     """
-    # ○ 다음 공백 제거하고 파싱
-    match = re.match(r'^○\s*(.+?)\s{2,}(.+)$', line)
-    if match:
-        speaker = match.group(1).strip()
-        text = match.group(2).strip()
-        return speaker, text
+    # ○ 다음 공백 제거하고 파싱 (정규식 한 번으로 두 형태 모두 처리)
+    match = _SPEAKER.match(line)
+    if not match:
+        return None, None
+
+    speaker, text, speaker_only = match.groups()
 
     # 발언자만 있는 경우 (다음 줄부터 내용)
-    match = re.match(r'^○\s*(.+)$', line)
-    if match:
-        speaker = match.group(1).strip()
-        return speaker, ""
+    if speaker is None:
+        return speaker_only.strip(), ""
+
+    return speaker.strip(), text.strip()
+
 
-    return None, None
+def _iter_sentences(text: str):
+    """
+    문장 종결 부호(. ? !) + 공백 기준으로 문장을 앞에서부터 하나씩 생성 (종결 부호 포함, 뒤 공백 제외)
+    """
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        yield text[start:match.start() + 1]
+        start = match.end()
+    yield text[start:]
 
 
 def split_long_text(text: str, max_length: int = 500) -> List[str]:
@@ -49,17 +63,11 @@ def split_long_text(text: str, max_length: int = 500) -> List[str]:
     if len(text) <= max_length:
         return [text]
 
-    # 문장 단위로 분할
-    sentences = re.split(r'([.?!])\s+', text)
-
     chunks = []
     current_chunk = ""
 
-    for i in range(0, len(sentences), 2):
-        sentence = sentences[i]
-        if i + 1 < len(sentences):
-            sentence += sentences[i + 1]  # 마침표 추가
-
+    # 문장 단위로 순회 (문장 리스트를 만들지 않고 앞에서부터 한 번만 스캔)
+    for sentence in _iter_sentences(text):
         if len(current_chunk) + len(sentence) > max_length:
             if current_chunk:
                 chunks.append(current_chunk.strip())
@@ -96,8 +104,8 @@ def parse_section_pure(section_text: str, agenda_title: str, speakers: List[str]
         if not line:
             continue
 
-        # ○로 시작하는 발언자 라인인지 확인
-        if line.startswith('○'):
+        # ○로 시작하는 발언자 라인인지 확인 (나머지 라인은 정규식 없이 바로 누적)
+        if line[0] == '○':
             # 이전 발언 저장
             if current_speaker and current_text_lines:
                 full_text = ' '.join(current_text_lines).strip()
@@ -211,8 +219,7 @@ def main():
         print("먼저 test_agenda_extraction.py를 실행하세요.")
         return
 
-    with open(stage1_result_path, 'r', encoding='utf-8') as f:
-        stage1_result = json.load(f)
+    stage1_result = orjson.loads(Path(stage1_result_path).read_bytes())
 
     # txt 파일 경로
     txt_path = "result/제332회 기획경제위원회 제1차(2025.09.01)/meeting_20251119_113659.txt"
@@ -238,8 +245,7 @@ def main():
     }
 
     output_path = Path("test_results") / "pure_code_result.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(final_result, f, ensure_ascii=False, indent=2)
+    output_path.write_bytes(orjson.dumps(final_result, option=orjson.OPT_INDENT_2))
 
     print(f"💾 결과 저장: {output_path}")
     print()
@@ -5,11 +5,13 @@ result 폴더의 모든 md 파일을 JSON으로 변환 (하이브리드 방식 +
     python process_all_result_folders.py           # 전체 파일 처리
     python process_all_result_folders.py 10        # 랜덤 10개만 처리
     python process_all_result_folders.py 5         # 랜덤 5개만 처리
+    python process_all_result_folders.py --workers 20   # 동시 처리 파일 수 지정
 
 방식:
     - 1단계: Gemini 2.5 Flash (개선된 프롬프트)로 안건 매핑 추출 (md 파일 → 첨부 문서 URL 포함)
     - 2단계: 순수 Python 코드로 발언 추출 (빠르고 안정적)
-    - 병렬 처리: 10개 파일씩 동시 처리
+    - 병렬 처리: 기본 CPU 코어 수 × 5개 파일 동시 처리 (SEOULLOG_STAGE1_WORKERS 또는 --workers로 변경)
+    - 요청 속도 제한: 모델 RPM 한도의 80% 이하로 Gemini 호출 시작 (1단계 캐시 사용 시 대기 없음, SEOULLOG_STAGE1_RPM으로 변경)
 
 개선 사항:
     - Flash 전용 강화 프롬프트 적용 (의사일정 안건만 추출, 분할 방지, 정확한 line_start 등)
@@ -20,13 +22,14 @@ result 폴더의 모든 md 파일을 JSON으로 변환 (하이브리드 방식 +
 """
 
 import os
-import json
+import orjson
 import sys
 import random
 from pathlib import Path
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import atexit
 
 # 프로젝트 루트를 Python path에 추가 (Windows 환경 호환)
 current_dir = Path(__file__).parent
@@ -37,6 +40,7 @@ sys.path.insert(0, str(current_dir))
 # 하이브리드 파싱 함수 임포트
 from data_processing.extract_metadata_hybrid import extract_metadata_hybrid, extract_metadata_hybrid_flash
 from utils.cost_tracker import CostTracker
+from utils.rate_limiter import IntervalRateLimiter
 
 load_dotenv()
 
@@ -47,6 +51,51 @@ fail_count = 0
 failed_files = []
 cost_tracker = None
 
+# 1단계 동시 처리 파일 수 (Gemini 응답 대기가 대부분인 I/O 작업이라 코어 수보다 넉넉하게)
+STAGE1_WORKERS = int(os.getenv("SEOULLOG_STAGE1_WORKERS", (os.cpu_count() or 4) * 5))
+
+# 모델별 분당 요청 한도 (Tier 1 기준, SEOULLOG_STAGE1_RPM으로 덮어쓰기)
+STAGE1_RPM = {
+    "gemini-2.5-flash": 1000,
+    "gemini-2.5-pro": 150,
+}
+# 한도의 80%까지만 사용 (429 방지 여유분)
+STAGE1_RPM_HEADROOM = 0.8
+
+# 파일명에 쓸 수 없는 문자 → '_' (str.translate로 한 번에 치환)
+_SAFE_TITLE_TABLE = str.maketrans({c: '_' for c in '/\\:*?"<>|'})
+
+
+rate_limiter = None
+
+# 1단계 스레드 풀 (여러 번 호출돼도 재사용, 프로세스 종료 시 정리)
+_STAGE1_EXECUTOR = None
+_STAGE1_EXECUTOR_WORKERS = None
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    """max_workers 크기의 공유 스레드 풀 반환 (크기가 바뀌면 새로 생성)"""
+    global _STAGE1_EXECUTOR, _STAGE1_EXECUTOR_WORKERS
+
+    if _STAGE1_EXECUTOR is None or _STAGE1_EXECUTOR_WORKERS != max_workers:
+        reset_executor()
+        _STAGE1_EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stage1")
+        _STAGE1_EXECUTOR_WORKERS = max_workers
+    return _STAGE1_EXECUTOR
+
+
+def reset_executor():
+    """공유 스레드 풀 종료 (다음 호출 시 새로 생성)"""
+    global _STAGE1_EXECUTOR, _STAGE1_EXECUTOR_WORKERS
+
+    if _STAGE1_EXECUTOR is not None:
+        _STAGE1_EXECUTOR.shutdown(wait=True)
+    _STAGE1_EXECUTOR = None
+    _STAGE1_EXECUTOR_WORKERS = None
+
+
+atexit.register(reset_executor)
+
 
 def process_single_file(txt_file: Path, api_key: str, total: int, idx: int, use_pro: bool = False) -> dict:
     """단일 md 파일 처리 (파라미터명은 txt_file이지만 실제로는 md 파일을 처리)
@@ -72,28 +121,29 @@ def process_single_file(txt_file: Path, api_key: str, total: int, idx: int, use_
                 txt_path=str(txt_file),
                 api_key=api_key,
                 stage1_model="gemini-2.5-pro",
-                verbose=False
+                verbose=False,
+                before_request=rate_limiter.wait if rate_limiter is not None else None
             )
         else:
             # Flash 모델 사용 (개선된 프롬프트)
             result = extract_metadata_hybrid_flash(
                 txt_path=str(txt_file),
                 api_key=api_key,
-                verbose=False
+                verbose=False,
+                before_request=rate_limiter.wait if rate_limiter is not None else None
             )
 
         # 제목을 파일명으로 사용 (특수문자 제거)
         title = result['meeting_info']['title']
-        safe_title = title.replace('/', '_').replace('\\', '_').replace(':', '_').replace('*', '_').replace('?', '_').replace('"', '_').replace('<', '_').replace('>', '_').replace('|', '_')
+        safe_title = title.translate(_SAFE_TITLE_TABLE)
 
         # data/result_txt/ 경로에만 저장
         result_txt_dir = Path("data/result_txt")
         result_txt_dir.mkdir(parents=True, exist_ok=True)
         json_output_path = result_txt_dir / f"{safe_title}.json"
 
-        # JSON 저장
-        with open(json_output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        # JSON 저장 (orjson: 한글이 많은 결과도 빠르게 직렬화)
+        json_output_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
 
         # 비용 추적 (토큰 정보 추출)
         usage = result.get('usage', {})
@@ -144,12 +194,13 @@ def process_single_file(txt_file: Path, api_key: str, total: int, idx: int, use_
         return {'status': 'failed', 'file': folder_name, 'error': str(e)}
 
 
-def process_all_txt_files(n_files: int = None, use_pro: bool = False):
-    """result 폴더의 모든 md 파일 처리 (10개씩 병렬)
+def process_all_txt_files(n_files: int = None, use_pro: bool = False, max_workers: int = None):
+    """result 폴더의 모든 md 파일 처리 (max_workers개씩 병렬)
 
     Args:
         n_files: 처리할 파일 개수 (None이면 전체, 숫자면 랜덤 선택)
         use_pro: True이면 gemini-2.5-pro 사용, False이면 gemini-2.5-flash 사용
+        max_workers: 동시 처리 파일 수 (None이면 STAGE1_WORKERS)
 
     Returns:
         CostTracker: 비용 추적 객체
@@ -159,7 +210,7 @@ def process_all_txt_files(n_files: int = None, use_pro: bool = False):
         - Flash: 개선된 프롬프트 적용 (의사일정 안건만, 분할 방지, 정확한 line_start)
         - Pro: 기존 프롬프트 사용
     """
-    global success_count, fail_count, failed_files, cost_tracker
+    global success_count, fail_count, failed_files, cost_tracker, rate_limiter
 
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
@@ -183,12 +234,17 @@ def process_all_txt_files(n_files: int = None, use_pro: bool = False):
     else:
         md_files = all_md_files
 
+    if max_workers is None:
+        max_workers = STAGE1_WORKERS
+    model = "gemini-2.5-pro" if use_pro else "gemini-2.5-flash"
+    rpm = int(os.getenv("SEOULLOG_STAGE1_RPM", STAGE1_RPM[model]))
+
     print("=" * 100)
     print("📂 result 폴더 JSON 변환 (하이브리드 방식 + 병렬 처리)")
     print("=" * 100)
     print(f"처리할 파일 수: {len(md_files)}개")
     print(f"방식: 1단계 Gemini Flash (개선된 프롬프트) + 2단계 순수 코드")
-    print(f"병렬 처리: 10개 파일씩 동시 처리")
+    print(f"병렬 처리: {max_workers}개 파일씩 동시 처리 (요청 한도: 분당 {rpm * STAGE1_RPM_HEADROOM:.0f}회)")
     print(f"개선 사항: 의사일정 안건만 추출, 분할 방지, 정확한 line_start")
     print()
 
@@ -197,26 +253,27 @@ def process_all_txt_files(n_files: int = None, use_pro: bool = False):
     fail_count = 0
     failed_files = []
     cost_tracker = CostTracker()
-
-    # ThreadPoolExecutor로 10개씩 병렬 처리
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {
-            executor.submit(process_single_file, md_file, api_key, len(md_files), idx, use_pro): (idx, md_file)
-            for idx, md_file in enumerate(md_files, 1)
-        }
-
-        # 완료되는 대로 결과 수집
-        for future in as_completed(futures):
-            idx, md_file = futures[future]
-            try:
-                result = future.result()
-            except Exception as e:
-                print(f"⚠️  예상치 못한 오류 발생: {md_file.parent.name}")
-                print(f"   오류: {e}")
-                import traceback
-                print("   상세 traceback:")
-                traceback.print_exc()
-                print()
+    rate_limiter = IntervalRateLimiter.per_minute(rpm * STAGE1_RPM_HEADROOM)
+
+    # 공유 ThreadPoolExecutor로 max_workers개씩 병렬 처리
+    executor = _get_executor(max_workers)
+    futures = {
+        executor.submit(process_single_file, md_file, api_key, len(md_files), idx, use_pro): (idx, md_file)
+        for idx, md_file in enumerate(md_files, 1)
+    }
+
+    # 완료되는 대로 결과 수집
+    for future in as_completed(futures):
+        idx, md_file = futures[future]
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"⚠️  예상치 못한 오류 발생: {md_file.parent.name}")
+            print(f"   오류: {e}")
+            import traceback
+            print("   상세 traceback:")
+            traceback.print_exc()
+            print()
 
     # 최종 결과
     print("=" * 100)
@@ -248,31 +305,50 @@ def main():
     # 커맨드 라인 인자 파싱
     n_files = None
     use_pro = False
+    max_workers = None
+    usage = [
+        "  python process_all_result_folders.py              # 전체 파일 처리 (Flash)",
+        "  python process_all_result_folders.py 10           # 랜덤 10개만 처리 (Flash)",
+        "  python process_all_result_folders.py 3 pro        # 랜덤 3개 Pro로 처리",
+        "  python process_all_result_folders.py --workers 20 # 20개 파일씩 동시 처리",
+    ]
+
+    args = sys.argv[1:]
+
+    # --workers N (위치 인자보다 먼저 분리)
+    if '--workers' in args:
+        i = args.index('--workers')
+        try:
+            max_workers = int(args[i + 1])
+            if max_workers <= 0:
+                raise ValueError
+        except (IndexError, ValueError):
+            print("❌ --workers 뒤에는 1 이상의 숫자를 입력해주세요.")
+            print("\n사용법:")
+            print("\n".join(usage))
+            return
+        del args[i:i + 2]
 
-    if len(sys.argv) > 1:
+    if len(args) > 0:
         try:
-            n_files = int(sys.argv[1])
+            n_files = int(args[0])
             if n_files <= 0:
                 print("❌ 파일 개수는 1 이상이어야 합니다.")
                 print("\n사용법:")
-                print("  python process_all_result_folders.py           # 전체 파일 처리 (Flash)")
-                print("  python process_all_result_folders.py 10        # 랜덤 10개만 처리 (Flash)")
-                print("  python process_all_result_folders.py 3 pro     # 랜덤 3개 Pro로 처리")
+                print("\n".join(usage))
                 return
         except ValueError:
-            print(f"❌ 잘못된 인자: '{sys.argv[1]}'")
+            print(f"❌ 잘못된 인자: '{args[0]}'")
             print("   숫자를 입력해주세요.")
             print("\n사용법:")
-            print("  python process_all_result_folders.py           # 전체 파일 처리 (Flash)")
-            print("  python process_all_result_folders.py 10        # 랜덤 10개만 처리 (Flash)")
-            print("  python process_all_result_folders.py 3 pro     # 랜덤 3개 Pro로 처리")
+            print("\n".join(usage))
             return
 
     # 두 번째 인자로 "pro" 체크
-    if len(sys.argv) > 2 and sys.argv[2].lower() == 'pro':
+    if len(args) > 1 and args[1].lower() == 'pro':
         use_pro = True
 
-    process_all_txt_files(n_files=n_files, use_pro=use_pro)
+    process_all_txt_files(n_files=n_files, use_pro=use_pro, max_workers=max_workers)
 
 
 if __name__ == "__main__":
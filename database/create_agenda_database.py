@@ -7,13 +7,21 @@ ChromaDB는 벡터 검색용, SQLite는 메타데이터 및 전체 텍스트 저
 AI 요약 생성은 별도의 스크립트(generate_ai_summaries.py)로 분리되었습니다.
 """
 
-import json
 import sqlite3
+import orjson
 from pathlib import Path
-from collections import Counter
+from collections import Counter, defaultdict
 from datetime import datetime
 
 
+# 조회용 인덱스 (대량 삽입 중에는 없애고 삽입이 끝난 뒤 생성)
+AGENDA_INDEXES = {
+    'idx_chunks_agenda': 'agenda_chunks(agenda_id)',
+    'idx_agenda_date': 'agendas(meeting_date)',
+    'idx_agenda_type': 'agendas(agenda_type)',
+}
+
+
 
 def create_database():
     """SQLite 데이터베이스 및 테이블 생성"""
@@ -75,27 +83,29 @@ def group_chunks_by_agenda(chunks, agenda_mapping=None):
         agenda_mapping: 안건 매핑 (첨부 문서 정보 포함)
 
     Returns:
-        agenda_groups: 안건별 그룹 (attachments 포함)
+        agenda_groups: 안건별 그룹 (attachments, 발언자별 발언 횟수 speaker_counts 포함)
     """
 
-    agenda_groups = {}
+    agenda_groups = defaultdict(lambda: {
+        'texts': [],
+        'speakers': [],
+        'speaker_counts': Counter(),
+        'chunk_indices': [],
+        'attachments': [],
+        'status': '접수',  # 기본값
+        'agenda_type': 'other'  # 기본값
+    })
 
     for idx, chunk in enumerate(chunks):
-        agenda = chunk.get('agenda') or "기타발언"
-
-        if agenda not in agenda_groups:
-            agenda_groups[agenda] = {
-                'texts': [],
-                'speakers': [],
-                'chunk_indices': [],
-                'attachments': [],
-                'status': '접수',  # 기본값
-                'agenda_type': 'other'  # 기본값
-            }
-
-        agenda_groups[agenda]['texts'].append(chunk['text'])
-        agenda_groups[agenda]['speakers'].append(chunk.get('speaker', '발언자 없음'))
-        agenda_groups[agenda]['chunk_indices'].append(idx)
+        group = agenda_groups[chunk.get('agenda') or "기타발언"]
+        speaker = chunk.get('speaker', '발언자 없음')
+
+        group['texts'].append(chunk['text'])
+        group['speakers'].append(speaker)
+        group['speaker_counts'][speaker] += 1
+        group['chunk_indices'].append(idx)
+
+    agenda_groups = dict(agenda_groups)
 
     # agenda_mapping에서 attachments, status, agenda_type 매칭
     if agenda_mapping:
@@ -114,14 +124,27 @@ def group_chunks_by_agenda(chunks, agenda_mapping=None):
 
 
 def insert_agendas_to_db(conn):
-    """JSON 파일에서 안건 정보를 추출하여 DB에 삽입"""
+    """JSON 파일에서 안건 정보를 추출하여 DB에 삽입
+
+    전체 삽입을 하나의 트랜잭션으로 묶고 파일별로 executemany를 사용해
+    행마다 반복되던 문장 실행/커밋(fsync) 비용을 줄입니다.
+    중간에 실패하면 rollback되어 기존 데이터가 그대로 남습니다.
+    """
 
     cursor = conn.cursor()
 
-    # 기존 데이터 삭제 (재실행 시)
+    # 대량 삽입용 설정 (커밋 시 fsync 완화, 임시 테이블/정렬은 메모리, 페이지 캐시 64MB)
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-64000')
+
+    # 재실행 시 남아 있는 인덱스는 삽입 후 다시 만들도록 제거 (행마다 인덱스 갱신 방지)
+    for index_name in AGENDA_INDEXES:
+        cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+    # 기존 데이터 삭제 (재실행 시) - 아래 삽입과 같은 트랜잭션
     cursor.execute('DELETE FROM agendas')
     cursor.execute('DELETE FROM agenda_chunks')
-    conn.commit()
 
     result_txt_dir = Path("data/result_txt")
     json_files = list(result_txt_dir.glob("*.json"))
@@ -133,8 +156,7 @@ def insert_agendas_to_db(conn):
     for json_file in json_files:
         print(f"\n📄 처리 중: {json_file.name}")
 
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = orjson.loads(json_file.read_bytes())
 
         meeting_info = data.get('meeting_info', {})
         chunks = data.get('chunks', [])
@@ -146,6 +168,10 @@ def insert_agendas_to_db(conn):
 
         print(f"   안건 수: {len(agenda_groups)}개")
 
+        # 파일 단위로 모아서 executemany로 삽입
+        agenda_rows = []
+        chunk_rows = []
+
         # 각 안건을 DB에 삽입
         for agenda_index, (agenda, agenda_data) in enumerate(agenda_groups.items()):
             # 안건 ID 생성
@@ -155,13 +181,10 @@ def insert_agendas_to_db(conn):
             combined_text = "\n\n".join(agenda_data['texts'])
 
             # 발언자 목록 (중복 제거, 순서 유지)
-            unique_speakers = []
-            for speaker in agenda_data['speakers']:
-                if speaker not in unique_speakers:
-                    unique_speakers.append(speaker)
+            unique_speakers = list(dict.fromkeys(agenda_data['speakers']))
 
-            # 주 발언자 (가장 많이 발언한 사람)
-            speaker_counts = Counter(agenda_data['speakers'])
+            # 주 발언자 (가장 많이 발언한 사람, 그룹핑 시 집계한 횟수 사용)
+            speaker_counts = agenda_data['speaker_counts']
             main_speaker = speaker_counts.most_common(1)[0][0] if speaker_counts else "발언자 없음"
 
             # chunk_ids 생성
@@ -173,20 +196,14 @@ def insert_agendas_to_db(conn):
             # attachments 추출 (agenda_mapping에서 가져오기)
             attachments_json = None
             if 'attachments' in agenda_data and agenda_data['attachments']:
-                attachments_json = json.dumps(agenda_data['attachments'], ensure_ascii=False)
+                attachments_json = orjson.dumps(agenda_data['attachments']).decode('utf-8')
 
             # status와 agenda_type 추출 (agenda_mapping에서 가져오기)
             status = agenda_data.get('status', '접수')
             agenda_type = agenda_data.get('agenda_type', 'other')
 
             # 안건 테이블에 삽입 (요약 없이 먼저 저장)
-            cursor.execute('''
-                INSERT INTO agendas (
-                    agenda_id, agenda_title, meeting_title, meeting_date, meeting_url,
-                    main_speaker, all_speakers, speaker_count, chunk_count,
-                    chunk_ids, combined_text, attachments, agenda_type, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            agenda_rows.append((
                 agenda_id,
                 agenda,
                 meeting_info.get('title', ''),
@@ -211,11 +228,7 @@ def insert_agendas_to_db(conn):
                 chunk_id = f"{meeting_id}_chunk_{chunk_idx:04d}"
                 chunk = chunks[chunk_idx]
 
-                cursor.execute('''
-                    INSERT INTO agenda_chunks (
-                        chunk_id, agenda_id, chunk_index, speaker, full_text
-                    ) VALUES (?, ?, ?, ?, ?)
-                ''', (
+                chunk_rows.append((
                     chunk_id,
                     agenda_id,
                     chunk_idx,
@@ -225,7 +238,23 @@ def insert_agendas_to_db(conn):
 
             total_agendas += 1
 
-        conn.commit()
+        cursor.executemany('''
+            INSERT INTO agendas (
+                agenda_id, agenda_title, meeting_title, meeting_date, meeting_url,
+                main_speaker, all_speakers, speaker_count, chunk_count,
+                chunk_ids, combined_text, attachments, agenda_type, status
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', agenda_rows)
+        cursor.executemany('''
+            INSERT INTO agenda_chunks (
+                chunk_id, agenda_id, chunk_index, speaker, full_text
+            ) VALUES (?, ?, ?, ?, ?)
+        ''', chunk_rows)
+
+    # 인덱스 생성 후 전체를 한 번에 커밋
+    for index_name, target in AGENDA_INDEXES.items():
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {target}')
+    conn.commit()
 
     print("\n" + "=" * 80)
     print(f"✅ 완료! 총 {total_agendas}개 안건이 저장되었습니다.")
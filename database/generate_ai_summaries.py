@@ -5,19 +5,26 @@ AI 요약 생성 스크립트 (비동기 병렬 처리)
 agendas 테이블의 ai_summary, key_issues를 업데이트합니다.
 
 사용법:
-    python database/generate_ai_summaries.py
+    python database/generate_ai_summaries.py          # Gemini Batch API (기본)
+    python database/generate_ai_summaries.py --live   # 실시간 API (디버깅용)
 
 특징:
-    - 비동기 병렬 처리 (10개 안건 동시 처리)
-    - 속도 약 10배 향상
+    - 기본: Gemini Batch API로 전체 안건을 한 번에 제출 (비용 50%, 요청별 RPM 한도 없음)
+    - 안건마다 요약 + 핵심 의제를 구조화 출력(JSON) 한 번의 호출로 생성
+      (90만 자 이상인 긴 안건만 청크 요약 → 최종 요약/핵심 의제 순서로 처리)
+    - --live: 비동기 병렬 처리 (10개 안건 동시 처리)
 """
 
-import json
+import argparse
+import hashlib
+import orjson
 import sqlite3
 import os
 import asyncio
+import random
 import threading
 import sys
+from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 from google import genai
@@ -27,6 +34,8 @@ from google.genai import types
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.cost_tracker import CostTracker
+from utils.gemini_utils import is_transient_gemini_error, submit_batch_and_wait
+from utils.rate_limiter import AsyncRateLimiter
 
 load_dotenv()
 
@@ -43,11 +52,55 @@ else:
 # SQLite DB 경로
 SQLITE_DB_PATH = "data/sqlite_DB/agendas.db"
 
+# 안건 텍스트가 이보다 짧으면 청크 요약 없이 한 번의 호출로 요약 + 핵심 의제 생성
+# (gemini-2.5-flash 입력 한도 1M 토큰 대비 충분히 작은 문자 수)
+SINGLE_CALL_MAX_CHARS = 900_000
+
+# 한 번의 호출로 받는 요약 + 핵심 의제 응답 스키마
+SUMMARY_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "summary": {"type": "STRING", "maxLength": 200},
+        "key_issues": {"type": "ARRAY", "items": {"type": "STRING"}}
+    },
+    "required": ["summary", "key_issues"]
+}
+
+# Gemini Batch API 설정 (요청/결과 JSONL 보관 위치, 상태 확인 간격)
+BATCH_DIR = Path("data/batch_ai_summaries")
+BATCH_POLL_INTERVAL = 30
+
+# AI 요약 Gemini 응답 캐시 (프롬프트가 같으면 다시 호출하지 않음, 실시간/Batch 공용)
+# 프롬프트를 수정하면 SUMMARY_PROMPT_VERSION을 올려 이전 캐시를 무효화
+SUMMARY_CACHE_DIR = Path("data/ai_summary_cache")
+SUMMARY_PROMPT_VERSION = "ai_summary/v1"
+
+# 실시간(--live) 호출 속도 제한: gemini-2.5-flash Tier 1 한도의 80%까지 사용
+GEMINI_FLASH_RPM = 1000
+GEMINI_FLASH_TPM = 1_000_000
+GEMINI_FLASH_RPD = 10_000
+
+
+def new_rate_limiter():
+    """gemini-2.5-flash 한도용 AsyncRateLimiter 생성"""
+    return AsyncRateLimiter(rpm=GEMINI_FLASH_RPM, tpm=GEMINI_FLASH_TPM, rpd=GEMINI_FLASH_RPD)
+
+
+# generate_ai_summaries_async() 실행마다 새로 생성 (함수를 직접 호출할 때를 위한 기본값)
+rate_limiter = new_rate_limiter()
+
+# 실시간 호출 재시도 (요청 한도 초과/서버 오류만, 지수 백오프 + 지터, 최대 대기 초)
+SUMMARY_MAX_RETRIES = 5
+SUMMARY_RETRY_MAX_DELAY = 30
+
 # 전역 카운터 (스레드 안전)
 lock = threading.Lock()
 completed_count = 0
 failed_count = 0
 
+# 같은 프롬프트로 동시에 진행 중인 호출 (캐시 경로 → asyncio.Future, 응답 하나를 공유)
+_inflight_requests = {}
+
 
 def chunk_text(text, chunk_size=2000):
     """텍스트를 일정 크기로 청킹 (글자 수 기준)"""
@@ -57,71 +110,211 @@ def chunk_text(text, chunk_size=2000):
     return chunks
 
 
-async def summarize_text_chunk_async(text_chunk, agenda_title, chunk_index, cost_tracker=None):
-    """텍스트 청크 하나를 요약 (비동기)"""
-    if not client or not text_chunk.strip():
-        return None
-
-    try:
-        prompt = f"""안건 '{agenda_title}'의 일부 내용입니다:
+def build_chunk_summary_prompt(text_chunk, agenda_title):
+    """청크 요약 프롬프트"""
+    return f"""안건 '{agenda_title}'의 일부 내용입니다:
 
 {text_chunk}
 
 위 내용을 간결하게 요약하세요. 핵심 내용을 중심으로 요약문만 반환하세요."""
 
-        response = await client.aio.models.generate_content(
-            model='gemini-2.5-flash',
-            contents=prompt
-        )
-        summary = response.text.strip()
 
-        # 비용 추적
-        if cost_tracker and hasattr(response, 'usage_metadata'):
-            input_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0)
-            output_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0)
-            cost_tracker.add_gemini_cost(
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                model="gemini-2.5-flash"
-            )
+def build_final_summary_prompt(combined, agenda_title):
+    """최종 요약 프롬프트 (combined: 청크 요약들을 합친 텍스트)"""
+    return f"""안건 '{agenda_title}'에 대한 요약들입니다:
 
-        # 비동기 대기 (다른 작업 가능)
-        await asyncio.sleep(1)
+{combined}
 
-        return summary
-    except Exception as e:
-        print(f"  ⚠️ 청크 요약 실패 (청크 {chunk_index}): {e}")
-        await asyncio.sleep(2)
-        return None
+위 내용을 통합하여 150자 이내로 최종 요약하세요.
+- 안건의 핵심 목적
+- 주요 논의 내용
+- 결론 또는 결과
 
+요약문만 반환하세요."""
 
-async def summarize_agenda_async(chunk_summaries, agenda_title, cost_tracker=None):
-    """청크 요약들을 합쳐서 최종 요약 (비동기)"""
-    if not client or not chunk_summaries:
-        return None
 
-    try:
-        combined = "\n\n".join([s for s in chunk_summaries if s])
+def build_key_issues_prompt(combined, agenda_title):
+    """핵심 의제 추출 프롬프트 (combined: 청크 요약들을 합친 텍스트)"""
+    return f"""안건 '{agenda_title}'에 대한 요약들입니다:
 
-        if not combined.strip():
-            return None
+{combined}
 
-        prompt = f"""안건 '{agenda_title}'에 대한 요약들입니다:
+이 안건의 핵심 의제를 추출하세요.
+- 개수는 안건의 복잡도에 따라 자유롭게 결정하세요 (단, 너무 많으면 안 됩니다)
+- 각 의제는 한 줄로 간결하게 작성하세요
+- JSON 배열 형식으로만 반환하세요
 
-{combined}
+예시: ["의제1", "의제2", "의제3"]"""
 
-위 내용을 통합하여 150자 이내로 최종 요약하세요.
+
+def build_summary_and_issues_prompt(combined_text, agenda_title):
+    """안건 전체 텍스트로 요약 + 핵심 의제를 한 번에 받는 프롬프트 (SUMMARY_RESPONSE_SCHEMA 형식)"""
+    return f"""안건 '{agenda_title}'의 회의 내용입니다:
+
+{combined_text}
+
+위 내용으로 다음 두 가지를 작성하세요.
+
+1. summary: 150자 이내 최종 요약
 - 안건의 핵심 목적
 - 주요 논의 내용
 - 결론 또는 결과
 
-요약문만 반환하세요."""
+2. key_issues: 이 안건의 핵심 의제 목록
+- 개수는 안건의 복잡도에 따라 자유롭게 결정하세요 (단, 너무 많으면 안 됩니다)
+- 각 의제는 한 줄로 간결하게 작성하세요"""
+
+
+def parse_summary_and_issues(text):
+    """요약 + 핵심 의제 JSON 응답을 (ai_summary, key_issues)로 변환"""
+    result = orjson.loads(text)
+    summary = (result.get('summary') or '').strip()
+    key_issues = [issue.strip() for issue in result.get('key_issues') or [] if issue and issue.strip()]
+    return (truncate_summary(summary) if summary else None), (key_issues or None)
+
+
+def combine_chunk_summaries(chunk_summaries):
+    """청크 요약들을 하나의 텍스트로 합침 (내용이 없으면 None)"""
+    combined = "\n\n".join([s for s in chunk_summaries if s])
+    return combined if combined.strip() else None
+
+
+def truncate_summary(summary):
+    """200자 넘으면 자르기 (LLM이 150자로 생성하므로 보통 200자 이하)"""
+    if len(summary) > 200:
+        summary = summary[:200]
+    return summary
+
+
+def parse_key_issues(text):
+    """핵심 의제 응답 텍스트를 의제 리스트로 변환"""
+    # 1. 마크다운 코드블록 제거 (```json ... ``` 또는 ``` ... ```)
+    text = text.strip()
+    if text.startswith('```'):
+        # 첫 번째 줄과 마지막 줄 제거
+        lines = text.split('\n')
+        if lines[0].startswith('```'):
+            lines = lines[1:]  # 첫 줄 제거 (```json 또는 ```)
+        if lines and lines[-1].strip() == '```':
+            lines = lines[:-1]  # 마지막 줄 제거 (```)
+        text = '\n'.join(lines).strip()
+
+    # 2. JSON 파싱 시도
+    if text.startswith('[') and text.endswith(']'):
+        try:
+            issues = orjson.loads(text)
+            # 각 의제에서 따옴표, 쉼표 등 정제 (개수 제한 제거)
+            cleaned_issues = []
+            for issue in issues:
+                # 양쪽 공백, 따옴표, 쉼표, 대괄호 제거
+                cleaned = issue.strip().strip('"').strip("'").strip(',').strip()
+                if cleaned:
+                    cleaned_issues.append(cleaned)
+            return cleaned_issues
+        except:
+            pass
+
+    # 3. JSON 파싱 실패 시 수동 파싱 (개수 제한 제거)
+    lines = []
+    for line in text.split('\n'):
+        if line.strip():
+            # 양쪽 공백, 하이픈, 따옴표, 쉼표, 대괄호 제거
+            cleaned = line.strip().strip('- ').strip('"').strip("'").strip(',').strip('[').strip(']').strip()
+            if cleaned:
+                lines.append(cleaned)
+    return lines
+
+
+def _summary_cache_path(prompt, response_schema=None):
+    """응답 캐시 파일 경로 (모델 + 프롬프트 버전 + 응답 스키마 + 프롬프트 전체의 해시)"""
+    hasher = hashlib.blake2b(digest_size=32)
+    hasher.update(orjson.dumps(['gemini-2.5-flash', SUMMARY_PROMPT_VERSION, response_schema]))
+    hasher.update(b'\0')
+    hasher.update(prompt.encode('utf-8'))
+    return SUMMARY_CACHE_DIR / f"{hasher.hexdigest()}.txt"
+
+
+def _read_summary_cache(cache_path):
+    """캐시된 응답 텍스트 (없으면 None)"""
+    try:
+        return cache_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
 
-        response = await client.aio.models.generate_content(
-            model='gemini-2.5-flash',
-            contents=prompt
-        )
-        summary = response.text.strip()
+
+def _write_summary_cache(cache_path, text):
+    """응답 텍스트를 캐시에 저장 (임시 파일에 쓴 뒤 교체)"""
+    SUMMARY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.{id(text)}.tmp")
+    tmp_path.write_text(text, encoding='utf-8')
+    tmp_path.replace(cache_path)
+
+
+def _is_cacheable(text, response_schema=None):
+    """빈 응답, 스키마를 요청했는데 JSON이 아닌 응답은 캐시하지 않음 (다음 실행에서 다시 호출)"""
+    if not text or not text.strip():
+        return False
+    if response_schema:
+        try:
+            orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return False
+    return True
+
+
+async def generate_content_cached_async(prompt, cost_tracker=None, response_schema=None, parse=str.strip):
+    """gemini-2.5-flash 호출 (응답 캐시 + 동시 중복 호출 합치기 + 속도 제한 + 재시도)
+
+    같은 프롬프트의 응답이 캐시에 있으면 API를 호출하지 않고, 같은 프롬프트가 동시에
+    요청되면 먼저 시작한 호출의 응답을 함께 사용합니다.
+    429/5xx는 최대 SUMMARY_MAX_RETRIES회까지 재시도하고, 그 밖의 오류는 바로 예외를 전달합니다.
+
+    Args:
+        prompt: 프롬프트
+        cost_tracker: 비용 추적 객체 (실제로 호출한 경우만 기록)
+        response_schema: 구조화 출력 스키마 (None이면 일반 텍스트)
+        parse: 응답 텍스트 후처리 함수 (실패하면 캐시하지 않고 예외 전달)
+
+    Returns:
+        parse(응답 텍스트)
+    """
+    cache_path = _summary_cache_path(prompt, response_schema)
+
+    cached = await asyncio.to_thread(_read_summary_cache, cache_path)
+    if cached is not None:
+        return parse(cached)
+
+    pending = _inflight_requests.get(cache_path)
+    if pending is not None:
+        return parse(await asyncio.shield(pending))
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight_requests[cache_path] = future
+    try:
+        config = None
+        if response_schema:
+            config = types.GenerateContentConfig(
+                response_mime_type='application/json',
+                response_schema=response_schema
+            )
+
+        for attempt in range(1, SUMMARY_MAX_RETRIES + 1):
+            try:
+                async with rate_limiter.acquire(
+                    estimated_tokens=AsyncRateLimiter.estimate_tokens(prompt), retry=attempt > 1
+                ):
+                    response = await client.aio.models.generate_content(
+                        model='gemini-2.5-flash',
+                        contents=prompt,
+                        config=config
+                    )
+                break
+            except Exception as e:
+                if not is_transient_gemini_error(e) or attempt >= SUMMARY_MAX_RETRIES:
+                    raise
+                delay = min(SUMMARY_RETRY_MAX_DELAY, 2 ** attempt + random.random())
+                print(f"  ⏳ 일시적 오류 (시도 {attempt}/{SUMMARY_MAX_RETRIES}), {delay:.1f}초 후 재시도: {e}")
+                await asyncio.sleep(delay)
 
         # 비용 추적
         if cost_tracker and hasattr(response, 'usage_metadata'):
@@ -133,97 +326,89 @@ async def summarize_agenda_async(chunk_summaries, agenda_title, cost_tracker=Non
                 model="gemini-2.5-flash"
             )
 
-        await asyncio.sleep(1)
+        text = response.text
+        result = parse(text)
+        if _is_cacheable(text, response_schema):
+            await asyncio.to_thread(_write_summary_cache, cache_path, text)
 
-        # 200자 넘으면 자르기 (LLM이 150자로 생성하므로 보통 200자 이하)
-        if len(summary) > 200:
-            summary = summary[:200]
+        future.set_result(text)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # 기다리는 호출이 없어도 경고가 나지 않도록 예외를 확인 처리
+        raise
+    finally:
+        _inflight_requests.pop(cache_path, None)
 
-        return summary
-    except Exception as e:
-        print(f"  ⚠️ 최종 요약 실패: {e}")
-        await asyncio.sleep(2)
+
+async def summarize_text_chunk_async(text_chunk, agenda_title, chunk_index, cost_tracker=None):
+    """텍스트 청크 하나를 요약 (비동기, 재시도 후에도 실패하면 예외 발생)"""
+    if not client or not text_chunk.strip():
         return None
 
+    try:
+        prompt = build_chunk_summary_prompt(text_chunk, agenda_title)
 
-async def extract_key_issues_async(chunk_summaries, agenda_title, cost_tracker=None):
-    """핵심 의제 추출 (비동기)"""
+        return await generate_content_cached_async(prompt, cost_tracker)
+    except Exception as e:
+        print(f"  ⚠️ 청크 요약 실패 (청크 {chunk_index}): {e}")
+        raise
+
+
+async def summarize_agenda_async(chunk_summaries, agenda_title, cost_tracker=None):
+    """청크 요약들을 합쳐서 최종 요약 (비동기, 재시도 후에도 실패하면 예외 발생)"""
     if not client or not chunk_summaries:
         return None
 
     try:
-        combined = "\n\n".join([s for s in chunk_summaries if s])
+        combined = combine_chunk_summaries(chunk_summaries)
 
-        if not combined.strip():
+        if not combined:
             return None
 
-        prompt = f"""안건 '{agenda_title}'에 대한 요약들입니다:
+        prompt = build_final_summary_prompt(combined, agenda_title)
 
-{combined}
+        return await generate_content_cached_async(
+            prompt, cost_tracker, parse=lambda text: truncate_summary(text.strip())
+        )
+    except Exception as e:
+        print(f"  ⚠️ 최종 요약 실패: {e}")
+        raise
 
-이 안건의 핵심 의제를 추출하세요.
-- 개수는 안건의 복잡도에 따라 자유롭게 결정하세요 (단, 너무 많으면 안 됩니다)
-- 각 의제는 한 줄로 간결하게 작성하세요
-- JSON 배열 형식으로만 반환하세요
 
-예시: ["의제1", "의제2", "의제3"]"""
+async def extract_key_issues_async(chunk_summaries, agenda_title, cost_tracker=None):
+    """핵심 의제 추출 (비동기, 재시도 후에도 실패하면 예외 발생)"""
+    if not client or not chunk_summaries:
+        return None
 
-        response = await client.aio.models.generate_content(
-            model='gemini-2.5-flash',
-            contents=prompt
-        )
-        text = response.text.strip()
+    try:
+        combined = combine_chunk_summaries(chunk_summaries)
 
-        # 비용 추적
-        if cost_tracker and hasattr(response, 'usage_metadata'):
-            input_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0)
-            output_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0)
-            cost_tracker.add_gemini_cost(
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                model="gemini-2.5-flash"
-            )
+        if not combined:
+            return None
 
-        await asyncio.sleep(1)
-
-        # 1. 마크다운 코드블록 제거 (```json ... ``` 또는 ``` ... ```)
-        text = text.strip()
-        if text.startswith('```'):
-            # 첫 번째 줄과 마지막 줄 제거
-            lines = text.split('\n')
-            if lines[0].startswith('```'):
-                lines = lines[1:]  # 첫 줄 제거 (```json 또는 ```)
-            if lines and lines[-1].strip() == '```':
-                lines = lines[:-1]  # 마지막 줄 제거 (```)
-            text = '\n'.join(lines).strip()
-
-        # 2. JSON 파싱 시도
-        if text.startswith('[') and text.endswith(']'):
-            try:
-                issues = json.loads(text)
-                # 각 의제에서 따옴표, 쉼표 등 정제 (개수 제한 제거)
-                cleaned_issues = []
-                for issue in issues:
-                    # 양쪽 공백, 따옴표, 쉼표, 대괄호 제거
-                    cleaned = issue.strip().strip('"').strip("'").strip(',').strip()
-                    if cleaned:
-                        cleaned_issues.append(cleaned)
-                return cleaned_issues
-            except:
-                pass
-
-        # 3. JSON 파싱 실패 시 수동 파싱 (개수 제한 제거)
-        lines = []
-        for line in text.split('\n'):
-            if line.strip():
-                # 양쪽 공백, 하이픈, 따옴표, 쉼표, 대괄호 제거
-                cleaned = line.strip().strip('- ').strip('"').strip("'").strip(',').strip('[').strip(']').strip()
-                if cleaned:
-                    lines.append(cleaned)
-        return lines
+        prompt = build_key_issues_prompt(combined, agenda_title)
+
+        return await generate_content_cached_async(prompt, cost_tracker, parse=parse_key_issues)
     except Exception as e:
         print(f"  ⚠️ 핵심 의제 추출 실패: {e}")
-        await asyncio.sleep(2)
+        raise
+
+
+async def summarize_and_extract_issues_async(combined_text, agenda_title, cost_tracker=None):
+    """요약 + 핵심 의제를 한 번의 구조화 출력 호출로 생성 (비동기)
+
+    Returns:
+        (ai_summary, key_issues) 또는 실패 시 None
+    """
+    try:
+        prompt = build_summary_and_issues_prompt(combined_text, agenda_title)
+
+        return await generate_content_cached_async(
+            prompt, cost_tracker, SUMMARY_RESPONSE_SCHEMA, parse=parse_summary_and_issues
+        )
+    except Exception as e:
+        print(f"  ⚠️ 요약 + 핵심 의제 생성 실패 (청크 요약으로 재시도): {e}")
         return None
 
 
@@ -238,6 +423,25 @@ async def process_single_agenda(agenda_id, agenda_title, combined_text, total, i
                 failed_count += 1
             return None
 
+        # 대부분의 안건은 한 번의 호출로 요약 + 핵심 의제 생성 (실패 시 아래 청크 요약 방식)
+        single_call_result = None
+        if len(combined_text) < SINGLE_CALL_MAX_CHARS:
+            single_call_result = await summarize_and_extract_issues_async(combined_text, agenda_title, cost_tracker)
+
+        if single_call_result and single_call_result[0]:
+            ai_summary, key_issues = single_call_result
+
+            with lock:
+                completed_count += 1
+
+            print(f"[{idx}/{total}] ✅ {agenda_title[:50]}...")
+            if ai_summary:
+                print(f"   📝 {ai_summary[:80]}...")
+            if key_issues:
+                print(f"   🔍 {len(key_issues)}개 의제")
+
+            return (agenda_id, ai_summary, key_issues)
+
         # 1단계: 청킹
         text_chunks = chunk_text(combined_text, chunk_size=2000)
 
@@ -285,7 +489,7 @@ async def generate_ai_summaries_async():
     Returns:
         CostTracker: 비용 추적 객체
     """
-    global completed_count, failed_count
+    global completed_count, failed_count, rate_limiter
 
     if not client:
         print("\n⚠️ Gemini API 없음 - AI 요약 건너뜀")
@@ -308,6 +512,7 @@ async def generate_ai_summaries_async():
     completed_count = 0
     failed_count = 0
     cost_tracker = CostTracker()
+    rate_limiter = new_rate_limiter()  # 이번 이벤트 루프 전용
 
     # 10개씩 병렬 처리
     semaphore = asyncio.Semaphore(10)
@@ -322,23 +527,37 @@ async def generate_ai_summaries_async():
     results = await asyncio.gather(*tasks)
 
     # DB 업데이트
-    print("\n💾 DB 업데이트 중...")
-    for result in results:
-        if result:
-            agenda_id, ai_summary, key_issues = result
-            cursor.execute('''
-                UPDATE agendas
-                SET ai_summary = ?, key_issues = ?
-                WHERE agenda_id = ?
-            ''', (
-                ai_summary,
-                json.dumps(key_issues, ensure_ascii=False) if key_issues else None,
-                agenda_id
-            ))
+    save_summaries_to_db(conn, results)
+    conn.close()
+
+    print_final_report(cost_tracker)
+
+    return cost_tracker
 
+
+def save_summaries_to_db(conn, results):
+    """(agenda_id, ai_summary, key_issues) 결과를 agendas 테이블에 반영 (None은 건너뜀)"""
+    print("\n💾 DB 업데이트 중...")
+    rows = [
+        (
+            ai_summary,
+            orjson.dumps(key_issues).decode('utf-8') if key_issues else None,
+            agenda_id
+        )
+        for agenda_id, ai_summary, key_issues in filter(None, results)
+    ]
+
+    # 한 트랜잭션에서 executemany로 일괄 업데이트
+    conn.executemany('''
+        UPDATE agendas
+        SET ai_summary = ?, key_issues = ?
+        WHERE agenda_id = ?
+    ''', rows)
     conn.commit()
-    conn.close()
 
+
+def print_final_report(cost_tracker):
+    """성공/실패 개수와 비용 요약 출력"""
     print("\n" + "=" * 80)
     print("📊 최종 결과")
     print("=" * 80)
@@ -353,15 +572,271 @@ async def generate_ai_summaries_async():
     cost_tracker.print_summary()
     print()
 
+
+def _batch_request(key, prompt, response_schema=None):
+    """Batch API 요청 JSONL 한 줄 ({"key", "request"}), response_schema를 주면 JSON 출력 요청"""
+    request = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+    if response_schema:
+        request["generationConfig"] = {
+            "responseMimeType": "application/json",
+            "responseSchema": response_schema
+        }
+    return {"key": key, "request": request}
+
+
+def run_batch_job(requests, name, cost_tracker=None):
+    """요청들을 JSONL로 업로드해 Gemini Batch job 하나로 실행하고 완료까지 대기
+
+    Args:
+        requests: _batch_request() 목록
+        name: 요청 파일/job 이름 접두어
+        cost_tracker: 비용 추적 객체 (Batch 가격으로 기록)
+
+    Returns:
+        dict: {key: 응답 텍스트} (실패/빈 응답은 제외)
+
+    Note:
+        응답 캐시(SUMMARY_CACHE_DIR)에 있는 요청은 보내지 않고, 같은 프롬프트는 한 번만 보냅니다.
+    """
+    responses = {}
+    same_prompt_keys = {}  # 보낸 요청 key → 같은 프롬프트의 나머지 key 목록
+    cache_targets = {}     # 보낸 요청 key → (캐시 경로, 응답 스키마)
+    first_key_by_path = {}
+    submit_requests = []
+    for request in requests:
+        config = request["request"].get("generationConfig") or {}
+        response_schema = config.get("responseSchema")
+        cache_path = _summary_cache_path(request["request"]["contents"][0]["parts"][0]["text"], response_schema)
+
+        cached = _read_summary_cache(cache_path)
+        if cached is not None:
+            responses[request["key"]] = cached.strip()
+        elif cache_path in first_key_by_path:
+            same_prompt_keys[first_key_by_path[cache_path]].append(request["key"])
+        else:
+            first_key_by_path[cache_path] = request["key"]
+            same_prompt_keys[request["key"]] = []
+            cache_targets[request["key"]] = (cache_path, response_schema)
+            submit_requests.append(request)
+
+    skipped = len(requests) - len(submit_requests)
+    if skipped:
+        print(f"♻️  캐시/중복 프롬프트 {skipped}건은 요청하지 않음")
+    if not submit_requests:
+        return responses
+
+    BATCH_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    requests_path = BATCH_DIR / f"{name}_{timestamp}.jsonl"
+
+    with open(requests_path, 'wb') as f:
+        for request in submit_requests:
+            f.write(orjson.dumps(request))
+            f.write(b'\n')
+
+    print(f"📝 Batch 요청 {len(submit_requests)}건 제출")
+    result_bytes = submit_batch_and_wait(
+        client,
+        requests_path,
+        model='gemini-2.5-flash',
+        display_name=f"seoul-log-{name}-{timestamp}",
+        poll_interval=BATCH_POLL_INTERVAL
+    )
+
+    # 캐시에서 채운 응답에 이어서 batch 결과를 합침
+    received = 0
+    failed = 0
+    for raw_line in result_bytes.splitlines():
+        if not raw_line.strip():
+            continue
+        line = orjson.loads(raw_line)
+        response = line.get('response')
+        try:
+            parts = response['candidates'][0]['content']['parts']
+            text = ''.join(part.get('text', '') for part in parts if not part.get('thought')).strip()
+        except (TypeError, KeyError, IndexError):
+            text = ""
+
+        # 비용 추적 (Batch API는 실시간 대비 50% 가격)
+        if cost_tracker and response and 'usageMetadata' in response:
+            usage = response['usageMetadata']
+            cost_tracker.add_gemini_cost(
+                input_tokens=usage.get('promptTokenCount', 0),
+                output_tokens=usage.get('candidatesTokenCount', 0),
+                model="gemini-2.5-flash-batch"
+            )
+
+        key = line['key']
+        if text:
+            received += 1
+            responses[key] = text
+            for same_key in same_prompt_keys.get(key, []):
+                responses[same_key] = text
+            if key in cache_targets:
+                cache_path, response_schema = cache_targets[key]
+                if _is_cacheable(text, response_schema):
+                    _write_summary_cache(cache_path, text)
+        else:
+            failed += 1
+
+    print(f"🏁 Batch 완료: 응답 {received}건, 실패 {failed}건 (캐시/중복 포함 총 {len(responses)}건)")
+    return responses
+
+
+def _chunk_summary_requests(agenda_id, agenda_title, combined_text):
+    """안건 텍스트의 청크 요약 batch 요청 목록과 (청크 순서대로의) key 목록"""
+    keys = []
+    requests = []
+    for i, text_chunk in enumerate(chunk_text(combined_text, chunk_size=2000), 1):
+        if not text_chunk.strip():
+            continue
+        key = f"{agenda_id}:chunk:{i}"
+        keys.append(key)
+        requests.append(_batch_request(key, build_chunk_summary_prompt(text_chunk, agenda_title)))
+    return keys, requests
+
+
+def generate_ai_summaries_batch():
+    """Gemini Batch API로 AI 요약 생성
+
+    실시간 경로와 같은 프롬프트/후처리를 사용하며, 단계별로 batch job을 한 번씩 실행합니다.
+    1) 대부분의 안건은 요약 + 핵심 의제를 한 요청으로, SINGLE_CALL_MAX_CHARS 이상인 안건은 청크 요약
+       (한 요청 결과가 비었거나 파싱에 실패한 안건은 청크 요약 batch를 한 번 더 실행)
+    2) 청크 요약 안건만: 청크 요약을 합친 최종 요약 + 핵심 의제
+
+    Returns:
+        CostTracker: 비용 추적 객체
+    """
+    global completed_count, failed_count
+
+    if not client:
+        print("\n⚠️ Gemini API 없음 - AI 요약 건너뜀")
+        return None
+
+    # DB 연결
+    conn = sqlite3.connect(SQLITE_DB_PATH)
+    cursor = conn.cursor()
+
+    # 모든 안건 조회
+    cursor.execute('SELECT agenda_id, agenda_title, combined_text FROM agendas')
+    agendas = cursor.fetchall()
+
+    print("\n" + "=" * 80)
+    print(f"🤖 AI 요약 생성 (Gemini Batch API)")
+    print("=" * 80)
+    print(f"총 안건 수: {len(agendas)}개\n")
+
+    # 초기화
+    completed_count = 0
+    failed_count = 0
+    cost_tracker = CostTracker()
+
+    # 1단계: 요약 + 핵심 의제 한 번에 (대부분의 안건) / 긴 안건은 청크 요약 batch
+    chunk_requests = []
+    chunk_keys = {}  # agenda_id → 청크 순서대로의 key 목록
+    single_call_ids = []
+    agenda_titles = {}
+    agenda_texts = {}
+    for agenda_id, agenda_title, combined_text in agendas:
+        if not combined_text or not combined_text.strip():
+            print(f"⚠️ {agenda_title[:50]}... - 텍스트 없음")
+            failed_count += 1
+            continue
+
+        agenda_titles[agenda_id] = agenda_title
+        agenda_texts[agenda_id] = combined_text
+
+        if len(combined_text) < SINGLE_CALL_MAX_CHARS:
+            single_call_ids.append(agenda_id)
+            chunk_requests.append(_batch_request(
+                f"{agenda_id}:combined",
+                build_summary_and_issues_prompt(combined_text, agenda_title),
+                SUMMARY_RESPONSE_SCHEMA
+            ))
+            continue
+
+        chunk_keys[agenda_id], requests = _chunk_summary_requests(agenda_id, agenda_title, combined_text)
+        chunk_requests.extend(requests)
+
+    print(f"\n📦 1단계: 요약 + 핵심 의제 {len(single_call_ids)}건, 긴 안건 청크 요약 {len(chunk_requests) - len(single_call_ids)}건")
+    chunk_responses = run_batch_job(chunk_requests, "chunk_summaries", cost_tracker) if chunk_requests else {}
+
+    results = []
+    fallback_requests = []
+    for agenda_id in single_call_ids:
+        try:
+            ai_summary, key_issues = parse_summary_and_issues(chunk_responses[f"{agenda_id}:combined"])
+        except (KeyError, ValueError, AttributeError) as e:
+            ai_summary, key_issues = None, None
+            error = e
+        else:
+            error = "요약 없음"
+
+        if ai_summary:
+            results.append((agenda_id, ai_summary, key_issues))
+            completed_count += 1
+            continue
+
+        # 실시간 경로와 같이 청크 요약 방식으로 재시도
+        print(f"⚠️ {agenda_titles[agenda_id][:50]}... - 요약 + 핵심 의제 생성 실패 (청크 요약으로 재시도): {error}")
+        chunk_keys[agenda_id], requests = _chunk_summary_requests(
+            agenda_id, agenda_titles[agenda_id], agenda_texts[agenda_id]
+        )
+        fallback_requests.extend(requests)
+
+    if fallback_requests:
+        print(f"\n📦 1단계 재시도: 청크 요약 {len(fallback_requests)}건")
+        chunk_responses.update(run_batch_job(fallback_requests, "fallback_chunk_summaries", cost_tracker))
+
+    # 2단계: 최종 요약 + 핵심 의제 batch
+    final_requests = []
+    for agenda_id, keys in chunk_keys.items():
+        combined = combine_chunk_summaries([chunk_responses.get(key) for key in keys])
+        if not combined:
+            print(f"❌ {agenda_titles[agenda_id][:50]}... - 청크 요약 실패")
+            failed_count += 1
+            continue
+
+        agenda_title = agenda_titles[agenda_id]
+        final_requests.append(_batch_request(f"{agenda_id}:summary", build_final_summary_prompt(combined, agenda_title)))
+        final_requests.append(_batch_request(f"{agenda_id}:issues", build_key_issues_prompt(combined, agenda_title)))
+
+    print(f"\n📦 2단계: 최종 요약 + 핵심 의제 {len(final_requests)}건")
+    final_responses = run_batch_job(final_requests, "final_summaries", cost_tracker) if final_requests else {}
+
+    for request in final_requests[::2]:
+        agenda_id = request["key"].rsplit(':', 1)[0]
+        ai_summary = final_responses.get(f"{agenda_id}:summary")
+        issues_text = final_responses.get(f"{agenda_id}:issues")
+
+        results.append((
+            agenda_id,
+            truncate_summary(ai_summary) if ai_summary else None,
+            parse_key_issues(issues_text) if issues_text else None
+        ))
+        completed_count += 1
+
+    # DB 업데이트
+    save_summaries_to_db(conn, results)
+    conn.close()
+
+    print_final_report(cost_tracker)
+
     return cost_tracker
 
 
-def generate_ai_summaries():
+def generate_ai_summaries(live=False):
     """동기 래퍼 함수
 
+    Args:
+        live: True면 실시간 API(비동기 병렬), False면 Gemini Batch API 사용
+
     Returns:
         CostTracker: 비용 추적 객체
     """
+    if not live:
+        return generate_ai_summaries_batch()
+
     # Windows에서 nested asyncio.run() 지원
     import sys
     if sys.platform == 'win32':
@@ -371,12 +846,16 @@ def generate_ai_summaries():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AI 요약 생성")
+    parser.add_argument("--live", action="store_true", help="Batch API 대신 실시간 API 사용 (디버깅용)")
+    args = parser.parse_args()
+
     print("=" * 80)
     print("AI 요약 생성 스크립트")
     print("=" * 80)
     print()
 
     # AI 요약 생성
-    generate_ai_summaries()
+    generate_ai_summaries(live=args.live)
 
     print("\n✅ 모든 작업 완료!")
@@ -6,8 +6,10 @@ Repository 계층 - 데이터 접근 계층
 
 from .agenda_repository import AgendaRepository
 from .chroma_repository import ChromaRepository
+from .chroma_query_batcher import ChromaQueryBatcher
 
 __all__ = [
     "AgendaRepository",
-    "ChromaRepository"
+    "ChromaRepository",
+    "ChromaQueryBatcher"
 ]
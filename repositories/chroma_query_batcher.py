@@ -0,0 +1,133 @@
+"""
+ChromaDB 쿼리 배처 - 동시 검색 요청 묶음 처리
+
+책임:
+- 짧은 시간(기본 10ms) 안에 들어온 검색 요청을 모아 한 번에 ChromaDB 조회
+- 같은 (n_results, where_filter) 조합끼리만 묶음
+- 각 호출자에게 자신의 결과만 돌려줌
+"""
+
+import asyncio
+import json
+from typing import Dict, List, Optional, Tuple
+from repositories.chroma_repository import ChromaRepository
+
+
+class ChromaQueryBatcher:
+    """
+    동시 검색 요청을 모아 ChromaRepository.batch_search()로 한 번에 처리
+
+    ChromaDB query()는 여러 query_texts를 받을 수 있으므로,
+    묶어서 호출하면 임베딩 API 호출과 HNSW 탐색 비용이 분산됩니다.
+    """
+
+    def __init__(
+        self,
+        chroma_repo: ChromaRepository,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0
+    ):
+        """
+        초기화
+
+        Args:
+            chroma_repo: ChromaDB Repository
+            max_batch_size: 한 번에 묶을 최대 요청 수
+            max_wait_ms: 첫 요청 이후 추가 요청을 기다리는 최대 시간 (밀리초)
+        """
+        self.chroma_repo = chroma_repo
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # 실행 중인 조회 태스크 (GC로 사라지지 않도록 참조 유지)
+        self._dispatch_tasks: set = set()
+
+    async def search(
+        self,
+        query: str,
+        n_results: int = 20,
+        where_filter: Optional[Dict] = None
+    ) -> Dict:
+        """
+        벡터 검색 (배치에 합류하여 실행)
+
+        Args:
+            query: 검색 쿼리
+            n_results: 결과 개수
+            where_filter: 메타데이터 필터
+
+        Returns:
+            ChromaRepository.search()와 동일한 구조의 검색 결과
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, n_results, where_filter, future))
+        return await future
+
+    async def close(self):
+        """백그라운드 배치 태스크 종료"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self):
+        """요청을 모아 그룹별로 ChromaDB 조회를 실행하는 백그라운드 루프"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # 같은 n_results / where_filter 끼리만 한 번에 조회 가능
+            groups: Dict[Tuple[int, str], List[Tuple]] = {}
+            for item in batch:
+                _, n_results, where_filter, _ = item
+                key = (n_results, json.dumps(where_filter, sort_keys=True, ensure_ascii=False))
+                groups.setdefault(key, []).append(item)
+
+            for items in groups.values():
+                task = asyncio.create_task(self._dispatch(items))
+                self._dispatch_tasks.add(task)
+                task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(self, items: List[Tuple]):
+        """
+        한 그룹의 요청을 스레드풀에서 batch_search로 실행하고 결과 분배
+
+        Args:
+            items: (query, n_results, where_filter, future) 리스트
+        """
+        queries = [query for query, _, _, _ in items]
+        _, n_results, where_filter, _ = items[0]
+
+        try:
+            results = await asyncio.to_thread(
+                self.chroma_repo.batch_search, queries, n_results, where_filter
+            )
+        except Exception as e:
+            for _, _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, _, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
@@ -83,6 +83,37 @@ class ChromaRepository:
             where=where_filter if where_filter else None
         )
 
+    def batch_search(
+        self,
+        queries: List[str],
+        n_results: int = 20,
+        where_filter: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        여러 쿼리를 한 번의 ChromaDB 호출로 검색
+
+        임베딩 API 호출과 HNSW 탐색이 쿼리 묶음 단위로 한 번만 수행됩니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+            n_results: 쿼리당 결과 개수
+            where_filter: 메타데이터 필터 (모든 쿼리에 동일하게 적용)
+
+        Returns:
+            쿼리별 검색 결과 리스트 (각 원소는 search()와 동일한 구조)
+        """
+        results = self.collection.query(
+            query_texts=queries,
+            n_results=n_results,
+            where=where_filter if where_filter else None
+        )
+
+        keys = [key for key in ('ids', 'distances', 'metadatas', 'documents') if results.get(key) is not None]
+        return [
+            {key: [results[key][i]] for key in keys}
+            for i in range(len(queries))
+        ]
+
     def get_all_speakers(self) -> List[str]:
         """
         모든 발언자 조회
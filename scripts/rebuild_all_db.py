@@ -208,7 +208,8 @@ def step4_generate_summaries():
     from database.generate_ai_summaries import generate_ai_summaries
 
     try:
-        cost_tracker = generate_ai_summaries()  # 내부에서 asyncio.run() 호출
+        # 실시간 API로 실행 (Batch job은 최대 24시간 대기할 수 있어 파이프라인에는 부적합)
+        cost_tracker = generate_ai_summaries(live=True)  # 내부에서 asyncio.run() 호출
         print("\n✅ Step 4 완료: AI 요약 생성")
         return True, cost_tracker
     except Exception as e:
@@ -10,6 +10,7 @@
 from typing import List, Dict, Optional
 from repositories.agenda_repository import AgendaRepository
 from repositories.chroma_repository import ChromaRepository
+from repositories.chroma_query_batcher import ChromaQueryBatcher
 from search.query_analyzer import QueryAnalyzer
 from search.simple_query_analyzer import SimpleQueryAnalyzer
 from search.metadata_validator import MetadataValidator
@@ -40,7 +41,8 @@ class AgendaSearchService:
         agenda_repo: AgendaRepository,
         analyzer: QueryAnalyzer,
         validator: Optional[MetadataValidator] = None,
-        cost_tracker: Optional[CostTracker] = None
+        cost_tracker: Optional[CostTracker] = None,
+        query_batcher: Optional[ChromaQueryBatcher] = None
     ):
         """
         초기화
@@ -51,12 +53,14 @@ class AgendaSearchService:
             analyzer: 쿼리 분석기 (QueryAnalyzer 또는 SimpleQueryAnalyzer)
             validator: 메타데이터 검증기 (optional)
             cost_tracker: 전역 비용 추적기 (optional)
+            query_batcher: 동시 검색 요청 배처 (optional, 없으면 단건 조회)
         """
         self.chroma_repo = chroma_repo
         self.agenda_repo = agenda_repo
         self.analyzer = analyzer
         self.validator = validator
         self.global_cost_tracker = cost_tracker
+        self.query_batcher = query_batcher
 
     async def search(
         self,
@@ -99,7 +103,7 @@ class AgendaSearchService:
             where_filter = self._build_where_filter(analyzed_metadata)
 
         # Step 3: ChromaDB 청크 검색
-        chunk_results = self._search_chunks(
+        chunk_results = await self._search_chunks(
             query, n_results, where_filter, search_cost_tracker
         )
 
@@ -229,7 +233,7 @@ class AgendaSearchService:
 
         return None
 
-    def _search_chunks(
+    async def _search_chunks(
         self,
         query: str,
         n_results: int,
@@ -255,11 +259,19 @@ class AgendaSearchService:
         )
 
         # ChromaDB 검색 (안건별 그룹핑 고려하여 더 많이 검색)
-        chunk_results = self.chroma_repo.search(
-            query=query,
-            n_results=min(20, n_results * 4),
-            where_filter=where_filter
-        )
+        if self.query_batcher:
+            # 동시에 들어온 다른 검색 요청과 묶어서 조회
+            chunk_results = await self.query_batcher.search(
+                query=query,
+                n_results=min(20, n_results * 4),
+                where_filter=where_filter
+            )
+        else:
+            chunk_results = self.chroma_repo.search(
+                query=query,
+                n_results=min(20, n_results * 4),
+                where_filter=where_filter
+            )
 
         print(f"   청크 검색 결과: {len(chunk_results['ids'][0])}개")
 
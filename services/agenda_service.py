@@ -8,9 +8,10 @@
 - 포맷된 안건 상세 (첨부 문서 포함)
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from repositories.agenda_repository import AgendaRepository
 import json
+import time
 
 
 class AgendaService:
@@ -23,6 +24,9 @@ class AgendaService:
     # agenda_type 필터링: 실제 안건만 표시 (절차/토론/기타 제외)
     EXCLUDED_AGENDA_TYPES = ["procedural", "discussion", "other"]
 
+    # Top 안건 캐시 유지 시간 (초) - DB는 하루 몇 번만 갱신됨
+    TOP_AGENDAS_TTL = 60
+
     def __init__(self, agenda_repo: AgendaRepository):
         """
         초기화
@@ -32,6 +36,9 @@ class AgendaService:
         """
         self.agenda_repo = agenda_repo
 
+        # {limit: (만료 시각, Top 안건 리스트)}
+        self._top_agendas_cache: Dict[int, Tuple[float, List[Dict]]] = {}
+
     async def get_agenda_detail(self, agenda_id: str) -> Dict:
         """
         안건 상세 조회
@@ -155,6 +162,10 @@ class AgendaService:
                 ...
             ]
         """
+        cached = self._top_agendas_cache.get(limit)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
         agendas = self.agenda_repo.find_top_agendas(
             limit=limit,
             exclude_titles_like=['%개의%', '%산회%'],
@@ -162,7 +173,7 @@ class AgendaService:
         )
 
         # Repository의 agenda_title → Pydantic 모델의 title 필드로 매핑
-        return [
+        top_agendas = [
             {
                 "agenda_id": agenda['agenda_id'],
                 "title": agenda['agenda_title'],  # 필드명 매핑
@@ -176,6 +187,10 @@ class AgendaService:
             for agenda in agendas
         ]
 
+        self._top_agendas_cache[limit] = (time.monotonic() + self.TOP_AGENDAS_TTL, top_agendas)
+
+        return top_agendas
+
     def _parse_json_field(self, json_str: Optional[str]) -> Optional[any]:
         """
         JSON 문자열 파싱
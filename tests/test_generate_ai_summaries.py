@@ -0,0 +1,100 @@
+"""
+generate_ai_summaries Batch API 경로 테스트 (Gemini 호출 없이 가짜 client 사용)
+"""
+
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+
+from database import generate_ai_summaries as gas
+
+
+class FakeBatchClient:
+    """제출된 요청마다 '<key> 응답'을 돌려주는 Batch API 대역"""
+
+    def __init__(self):
+        self.submitted_keys = []
+        self.jobs = []
+        self.files = SimpleNamespace(upload=self._upload, download=self._download)
+        self.batches = SimpleNamespace(create=self._create, get=None)
+
+    def _upload(self, file, config):
+        with open(file, 'rb') as f:
+            self.submitted_keys = [orjson.loads(line)["key"] for line in f if line.strip()]
+        self.jobs.append(self.submitted_keys)
+        return SimpleNamespace(name="files/requests")
+
+    def _create(self, model, src, config):
+        return SimpleNamespace(
+            name="batches/test",
+            state=SimpleNamespace(name="JOB_STATE_SUCCEEDED"),
+            dest=SimpleNamespace(file_name="files/results")
+        )
+
+    def _download(self, file):
+        return b"\n".join(
+            orjson.dumps({
+                "key": key,
+                "response": {"candidates": [{"content": {"parts": [{"text": f"{key} 응답"}]}}]}
+            })
+            for key in self.submitted_keys
+        )
+
+
+def test_run_batch_job_keeps_cache_hits(tmp_path, monkeypatch):
+    monkeypatch.setattr(gas, "SUMMARY_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(gas, "BATCH_DIR", tmp_path / "batch")
+    fake_client = FakeBatchClient()
+    monkeypatch.setattr(gas, "client", fake_client)
+
+    cached_prompt = gas.build_chunk_summary_prompt("캐시된 청크", "안건 A")
+    fresh_prompt = gas.build_chunk_summary_prompt("새 청크", "안건 B")
+    gas._write_summary_cache(gas._summary_cache_path(cached_prompt), "cached")
+
+    responses = gas.run_batch_job(
+        [gas._batch_request("a:chunk:1", cached_prompt), gas._batch_request("b:chunk:1", fresh_prompt)],
+        "test"
+    )
+
+    assert fake_client.submitted_keys == ["b:chunk:1"]
+    assert responses == {"a:chunk:1": "cached", "b:chunk:1": "b:chunk:1 응답"}
+
+
+def test_batch_single_call_failure_falls_back_to_chunk_summaries(tmp_path, monkeypatch):
+    monkeypatch.setattr(gas, "SUMMARY_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(gas, "BATCH_DIR", tmp_path / "batch")
+    db_path = tmp_path / "agendas.db"
+    monkeypatch.setattr(gas, "SQLITE_DB_PATH", str(db_path))
+    fake_client = FakeBatchClient()
+    monkeypatch.setattr(gas, "client", fake_client)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE agendas (agenda_id TEXT PRIMARY KEY, agenda_title TEXT, "
+        "combined_text TEXT, ai_summary TEXT, key_issues TEXT)"
+    )
+    conn.execute("INSERT INTO agendas (agenda_id, agenda_title, combined_text) VALUES ('a', '안건', '발언 내용')")
+    conn.commit()
+
+    # 가짜 응답은 JSON이 아니므로 한 번의 호출 결과는 파싱에 실패함
+    gas.generate_ai_summaries_batch()
+
+    assert fake_client.jobs == [["a:combined"], ["a:chunk:1"], ["a:summary", "a:issues"]]
+    ai_summary, key_issues = conn.execute("SELECT ai_summary, key_issues FROM agendas").fetchone()
+    assert ai_summary == "a:summary 응답"
+    assert orjson.loads(key_issues) == ["a:issues 응답"]
+
+
+def test_transient_error_check_is_shared_with_stage1():
+    from data_processing import extract_metadata_hybrid as emh
+
+    assert gas.is_transient_gemini_error is emh.is_transient_gemini_error
+    assert gas.is_transient_gemini_error(orjson.JSONDecodeError("bad", "{", 0))
+    assert not gas.is_transient_gemini_error(ValueError("bad"))
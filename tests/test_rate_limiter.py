@@ -0,0 +1,56 @@
+"""
+utils.rate_limiter 테스트
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.rate_limiter import AsyncRateLimiter, IntervalRateLimiter
+
+
+def test_estimate_tokens_counts_hangul_per_character():
+    assert AsyncRateLimiter.estimate_tokens("abcdefgh") == 2
+    assert AsyncRateLimiter.estimate_tokens("서울시의회") == 5
+    # ASCII 20자(5토큰) + 한글 20자(20토큰)
+    assert AsyncRateLimiter.estimate_tokens("AI 정책 조례안 " * 4) == 25
+
+
+def test_wait_time_rpm_branch():
+    limiter = AsyncRateLimiter(rpm=2, headroom=1.0)
+    limiter._events.extend([(0.0, 0), (10.0, 0)])
+
+    # 최근 60초에 이미 2건 → 가장 오래된 요청이 윈도우를 벗어날 때까지 대기
+    assert limiter._wait_time(30.0, 0) == 30.0
+    limiter._events.popleft()
+    assert limiter._wait_time(30.0, 0) == 0.0
+
+
+def test_wait_time_tpm_branch():
+    limiter = AsyncRateLimiter(rpm=100, tpm=100, headroom=1.0)
+    for t, tokens in [(0.0, 40), (20.0, 40)]:
+        limiter._events.append((t, tokens))
+        limiter._window_tokens += tokens
+
+    # 80 + 20 ≤ 100 → 바로 가능
+    assert limiter._wait_time(30.0, 20) == 0.0
+    # 80 + 50 > 100 → 첫 요청(40토큰)이 빠지는 60초까지 대기
+    assert limiter._wait_time(30.0, 50) == 30.0
+    # 80 + 90 > 100 → 두 요청이 모두 빠지는 80초까지 대기
+    assert limiter._wait_time(30.0, 90) == 50.0
+
+
+def test_interval_limiter_reserves_slots_per_key(monkeypatch):
+    monkeypatch.setattr("utils.rate_limiter.time.monotonic", lambda: 100.0)
+    limiter = IntervalRateLimiter(0.5)
+
+    # 같은 키는 0.5초씩 밀리고, 다른 키는 독립적으로 바로 가능
+    assert limiter._reserve("a") == 0.0
+    assert limiter._reserve("a") == 0.5
+    assert limiter._reserve("a") == 1.0
+    assert limiter._reserve("b") == 0.0
+
+
+def test_interval_limiter_per_minute():
+    assert IntervalRateLimiter.per_minute(120).min_interval == 0.5
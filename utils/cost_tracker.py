@@ -45,6 +45,11 @@ class CostTracker:
         "gemini-2.5-flash": {
             "input": 0.075 / 1_000_000,   # $0.075 per 1M tokens
             "output": 0.30 / 1_000_000    # $0.30 per 1M tokens
+        },
+        # Gemini Batch API (실시간 대비 50%)
+        "gemini-2.5-flash-batch": {
+            "input": 0.0375 / 1_000_000,
+            "output": 0.15 / 1_000_000
         }
     }
 
@@ -0,0 +1,82 @@
+"""
+Gemini API 공용 유틸리티
+
+1단계 안건 매핑(data_processing)과 AI 요약(database)이 함께 쓰는
+재시도 판단, Batch API job 제출/대기 로직을 모아 둡니다.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+from google.genai import errors as genai_errors
+from google.genai import types
+
+# Gemini Batch API job 종료 상태
+BATCH_TERMINAL_STATES = {
+    'JOB_STATE_SUCCEEDED',
+    'JOB_STATE_FAILED',
+    'JOB_STATE_CANCELLED',
+    'JOB_STATE_EXPIRED',
+}
+
+
+def is_transient_gemini_error(error: Exception) -> bool:
+    """
+    재시도할 가치가 있는 일시적 오류인지 확인
+
+    JSON 파싱 실패, 요청 한도 초과(429), 서버 오류(5xx)만 재시도하고
+    인증/권한 오류 등 나머지 4xx는 재시도해도 같은 결과라 바로 실패 처리합니다.
+    (orjson.JSONDecodeError도 json.JSONDecodeError의 하위 클래스)
+    """
+    if isinstance(error, (json.JSONDecodeError, genai_errors.ServerError)):
+        return True
+    return isinstance(error, genai_errors.ClientError) and getattr(error, 'code', None) == 429
+
+
+def submit_batch_and_wait(
+    client,
+    requests_path: Path,
+    model: str,
+    display_name: str,
+    poll_interval: int,
+    log: Callable[..., None] = print
+) -> bytes:
+    """
+    요청 JSONL 파일을 업로드해 Batch job을 만들고 끝날 때까지 대기한 뒤 결과 파일 반환
+
+    Args:
+        client: genai.Client
+        requests_path: {"key", "request"} 줄로 된 요청 JSONL 파일
+        model: 사용할 모델
+        display_name: batch job 표시 이름
+        poll_interval: job 상태 확인 간격 (초)
+        log: 진행 상황 출력 함수 (기본: print)
+
+    Returns:
+        결과 JSONL 파일 내용 (bytes)
+
+    Raises:
+        RuntimeError: job이 성공 이외의 상태로 끝난 경우
+    """
+    uploaded = client.files.upload(
+        file=str(requests_path),
+        config=types.UploadFileConfig(display_name=requests_path.stem, mime_type='jsonl')
+    )
+    job = client.batches.create(
+        model=model,
+        src=uploaded.name,
+        config={'display_name': display_name}
+    )
+    log(f"🚀 Batch job 생성: {job.name}")
+
+    while job.state.name not in BATCH_TERMINAL_STATES:
+        log(f"⏳ Batch 상태: {job.state.name} ({poll_interval}초 후 재확인)")
+        time.sleep(poll_interval)
+        job = client.batches.get(name=job.name)
+
+    if job.state.name != 'JOB_STATE_SUCCEEDED':
+        raise RuntimeError(f"Batch job 실패: {job.name} ({job.state.name})")
+
+    return client.files.download(file=job.dest.file_name)
@@ -0,0 +1,176 @@
+"""
+API 요청 속도 제한 유틸리티
+
+Gemini 등 외부 API의 분당 요청 수(RPM), 분당 토큰 수(TPM), 일일 요청 수(RPD) 한도나
+크롤링 대상 서버의 요청 간격을 넘지 않도록 호출 전에 필요한 만큼만 대기합니다.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Hashable, Optional
+
+
+class IntervalRateLimiter:
+    """
+    요청 간격 제한기 (슬롯 예약 방식)
+
+    키(호스트 등)마다 다음 요청 가능 시각을 기록하고, 아직 간격이 지나지 않았을 때만 대기합니다.
+    이전 요청이 이미 간격보다 오래 걸렸다면 대기하지 않습니다.
+    스레드/asyncio 양쪽에서 사용할 수 있습니다.
+    """
+
+    def __init__(self, min_interval: float):
+        """
+        초기화
+
+        Args:
+            min_interval: 같은 키에 대한 요청 시작 최소 간격 (초)
+        """
+        self.min_interval = min_interval
+        self._next_allowed = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float) -> 'IntervalRateLimiter':
+        """분당 요청 수로 생성 (요청 시작 간격 = 60초 / 분당 요청 수)"""
+        return cls(60.0 / requests_per_minute)
+
+    def _reserve(self, key: Hashable) -> float:
+        """다음 요청 슬롯을 예약하고 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(key, now))
+            self._next_allowed[key] = slot + self.min_interval
+        return slot - now
+
+    def wait(self, key: Hashable = None):
+        """요청 전 호출 (동기)"""
+        delay = self._reserve(key)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, key: Hashable = None):
+        """요청 전 호출 (비동기)"""
+        delay = self._reserve(key)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AsyncRateLimiter:
+    """
+    비동기 토큰 버킷 (최근 60초 슬라이딩 윈도우)
+
+    호출 전 acquire()로 요청 1건과 예상 토큰 수를 예약하고,
+    최근 60초 안의 요청/토큰 합이 한도를 넘으면 가장 오래된 기록이 빠질 때까지 대기합니다.
+    """
+
+    WINDOW = 60.0
+
+    def __init__(
+        self,
+        rpm: int,
+        tpm: Optional[int] = None,
+        rpd: Optional[int] = None,
+        headroom: float = 0.8
+    ):
+        """
+        초기화
+
+        Args:
+            rpm: 분당 요청 한도
+            tpm: 분당 토큰 한도 (None이면 제한 없음)
+            rpd: 일일 요청 한도 (None이면 제한 없음)
+            headroom: 한도 중 실제로 사용할 비율 (기본 80%)
+        """
+        self.rpm = max(1, int(rpm * headroom))
+        self.tpm = max(1, int(tpm * headroom)) if tpm else None
+        self.rpd = int(rpd * headroom) if rpd else None
+
+        self._events = deque()  # (시각, 예상 토큰 수)
+        self._window_tokens = 0
+        self._day_start = time.monotonic()
+        self._day_count = 0
+        self._lock = None
+        self._lock_loop = None
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """
+        프롬프트 토큰 수 대략 추정 (문자 종류별)
+
+        영문/숫자 등 ASCII는 문자 4개당 1토큰, 한글 등 비ASCII는 문자 1개당 약 1토큰으로 계산합니다.
+        (한글은 1~2자당 1토큰이라 ASCII 기준으로만 세면 2~4배 적게 추정됨)
+        """
+        ascii_chars = len(text.encode('ascii', 'ignore'))
+        return ascii_chars // 4 + (len(text) - ascii_chars)
+
+    def _expire(self, now: float):
+        """윈도우를 벗어난 기록 제거"""
+        while self._events and now - self._events[0][0] >= self.WINDOW:
+            _, tokens = self._events.popleft()
+            self._window_tokens -= tokens
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """지금 요청하면 한도를 넘는 경우 대기해야 할 시간(초), 아니면 0"""
+        over_rpm = len(self._events) >= self.rpm
+        # 윈도우가 비어 있으면 한도보다 큰 요청도 단독으로 허용
+        over_tpm = self.tpm is not None and self._events and self._window_tokens + tokens > self.tpm
+
+        if not (over_rpm or over_tpm):
+            return 0.0
+
+        if over_rpm and not over_tpm:
+            oldest = self._events[len(self._events) - self.rpm][0]
+            return oldest + self.WINDOW - now
+
+        # 토큰 한도: 충분한 토큰이 빠질 때까지
+        freed = 0
+        for t, event_tokens in self._events:
+            freed += event_tokens
+            if self._window_tokens - freed + tokens <= self.tpm:
+                return t + self.WINDOW - now
+        return self._events[-1][0] + self.WINDOW - now
+
+    @asynccontextmanager
+    async def acquire(self, estimated_tokens: int = 0, retry: bool = False):
+        """
+        요청 1건 예약 (한도 초과 시 대기)
+
+        Args:
+            estimated_tokens: 이번 요청의 예상 토큰 수
+            retry: 같은 요청의 재시도 여부 (True면 분당 한도에는 포함하되 일일 요청 수는 세지 않음)
+
+        Raises:
+            RuntimeError: 일일 요청 한도 초과
+        """
+        # asyncio.Lock은 사용하는 이벤트 루프에 묶이므로 루프가 바뀌면(asyncio.run 재호출) 새로 생성
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        async with self._lock:
+            now = time.monotonic()
+            if now - self._day_start >= 86400:
+                self._day_start = now
+                self._day_count = 0
+            if not retry and self.rpd is not None and self._day_count >= self.rpd:
+                raise RuntimeError(f"일일 요청 한도 초과 ({self.rpd}회)")
+
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                delay = self._wait_time(now, estimated_tokens)
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+            self._events.append((now, estimated_tokens))
+            self._window_tokens += estimated_tokens
+            if not retry:
+                self._day_count += 1
+
+        yield
@@ -48,6 +48,9 @@ class MeetingSearcher:
             name=collection_name,
             embedding_function=openai_ef  # 쿼리 시 사용할 임베딩 함수를 명시적으로 지정
         )
+
+        # 컬렉션 외부에서 쿼리 임베딩이 필요한 경우 (예: 메모리 내 벡터 검색) 재사용
+        self.embedding_function = openai_ef
         
         # 컬렉션에 할당된 임베딩 함수를 사용하여 검색 (중요)
         print(f"컬렉션 로드: {collection_name}")